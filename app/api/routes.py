@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from core.feeding_schedule import get_schedule_cache
+
 router = APIRouter()
 
 class ScheduleUpdate(BaseModel):
@@ -9,7 +11,10 @@ class ScheduleUpdate(BaseModel):
 @router.post("/schedule/update")
 async def update_schedule(data: ScheduleUpdate):
     try:
-        # 스케줄 업데이트 로직
+        # 급여 일정 저장 후 캐시 즉시 갱신 (다음 급여 확인부터 반영)
+        get_schedule_cache().save(data.schedule)
         return {"status": "success"}
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 급여 일정: {e}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,111 @@
+# app/core/async_executor.py
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 작업별 사용 장치 (같은 장치를 쓰는 작업은 동시에 실행되지 않음)
+DEFAULT_TASK_DEVICES = {
+    "ultrasonic": ("ultrasonic",),
+    "weight": ("weight_sensor",),
+    "feeding": ("motor", "weight_sensor"),
+    "camera": ("camera",),
+}
+
+# 작업별 타임아웃 (초)
+DEFAULT_TASK_TIMEOUTS = {
+    "ultrasonic": 1.0,
+    "weight": 2.0,
+    "feeding": 60.0,
+    "camera": 10.0,
+}
+
+# 급여 작업 타임아웃 = 급여 컨트롤러 최대 시간 + 여유 (시작/종료 무게 측정 등)
+FEEDING_TIMEOUT_MARGIN = 5.0
+
+
+class AsyncTaskExecutor:
+    """블로킹 하드웨어 작업을 전용 스레드 풀에서 실행하는 비동기 실행기
+
+    TaskExecutor의 동기 작업(time.sleep, 센서 폴링 등)을 이벤트 루프 밖에서 실행해
+    FastAPI/WebSocket 서버가 멈추지 않도록 합니다. 장치별 잠금으로 같은 장치에
+    동시에 접근하지 않으며, 시간 초과된 작업은 결과를 기다리지 않고 오류를 반환합니다.
+    """
+
+    def __init__(self,
+                 task_executor,
+                 max_workers: int = 4,
+                 task_devices: Optional[Dict[str, Iterable[str]]] = None,
+                 task_timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: float = 5.0):
+        """
+        Args:
+            task_executor: 동기 execute_task(task_id)를 제공하는 TaskExecutor
+            max_workers (int): 하드웨어 작업 스레드 수
+            task_devices (Dict): 작업 ID -> 사용 장치 목록
+            task_timeouts (Dict): 작업 ID -> 타임아웃 (초, 지정하지 않은 작업은 기본값)
+            default_timeout (float): 타임아웃이 지정되지 않은 작업의 기본값
+        """
+        self.task_executor = task_executor
+        self.task_devices = {k: tuple(sorted(v)) for k, v in (task_devices or DEFAULT_TASK_DEVICES).items()}
+        self.task_timeouts = dict(DEFAULT_TASK_TIMEOUTS)
+        dispenser = getattr(task_executor, "dispenser", None)
+        if dispenser is not None:
+            # 급여 컨트롤러가 스스로 끝내기 전에 실행기가 먼저 포기하지 않도록 함
+            self.task_timeouts["feeding"] = dispenser.max_duration + FEEDING_TIMEOUT_MARGIN
+        self.task_timeouts.update(task_timeouts or {})
+        self.default_timeout = default_timeout
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hw-task")
+        self._device_locks: Dict[str, threading.Lock] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def _device_lock(self, device: str) -> threading.Lock:
+        if device not in self._device_locks:
+            self._device_locks[device] = threading.Lock()
+        return self._device_locks[device]
+
+    def _run_locked(self, locks, task_id: str, args, kwargs):
+        # 잠금은 작업 스레드에서 잡고 풀기 때문에, 호출자가 시간 초과로 포기해도
+        # 드라이버 실행이 끝날 때까지 장치는 잠긴 상태로 유지됩니다.
+        for lock in locks:
+            lock.acquire()
+        try:
+            return self.task_executor.execute_task(task_id, *args, **kwargs)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    async def execute_task(self, task_id: str, *args, timeout: Optional[float] = None, **kwargs) -> Dict:
+        """작업을 스레드 풀에서 실행하고 결과를 반환
+
+        같은 작업이 아직 실행 중이면 새로 제출하지 않고 busy 상태를 반환합니다.
+        """
+        running = self._in_flight.get(task_id)
+        if running is not None and not running.done():
+            return {"status": "busy", "message": f"Task {task_id} is still running"}
+
+        locks = [self._device_lock(device) for device in self.task_devices.get(task_id, ())]
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._run_locked, locks, task_id, args, kwargs)
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[task_id] = future
+
+        if timeout is None:
+            timeout = self.task_timeouts.get(task_id, self.default_timeout)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"작업 시간 초과: {task_id} ({timeout}s)")
+            return {"status": "error", "message": f"Task {task_id} timed out after {timeout}s"}
+        except Exception as e:
+            logger.error(f"작업 실행 오류: {task_id} - {e}")
+            return {"status": "error", "message": str(e)}
+
+    def shutdown(self, wait: bool = False):
+        """스레드 풀 정리"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,122 @@
+# app/core/camera_session.py
+
+import asyncio
+import logging
+import os
+from contextlib import aclosing
+from typing import Dict, List, Optional
+
+from models.frame import Frame
+
+logger = logging.getLogger(__name__)
+
+
+class CameraSession:
+    """촬영과 눈 분석을 겹쳐서 실행하는 카메라 세션
+
+    카메라 스트림에서 캡처된 프레임을 크기가 제한된 분석 큐에 바로 넣고,
+    분석 작업이 큐를 소비합니다. 양쪽 눈이 신뢰도 임계값 이상으로 감지되면
+    남은 촬영을 중단하고 즉시 결과를 반환합니다. 세션이 끝나면 최적 결과로 선택되지
+    않은 캡처 원본(눈이 감지되지 않은 프레임 포함)을 삭제할 수 있습니다.
+    """
+
+    def __init__(self,
+                 camera,
+                 eye_detector,
+                 duration: int = 180,
+                 interval: int = 10,
+                 queue_size: int = 2,
+                 confidence_threshold: float = 0.85,
+                 delete_unused: bool = False):
+        """
+        Args:
+            camera: stream_capture_session()을 제공하는 카메라
+            eye_detector: EyeDetectionModel
+            duration (int): 최대 촬영 시간 (초)
+            interval (int): 촬영 간격 (초)
+            queue_size (int): 분석 대기 프레임 최대 수 (가득 차면 촬영이 대기)
+            confidence_threshold (float): 조기 종료 기준 양쪽 눈 평균 신뢰도
+            delete_unused (bool): 세션 종료 후 게시하지 않을 캡처 원본 삭제
+        """
+        self.camera = camera
+        self.eye_detector = eye_detector
+        self.duration = duration
+        self.interval = interval
+        self.queue_size = max(1, queue_size)
+        self.confidence_threshold = confidence_threshold
+        self.delete_unused = delete_unused
+
+        self.results: List[Dict] = []
+        self.image_paths: List[str] = []
+        self.frames_captured = 0
+        self.stopped_early = False
+
+    async def _produce(self, queue: asyncio.Queue):
+        try:
+            stream = self.camera.stream_capture_session(self.duration, self.interval)
+            async with aclosing(stream):
+                async for capture in stream:
+                    self.frames_captured += 1
+                    self.image_paths.append(capture['image_path'])
+                    if capture.get('data') is not None:
+                        frame = Frame.from_bytes(capture['data'], path=capture['image_path'])
+                    else:
+                        frame = Frame.from_path(capture['image_path'])
+                    await queue.put(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"카메라 스트림 오류: {e}")
+        # 촬영 종료 신호
+        await queue.put(None)
+
+    async def _consume(self, queue: asyncio.Queue):
+        while True:
+            frame = await queue.get()
+            if frame is None:
+                return
+
+            result = await asyncio.to_thread(self.eye_detector.process_frame, frame)
+            frame.release()
+            if not result:
+                continue
+
+            self.results.append(result)
+            if self.eye_detector.is_confident_result(result, self.confidence_threshold):
+                logger.info(f"신뢰도 기준 충족, 카메라 세션 조기 종료: {result['image_path']}")
+                self.stopped_early = True
+                return
+
+    async def run(self) -> Optional[Dict]:
+        """세션 실행 후 최적의 결과를 Firebase 저장용 구조로 반환"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        producer = asyncio.create_task(self._produce(queue))
+        try:
+            await self._consume(queue)
+        finally:
+            # 조기 종료 시 남은 촬영 중단
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+        logger.info(f"카메라 세션 종료 (촬영: {self.frames_captured}장, 분석 성공: {len(self.results)}개)")
+        best_result = await asyncio.to_thread(self.eye_detector.get_best_eye_results, self.results)
+        if self.delete_unused:
+            keep = best_result["image_path"] if best_result else None
+            await asyncio.to_thread(self._delete_images, keep)
+        return self.eye_detector.to_detection_result(best_result)
+
+    def _delete_images(self, keep: Optional[str]):
+        """게시할 이미지(keep)를 제외한 이번 세션의 캡처 원본 삭제"""
+        for path in self.image_paths:
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                logger.debug(f"미사용 이미지 삭제: {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"이미지 삭제 실패: {path} - {e}")
@@ -0,0 +1,130 @@
+# app/core/feeding_history.py
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ("date", "scheduled_time", "actual_time", "amount", "weight_after")
+
+
+class FeedingHistoryStore:
+    """SQLite 기반 급여 이력 저장소
+
+    이력은 테이블에 한 건씩 추가되고, 급여 여부 확인은 (date, scheduled_time)
+    메모리 인덱스로 O(1)에 처리합니다. 기간 조회는 date 인덱스를 사용합니다.
+    """
+
+    def __init__(self,
+                 db_path: str = "schedule/feeding_history.db",
+                 legacy_json_path: Optional[str] = "schedule/feeding_history.json"):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로 (":memory:" 가능)
+            legacy_json_path (str): 최초 생성 시 가져올 기존 JSON 이력 파일
+        """
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS feedings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                scheduled_time TEXT NOT NULL,
+                actual_time TEXT,
+                amount REAL,
+                weight_after REAL,
+                extra TEXT
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_feedings_date ON feedings (date, scheduled_time)")
+        self._conn.commit()
+
+        self._fed = set(self._conn.execute("SELECT date, scheduled_time FROM feedings"))
+
+        if not self._fed and legacy_json_path and os.path.exists(legacy_json_path):
+            count = self.import_json(legacy_json_path)
+            logger.info(f"기존 급여 이력 {count}건 가져오기 완료: {legacy_json_path}")
+
+    def _row(self, record: Dict):
+        extra = {k: v for k, v in record.items() if k not in _COLUMNS}
+        return (
+            record["date"],
+            record["scheduled_time"],
+            record.get("actual_time"),
+            record.get("amount"),
+            record.get("weight_after"),
+            json.dumps(extra) if extra else None,
+        )
+
+    @staticmethod
+    def _to_dict(row) -> Dict:
+        record = dict(zip(_COLUMNS, row[:5]))
+        if row[5]:
+            record.update(json.loads(row[5]))
+        return record
+
+    def append(self, record: Dict):
+        """급여 이력 1건 추가"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO feedings (date, scheduled_time, actual_time, amount, weight_after, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?)", self._row(record))
+            self._conn.commit()
+            self._fed.add((record["date"], record["scheduled_time"]))
+
+    def is_fed(self, date: str, scheduled_time: str) -> bool:
+        """해당 날짜/예정 시각의 급여 여부"""
+        return (date, scheduled_time) in self._fed
+
+    def query_range(self, start_date: str, end_date: str) -> List[Dict]:
+        """start_date ~ end_date (YYYY-MM-DD, 양 끝 포함) 기간의 이력"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, scheduled_time, actual_time, amount, weight_after, extra FROM feedings "
+                "WHERE date BETWEEN ? AND ? ORDER BY date, scheduled_time, id",
+                (start_date, end_date)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def all(self) -> List[Dict]:
+        """전체 이력 (저장 순서)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, scheduled_time, actual_time, amount, weight_after, extra FROM feedings "
+                "ORDER BY id").fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def import_json(self, path: str) -> int:
+        """기존 {"feedings": [...]} JSON 이력 일괄 가져오기 (이미 있는 기록은 건너뜀)"""
+        with open(path, "r") as f:
+            feedings = json.load(f).get("feedings", [])
+
+        with self._lock:
+            existing = set(self._conn.execute("SELECT date, scheduled_time, actual_time FROM feedings"))
+            rows = [
+                self._row(record) for record in feedings
+                if (record["date"], record["scheduled_time"], record.get("actual_time")) not in existing
+            ]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO feedings (date, scheduled_time, actual_time, amount, weight_after, extra) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._fed.update((row[0], row[1]) for row in rows)
+        return len(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM feedings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,169 @@
+# app/core/feeding_schedule.py
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEDULE_PATH = "schedule/feeding_schedule.json"
+
+
+def _minute_of_day(time_str: str) -> int:
+    hour, minute = map(int, time_str.split(':'))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"잘못된 급여 시각: {time_str}")
+    return hour * 60 + minute
+
+
+class FeedingScheduleCache:
+    """급여 일정 캐시
+
+    feeding_schedule.json은 파일 변경(mtime)이 감지되거나 invalidate()가 호출될 때만
+    다시 읽습니다. 급여 시각은 하루 중 분 단위로 정렬해 두어, 급여 시간 확인은
+    파일 파싱 없이 이진 탐색으로 처리합니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_SCHEDULE_PATH, check_interval: float = 1.0, clock=time.monotonic):
+        """
+        Args:
+            path (str): 급여 일정 파일 경로
+            check_interval (float): 파일 변경 확인 최소 간격 (초)
+            clock: 변경 확인 간격 계산용 시계
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._schedule: Optional[Dict] = None
+        self._mtime_ns: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        self._minutes: List[int] = []     # 정렬된 급여 시각 (분)
+        self._entries: List[Dict] = []    # _minutes와 같은 순서의 일정 항목
+
+    def invalidate(self):
+        """다음 조회 시 파일을 다시 읽도록 표시"""
+        with self._lock:
+            self._checked_at = None
+            self._mtime_ns = None
+
+    def _refresh(self):
+        now = self.clock()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            self._set_schedule(None)
+            self._mtime_ns = None
+            return
+        if mtime_ns == self._mtime_ns:
+            return
+
+        try:
+            with open(self.path, 'r') as f:
+                schedule = json.load(f)
+            self._set_schedule(schedule)
+            self._mtime_ns = mtime_ns
+            logger.info(f"급여 일정 로드: {len(self._entries)}건")
+        except Exception as e:
+            # 편집 중인 파일일 수 있으므로 기존 일정을 유지하고 다음 확인 때 다시 시도
+            logger.error(f"급여 일정 로드 실패: {e}")
+
+    def _set_schedule(self, schedule: Optional[Dict]):
+        entries = []
+        if schedule:
+            for feeding in schedule.get("feedings", []):
+                entries.append((_minute_of_day(feeding["time"]), feeding))
+        entries.sort(key=lambda item: item[0])
+        self._schedule = schedule
+        self._minutes = [minute for minute, _ in entries]
+        self._entries = [feeding for _, feeding in entries]
+
+    def get(self) -> Optional[Dict]:
+        """현재 급여 일정 (파일이 없으면 None)"""
+        with self._lock:
+            self._refresh()
+            return self._schedule
+
+    def sorted_feedings(self) -> List[Dict]:
+        """급여 시각 순으로 정렬된 일정 항목"""
+        with self._lock:
+            self._refresh()
+            return self._entries
+
+    def due_feedings(self, now: datetime, window_minutes: int) -> List[Dict]:
+        """now가 급여 가능 시간(예정 시각 ~ +window_minutes) 안에 있는 일정 목록
+
+        급여 시간대가 자정을 넘어가면 전날 늦은 일정(예: 23:58 일정의 00:01)도 포함하며,
+        예정 시각이 이른 순(전날 일정 먼저)으로 반환합니다.
+        """
+        with self._lock:
+            self._refresh()
+            current = now.hour * 60 + now.minute
+            start = current - window_minutes
+            low = bisect.bisect_left(self._minutes, start)
+            high = bisect.bisect_right(self._minutes, current)
+            due = self._entries[low:high]
+            if start < 0:
+                wrapped = bisect.bisect_left(self._minutes, start + 24 * 60)
+                due = self._entries[wrapped:] + due
+            return due
+
+    def next_trigger(self, now: datetime) -> Optional[Dict]:
+        """now 이후(같은 분 포함) 오늘 남은 첫 급여 일정"""
+        with self._lock:
+            self._refresh()
+            index = bisect.bisect_left(self._minutes, now.hour * 60 + now.minute)
+            return self._entries[index] if index < len(self._entries) else None
+
+    def save(self, schedule: Dict):
+        """급여 일정을 파일에 저장하고 캐시를 즉시 갱신"""
+        # 저장 전에 검증해 잘못된 일정이 파일에 기록되지 않도록 함
+        if not isinstance(schedule, dict):
+            raise ValueError("급여 일정은 객체여야 합니다")
+        feedings = schedule.get("feedings", [])
+        if not isinstance(feedings, list):
+            raise ValueError("feedings는 목록이어야 합니다")
+        for feeding in feedings:
+            if not isinstance(feeding, dict):
+                raise ValueError(f"급여 항목은 {{time, amount}} 객체여야 합니다: {feeding}")
+            if not isinstance(feeding.get("time"), str):
+                raise ValueError(f"급여 시각이 없거나 문자열이 아닙니다: {feeding}")
+            _minute_of_day(feeding["time"])
+            amount = feeding.get("amount")
+            if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+                raise ValueError(f"급여량이 없거나 숫자가 아닙니다: {feeding}")
+
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(schedule, f, indent=2)
+            os.replace(temp_path, self.path)
+
+            self._set_schedule(schedule)
+            self._mtime_ns = os.stat(self.path).st_mtime_ns
+            self._checked_at = self.clock()
+
+
+_caches: Dict[str, FeedingScheduleCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_schedule_cache(path: str = DEFAULT_SCHEDULE_PATH) -> FeedingScheduleCache:
+    """경로별 공유 캐시 (TaskExecutor와 API 라우트가 같은 인스턴스를 사용)"""
+    key = os.path.abspath(path)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = FeedingScheduleCache(path)
+        return _caches[key]
@@ -1,72 +1,129 @@
 # app/core/firebase_manager.py
 
-import firebase_admin
-from firebase_admin import credentials, db
 import logging
+import os
 from datetime import datetime
 from typing import Dict, Optional
 
+from core.schemas import EyeCondition, FeedingData, HealthData, IntakeData
+from core.upload_queue import FirebaseAdminSink, RestRTDBSink, UploadQueue
+
+logger = logging.getLogger(__name__)
+
+# 질병 모델 키 -> EyeCondition 필드
+EYE_CONDITION_FIELDS = {
+    "blepharitis": "blepharitis_prob",
+    "conjunctivitis": "conjunctivitis_prob",
+    "corneal_sequestrum": "corneal_sequestrum_prob",
+    "keratitis": "non_ulcerative_keratitis_prob",
+    "ulcer": "corneal_ulcer_prob",
+}
+
 class FirebaseManager:
-    """Firebase 실시간 데이터베이스 관리 클래스"""
-    
-    def __init__(self, 
+    """Firebase 실시간 데이터베이스 관리 클래스
+
+    결과는 업로드 대기열(UploadQueue)에 기록만 하고 바로 반환하며, 실제 전송은
+    백그라운드 워커가 묶음 단위로 처리합니다. 오프라인 동안의 결과는 디스크에 남아
+    연결이 복구되면 전송됩니다.
+
+        devices/<serial_number>/health/<feeding|intake|eye>/<시각 키> = HealthData
+    """
+
+    def __init__(self,
                  cert_path: str = "config/firebase-cert.json",
-                 db_url: str = "https://your-project.firebaseio.com"):
+                 db_url: str = "https://your-project.firebaseio.com",
+                 serial_number: str = "SN1",
+                 queue_path: str = "data/upload_queue.db",
+                 sink=None,
+                 auto_start: bool = True):
         """
         Args:
             cert_path (str): Firebase 인증 키 파일 경로
             db_url (str): Firebase 데이터베이스 URL
+            serial_number (str): 기기 시리얼 번호 (저장 경로에 사용)
+            queue_path (str): 업로드 대기열 SQLite 파일 경로
+            sink: 전송 대상 (테스트용 주입, 기본: firebase_admin SDK, 없으면 REST API)
+            auto_start (bool): 초기화 후 백그라운드 전송 시작
         """
+        self.serial_number = serial_number
+
+        if sink is None:
+            sink = self._create_sink(cert_path, db_url)
+        self._is_initialized = sink is not None
+
+        # 전송 대상이 없어도 결과는 대기열에 쌓아 두고 다음 실행 때 전송
+        self.queue = UploadQueue(queue_path, sink=sink)
+        if auto_start and self._is_initialized:
+            self.queue.start()
+
+    def _create_sink(self, cert_path: str, db_url: str):
         try:
-            cred = credentials.Certificate(cert_path)
-            firebase_admin.initialize_app(cred, {
-                'databaseURL': db_url
-            })
-            self._is_initialized = True
-            
-            # 로거 설정
-            self.logger = self._setup_logger()
-            
+            return FirebaseAdminSink(cert_path, db_url)
+        except ImportError:
+            logger.warning("firebase_admin이 없어 REST API로 전송합니다")
+            return RestRTDBSink(db_url, auth_token=os.environ.get("FIREBASE_AUTH_TOKEN"))
         except Exception as e:
-            print(f"Firebase 초기화 실패: {str(e)}")
-            self._is_initialized = False
-    
-    def _setup_logger(self) -> logging.Logger:
-        """로깅 시스템 설정[2]"""
-        logger = logging.getLogger('firebase')
-        logger.setLevel(logging.INFO)
-        
-        # 파일 핸들러 설정
-        handler = logging.FileHandler('logs/firebase.log')
-        handler.setLevel(logging.INFO)
-        
-        # 포맷터 설정
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
-        return logger
-    
-    def save_detection_result(self, data: Dict) -> bool:
-        """눈 질병 감지 결과 저장[3]"""
-        if not self._is_initialized:
-            return False
-            
+            logger.error(f"Firebase 초기화 실패: {str(e)}")
+            return None
+
+    def _enqueue(self, data_type: str, data: Dict, when: Optional[datetime] = None) -> bool:
+        when = when or datetime.now()
+        record = HealthData(serial_number=self.serial_number, datetime=when, type=data_type, data=data)
+        path = f"devices/{self.serial_number}/health/{data_type}/{when.strftime('%Y%m%d_%H%M%S_%f')}"
         try:
-            ref = db.reference('eye_detections')
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            result = ref.child(timestamp).set({
-                'disease_probability': data['disease_probability'],
-                'image_path': data['image_path'],
-                'timestamp': timestamp
-            })
-            
-            self.logger.info(f"감지 결과 저장 성공: {timestamp}")
+            self.queue.enqueue(path, record.model_dump(mode="json"))
             return True
-            
         except Exception as e:
-            self.logger.error(f"감지 결과 저장 실패: {str(e)}")
+            logger.error(f"업로드 대기열 추가 실패 ({data_type}): {str(e)}")
             return False
+
+    def save_feeding_result(self, amount: float, when: Optional[datetime] = None) -> bool:
+        """급여 결과 저장 (대기열에 추가)"""
+        return self._enqueue("feeding", FeedingData(amount=amount).model_dump(), when)
+
+    def save_intake_result(self, intake: IntakeData, when: Optional[datetime] = None) -> bool:
+        """섭취 결과 저장 (대기열에 추가)"""
+        return self._enqueue("intake", intake.model_dump(), when)
+
+    def save_detection_result(self, data: Dict) -> bool:
+        """
+        눈 질병 감지 결과 저장 (대기열에 추가)[3]
+        Args:
+            data (dict): EyeDetectionModel.to_detection_result() 결과
+                (timestamp, image_path, left_eye, right_eye, 선택: images)
+        """
+        eyes = []
+        for side in ("left", "right"):
+            eye = data.get(f"{side}_eye")
+            if not eye:
+                continue
+            diseases = eye.get("diseases", {})
+            eyes.append(EyeCondition(
+                eye_side=side,
+                **{field: float(diseases.get(key, 0.0)) for key, field in EYE_CONDITION_FIELDS.items()}
+            ).model_dump())
+
+        if not eyes:
+            logger.info("저장할 눈 분석 결과가 없습니다")
+            return False
+
+        when = datetime.strptime(data["timestamp"], "%Y%m%d_%H%M%S") if data.get("timestamp") else None
+        record = {"eyes": eyes}
+        if data.get("image_path"):
+            # 원본을 게시 후 삭제한 경우에는 없음 (images의 썸네일 위치 사용)
+            record["image_path"] = data["image_path"]
+        if data.get("images"):
+            # ImagePublisher가 올린 썸네일/눈 영역 이미지 위치
+            record["images"] = data["images"]
+        saved = self._enqueue("eye", record, when)
+        if saved:
+            logger.info(f"감지 결과 저장 대기: {data.get('timestamp')}")
+        return saved
+
+    def pending_uploads(self) -> int:
+        """전송 대기 중인 결과 수"""
+        return self.queue.pending()
+
+    def close(self):
+        """전송 워커 중지 (남은 결과는 대기열에 보관되어 다음 실행 때 전송)"""
+        self.queue.close()
@@ -0,0 +1,145 @@
+# app/core/object_storage.py
+
+import hashlib
+import logging
+import os
+import uuid
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StorageAdapter:
+    """이어 올리기(resumable)를 지원하는 객체 저장소 인터페이스
+
+    begin()으로 업로드 세션을 만들고, offset()으로 서버에 저장된 바이트 수를 확인한 뒤
+    그 위치부터 put_chunk()로 나누어 보내고 finish()로 완료합니다. 세션 ID를 보관해 두면
+    전송이 끊겨도 처음부터 다시 보내지 않고 이어서 올릴 수 있습니다.
+    """
+
+    def begin(self, key: str, size: int, content_type: str) -> str:
+        raise NotImplementedError
+
+    def offset(self, session: str) -> int:
+        raise NotImplementedError
+
+    def put_chunk(self, session: str, offset: int, data: bytes, total: int):
+        raise NotImplementedError
+
+    def finish(self, session: str, key: str, sha256: str) -> str:
+        """업로드 완료 후 객체 URL(또는 경로) 반환"""
+        raise NotImplementedError
+
+
+class LocalStorage(StorageAdapter):
+    """로컬 디렉토리를 저장소로 사용하는 어댑터 (테스트/오프라인용)
+
+    진행 중인 업로드는 <root>/.partial/<세션 ID>에 이어 쓰고, 완료 시 해시를 확인한 뒤
+    <root>/<key>로 옮깁니다.
+    """
+
+    def __init__(self, root: str = "data/storage"):
+        self.root = os.path.abspath(root)
+        self._partial_dir = os.path.join(self.root, ".partial")
+        os.makedirs(self._partial_dir, exist_ok=True)
+
+    def _partial(self, session: str) -> str:
+        return os.path.join(self._partial_dir, session)
+
+    def begin(self, key: str, size: int, content_type: str) -> str:
+        session = uuid.uuid4().hex
+        with open(self._partial(session), "wb"):
+            pass
+        return session
+
+    def offset(self, session: str) -> int:
+        path = self._partial(session)
+        if not os.path.exists(path):
+            raise KeyError(f"업로드 세션 없음: {session}")
+        return os.path.getsize(path)
+
+    def put_chunk(self, session: str, offset: int, data: bytes, total: int):
+        path = self._partial(session)
+        if os.path.getsize(path) != offset:
+            raise ValueError(f"잘못된 업로드 위치: {offset}")
+        with open(path, "ab") as f:
+            f.write(data)
+
+    def finish(self, session: str, key: str, sha256: str) -> str:
+        path = self._partial(session)
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if digest != sha256:
+            os.remove(path)
+            raise ValueError("업로드된 데이터의 해시가 일치하지 않습니다")
+
+        target = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+        return target
+
+
+class GCSStorage(StorageAdapter):
+    """Google Cloud Storage (Firebase Storage 버킷) 어댑터
+
+    GCS resumable upload 세션 URL에 Content-Range로 청크를 PUT 합니다.
+    """
+
+    def __init__(self, bucket: str, cert_path: Optional[str] = None, timeout: float = 30.0):
+        """
+        Args:
+            bucket (str): 버킷 이름 (예: <project>.appspot.com)
+            cert_path (str): 서비스 계정 키 파일 (없으면 기본 인증 사용)
+            timeout (float): 요청 타임아웃 (초)
+        """
+        from google.cloud import storage
+
+        if cert_path:
+            self.client = storage.Client.from_service_account_json(cert_path)
+        else:
+            self.client = storage.Client()
+        self.bucket = self.client.bucket(bucket)
+        self.timeout = timeout
+        self._http = self.client._http  # 인증된 requests 세션
+
+    def begin(self, key: str, size: int, content_type: str) -> str:
+        blob = self.bucket.blob(key)
+        return blob.create_resumable_upload_session(content_type=content_type, size=size)
+
+    def offset(self, session: str) -> int:
+        response = self._http.put(session, headers={"Content-Range": "bytes */*"}, timeout=self.timeout)
+        if response.status_code in (200, 201):
+            raise FileExistsError("이미 완료된 업로드 세션입니다")
+        if response.status_code != 308:
+            response.raise_for_status()
+        committed = response.headers.get("Range")  # 예: bytes=0-262143
+        return int(committed.split("-")[1]) + 1 if committed else 0
+
+    def put_chunk(self, session: str, offset: int, data: bytes, total: int):
+        end = offset + len(data) - 1
+        response = self._http.put(
+            session, data=data,
+            headers={"Content-Range": f"bytes {offset}-{end}/{total}"},
+            timeout=self.timeout)
+        if response.status_code not in (200, 201, 308):
+            response.raise_for_status()
+
+    def finish(self, session: str, key: str, sha256: str) -> str:
+        # 마지막 청크를 받으면 GCS가 객체를 완성함
+        return f"gs://{self.bucket.name}/{key}"
+
+
+def build_storage(config: Optional[Dict] = None) -> StorageAdapter:
+    """
+    settings.json의 storage 설정으로 어댑터 생성
+    Args:
+        config (dict): upload_backend ("gcs" | "local"), bucket, cert_path, local_dir
+            GCS 라이브러리/인증이 없으면 로컬 저장소 사용
+    """
+    config = config or {}
+    if config.get("upload_backend", "local") == "gcs":
+        try:
+            return GCSStorage(config["bucket"], config.get("cert_path"))
+        except Exception as e:
+            logger.warning(f"GCS 저장소를 사용할 수 없어 로컬 저장소를 사용합니다: {e}")
+    return LocalStorage(config.get("local_dir", "data/storage"))
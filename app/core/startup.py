@@ -0,0 +1,151 @@
+# app/core/startup.py
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyComponent:
+    """처음 사용할 때(또는 백그라운드 예열로) 생성되는 컴포넌트
+
+    무거운 모듈(TFLite 인터프리터, OpenCV 등)은 factory 안에서 import 하므로
+    생성 전까지는 로드되지 않습니다. 생성에 실패하면 기다리던 호출에는 오류를 전달하고,
+    다음 get()에서 다시 생성합니다 (부팅 중 모델 파일 동기화 등 일시적인 실패).
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any],
+                 on_ready: Optional[Callable[[str, float], None]] = None):
+        """
+        Args:
+            name (str): 컴포넌트 이름 (시간 기록용)
+            factory (Callable): 컴포넌트 생성 함수
+            on_ready (Callable): 생성 완료 시 (이름, 소요 시간 초)로 호출
+        """
+        self.name = name
+        self._factory = factory
+        self._on_ready = on_ready
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._value = None
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set() and self._error is None
+
+    def _build(self):
+        with self._lock:
+            if self.ready:
+                return
+            # 이전 시도가 실패했으면 다시 생성
+            self._done.clear()
+            self._error = None
+            started = time.perf_counter()
+            try:
+                self._value = self._factory()
+            except BaseException as e:
+                self._error = e
+                self._thread = None
+                logger.error(f"{self.name} 초기화 실패: {e}")
+            elapsed = time.perf_counter() - started
+            self._done.set()
+        if self._on_ready is not None:
+            self._on_ready(self.name, elapsed)
+
+    def start_warmup(self):
+        """백그라운드 스레드에서 미리 생성"""
+        if self._thread is None and not self._done.is_set():
+            self._thread = threading.Thread(target=self._build, name=f"warmup-{self.name}", daemon=True)
+            self._thread.start()
+
+    def get(self, timeout: Optional[float] = None):
+        """
+        컴포넌트 반환 (예열 중이면 완료를 기다리고, 시작 전이면 지금 생성)
+        Args:
+            timeout (float): 예열 완료 최대 대기 시간 (초)
+        """
+        if self._thread is None:
+            self._build()
+        elif not self._done.wait(timeout):
+            raise TimeoutError(f"{self.name} 초기화 대기 시간 초과")
+        error = self._error
+        if error is not None:
+            raise error
+        return self._value
+
+    def if_ready(self):
+        """생성이 끝났으면 컴포넌트, 아니면 None (생성을 시작하지 않음)"""
+        return self._value if self.ready else None
+
+
+class StartupOrchestrator:
+    """서로 독립적인 컴포넌트를 동시에 초기화하고 구성 요소별 소요 시간을 기록"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def record(self, name: str, elapsed: float):
+        with self._lock:
+            self.timings[name] = elapsed
+        logger.info(f"시작 단계 완료: {name} ({elapsed:.2f}초)")
+
+    def initialize(self, factories: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        컴포넌트 동시 초기화
+        Args:
+            factories (dict): 이름 -> 생성 함수
+        Returns:
+            dict: 이름 -> 생성된 컴포넌트
+        Raises:
+            생성 중 발생한 첫 번째 예외 (나머지 컴포넌트 생성이 끝나고 정리한 뒤)
+        """
+        def timed(name, factory):
+            started = time.perf_counter()
+            try:
+                return factory()
+            finally:
+                self.record(name, time.perf_counter() - started)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup") as executor:
+            futures = {name: executor.submit(timed, name, factory) for name, factory in factories.items()}
+        # 모든 생성이 끝난 뒤 결과 확인 (일부가 실패해도 나머지는 정리할 수 있도록 반환값 보존)
+        results, errors = {}, {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+        if errors:
+            # 생성된 장치(GPIO 핀, 카메라 프로세스 등)는 다시 시작할 수 있도록 정리
+            for created_name, component in results.items():
+                cleanup = getattr(component, "cleanup", None)
+                if cleanup is None:
+                    continue
+                try:
+                    cleanup()
+                except Exception as e:
+                    logger.warning(f"{created_name} 정리 실패: {e}")
+            name, error = next(iter(errors.items()))
+            raise RuntimeError(f"{name} 초기화 실패: {error}") from error
+        return results
+
+    def lazy(self, name: str, factory: Callable[[], Any]) -> LazyComponent:
+        """사용 시점(또는 예열)에 생성되는 컴포넌트, 생성 시간도 기록"""
+        return LazyComponent(name, factory, on_ready=self.record)
+
+    def report(self) -> Dict[str, Any]:
+        """구성 요소별 초기화 시간 (초)과 전체 경과 시간"""
+        with self._lock:
+            components = dict(sorted(self.timings.items(), key=lambda item: -item[1]))
+        return {
+            "components": {name: round(elapsed, 3) for name, elapsed in components.items()},
+            "total": round(time.perf_counter() - self._started, 3),
+        }
@@ -6,9 +6,12 @@ from hardware.weight_sensor import WeightSensor
 from hardware.motor import MotorController
 from models.eye_detection import EyeDetectionModel
 from typing import Dict, Optional
+import logging
 import time
 import threading
 
+logger = logging.getLogger(__name__)
+
 class SystemController:
     """통합 시스템 제어 클래스"""
     
@@ -57,7 +60,7 @@ class SystemController:
                 time.sleep(0.1)  # 100ms 간격
                 
             except Exception as e:
-                print(f"모니터링 오류: {str(e)}")
+                logger.error(f"모니터링 오류: {str(e)}")
     
     def _handle_detection_results(self, results: list):
         """AI 분석 결과 처리[3]"""
@@ -1,110 +1,146 @@
-import random
+import logging
 import time
-import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from hardware.weight_sensor import WeightSensor
+from core.feeding_history import FeedingHistoryStore
+from core.feeding_schedule import get_schedule_cache
+from services.dispensing_service import SUCCESS, build_dispenser
+from services.intake_service import IntakeDetector
+from services.presence_service import build_presence_detector
+from utils.metrics import TASK_DURATION
+from utils.timeseries import FLAG_STABLE, TimeSeriesStore
+
+logger = logging.getLogger(__name__)
 
 class TaskExecutor:
-    def __init__(self, scheduler):
+    def __init__(self, scheduler, ultrasonic=None, presence_config=None, weight_sensor=None,
+                 motor=None, dispenser_config=None):
+        """
+        Args:
+            scheduler: RTOSScheduler
+            weight_sensor (WeightSensor): 무게 센서 (없으면 새로 생성)
+            motor (MotorController): 급여 모터 (없으면 feeding 작업은 오류 반환)
+            dispenser_config (dict): 급여 제어 설정 (settings.json의 feeding.dispenser)
+            ultrasonic (UltrasonicSensor): 초음파 센서 (없으면 ultrasonic 작업은 오류 반환)
+            presence_config (dict): 방문 감지 설정 (settings.json의 hardware.ultrasonic)
+        """
         self.scheduler = scheduler
-        self.weight_sensor = WeightSensor()
+        # 전달받은 센서는 만든 쪽(PetFeeder)이 정리
+        self._owns_weight_sensor = weight_sensor is None
+        self.weight_sensor = weight_sensor if weight_sensor is not None else WeightSensor()
+        self.ultrasonic = ultrasonic
+        # 무게를 보며 모터를 제어하는 급여 컨트롤러
+        self.dispenser = build_dispenser(motor, self.weight_sensor.get_weight, dispenser_config) \
+            if motor is not None else None
+        # 초음파 거리 스트림에서 방문(도착/떠남) 감지
+        self.presence_detector = build_presence_detector(presence_config)
+        # 필터를 거친 무게 스트림에서 식사/사료 추가 이벤트 감지
+        self.intake_detector = IntakeDetector()
+        # 센서 샘플 시계열 저장소 (1초/1분/1시간 집계 포함)
+        self.timeseries = TimeSeriesStore("data/timeseries")
         self.tasks = {
             "ultrasonic": self.ultrasonic_task,
             "camera": self.camera_task,
             "feeding": self.feeding_task,
             "weight": self.weight_task
         }
+        self._task_durations = {task_id: TASK_DURATION.labels(task=task_id) for task_id in self.tasks}
         self.feeding_schedule_path = "schedule/feeding_schedule.json"
         self.feeding_history_path = "schedule/feeding_history.json"
         self.feeding_window_minutes = 5  # 급여 가능 시간 윈도우 (분)
+        # 급여 일정 캐시 (파일이 바뀔 때만 다시 읽음)
+        self.schedule_cache = get_schedule_cache(self.feeding_schedule_path)
+        # 급여 이력 저장소 (최초 실행 시 기존 JSON 이력을 가져옴)
+        self.feeding_history = FeedingHistoryStore(
+            db_path="schedule/feeding_history.db",
+            legacy_json_path=self.feeding_history_path
+        )
         
     def load_feeding_schedule(self):
         """급여 일정 로드"""
         try:
-            with open(self.feeding_schedule_path, 'r') as f:
-                return json.load(f)
+            return self.schedule_cache.get()
         except Exception as e:
-            print(f"급여 일정 로드 실패: {str(e)}")
+            logger.error(f"급여 일정 로드 실패: {str(e)}")
             return None
 
     def load_feeding_history(self):
-        """급여 이력 로드"""
+        """급여 이력 로드 (전체)"""
         try:
-            with open(self.feeding_history_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {"feedings": []}
+            return {"feedings": self.feeding_history.all()}
         except Exception as e:
-            print(f"급여 이력 로드 실패: {str(e)}")
+            logger.error(f"급여 이력 로드 실패: {str(e)}")
             return {"feedings": []}
 
     def save_feeding_history(self, feeding_data):
-        """급여 이력 저장"""
+        """급여 이력 저장 (1건 추가)"""
         try:
-            history = self.load_feeding_history()
-            history["feedings"].append(feeding_data)
-            with open(self.feeding_history_path, 'w') as f:
-                json.dump(history, f, indent=2)
+            self.feeding_history.append(feeding_data)
         except Exception as e:
-            print(f"급여 이력 저장 실패: {str(e)}")
+            logger.error(f"급여 이력 저장 실패: {str(e)}")
 
     def is_feeding_time(self, schedule_time):
-        """급여 시간 범위 내인지 확인"""
+        """급여 시간 범위 내인지 확인 (예정 시각 ~ +feeding_window_minutes)"""
         current_time = datetime.now()
         schedule_hour, schedule_minute = map(int, schedule_time.split(':'))
         
-        # 현재 시간이 예정된 시간보다 이전이면서 feeding_window_minutes 내에 있는지 확인
-        if current_time.hour == schedule_hour:
-            # 같은 시간대일 경우
-            if schedule_minute - self.feeding_window_minutes <= current_time.minute < schedule_minute:
-                return False  # 아직 급여 시간이 되지 않음
-            elif schedule_minute <= current_time.minute <= schedule_minute + self.feeding_window_minutes:
-                return True  # 급여 가능 시간
-        
-        return False  # 그 외의 경우는 급여 시간이 아님
+        # 하루 중 분 단위로 비교해 정시/자정을 넘어가는 급여 시간대도 처리
+        elapsed = (current_time.hour * 60 + current_time.minute) - (schedule_hour * 60 + schedule_minute)
+        return 0 <= elapsed % (24 * 60) <= self.feeding_window_minutes
 
-    def is_already_fed(self, schedule_time):
-        """해당 시간대 급여 여부 확인"""
-        history = self.load_feeding_history()
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        
-        for feeding in history["feedings"]:
-            if (feeding["date"] == current_date and 
-                feeding["scheduled_time"] == schedule_time):
-                return True
-        return False
+    def is_already_fed(self, schedule_time, date=None):
+        """해당 시간대 급여 여부 확인 (date가 없으면 오늘)"""
+        current_date = date or datetime.now().strftime("%Y-%m-%d")
+        return self.feeding_history.is_fed(current_date, schedule_time)
 
     def get_current_feeding_amount(self):
         """현재 시간에 맞는 급여량 확인"""
-        schedule = self.load_feeding_schedule()
-        if not schedule:
-            return None
+        # 급여 시간 범위 내인 일정만 캐시에서 조회
+        now = datetime.now()
+        due = self.schedule_cache.due_feedings(now, self.feeding_window_minutes)
 
-        for feeding in schedule["feedings"]:
+        for feeding in due:
             schedule_time = feeding["time"]
+            # 자정을 넘긴 급여 시간대(예: 00:01에 확인한 23:58 일정)는 전날 일정으로 기록
+            schedule_hour, schedule_minute = map(int, schedule_time.split(':'))
+            date = now.date()
+            if (schedule_hour, schedule_minute) > (now.hour, now.minute):
+                date -= timedelta(days=1)
+            date = date.strftime("%Y-%m-%d")
             
             # 이미 급여했는지 확인
-            if self.is_already_fed(schedule_time):
+            if self.is_already_fed(schedule_time, date):
                 continue
                 
-            # 급여 시간 범위 내인지 확인
-            if self.is_feeding_time(schedule_time):
-                return {
-                    "amount": feeding["amount"],
-                    "scheduled_time": schedule_time
-                }
+            return {
+                "amount": feeding["amount"],
+                "scheduled_time": schedule_time,
+                "date": date
+            }
         
         return None
 
-    def execute_task(self, task_id):
+    def execute_task(self, task_id, *args, **kwargs):
         if task_id in self.tasks:
-            return self.tasks[task_id]()
+            start = time.perf_counter()
+            try:
+                return self.tasks[task_id](*args, **kwargs)
+            finally:
+                self._task_durations[task_id].observe(time.perf_counter() - start)
         return {"status": "error", "message": f"Task {task_id} not found"}
 
-    def feeding_task(self):
-        """급여 작업 실행"""
+    def feeding_task(self, feeding_info=None):
+        """
+        급여 작업 실행
+        Args:
+            feeding_info (dict): FeedingTrigger가 계산한 급여 정보 (amount, scheduled_time, date)
+                없으면 현재 시각 기준으로 일정을 확인
+        """
         try:
-            feeding_info = self.get_current_feeding_amount()
+            if feeding_info is None:
+                feeding_info = self.get_current_feeding_amount()
+            elif self.feeding_history.is_fed(feeding_info["date"], feeding_info["scheduled_time"]):
+                feeding_info = None
             
             if feeding_info is None:
                 return {
@@ -112,44 +148,47 @@ class TaskExecutor:
                     "message": "현재 시간에 해당하는 급여 일정이 없거나, 이미 급여를 완료했습니다."
                 }
 
+            if self.dispenser is None:
+                return {"status": "error", "message": "급여 모터가 없습니다"}
+
             amount = feeding_info["amount"]
             scheduled_time = feeding_info["scheduled_time"]
             
-            print(f"급여 시작... {amount}g 급여 중")
-            # 여기에 실제 급여 장치 제어 코드 추가
-            time.sleep(2)  # 급여 작업 시뮬레이션
+            # 무게 변화를 보며 목표량까지 배출
+            dispensed = self.dispenser.dispense(amount)
+            if dispensed.status != SUCCESS and dispensed.dispensed < self.dispenser.jam_min_gain:
+                return {"status": "error", "message": f"급여 실패 ({dispensed.status})"}
 
-            # 급여 후 무게 확인
-            weight_result = self.weight_task()
+            # 급여 후 무게 확인 (섭취 감지기는 진행하지 않음, 사료 추가 이벤트는 다음 무게 작업에서 전달)
+            weight_after = self.weight_sensor.get_weight()
             
             # 급여 이력 저장
             feeding_data = {
-                "date": datetime.now().strftime("%Y-%m-%d"),
+                "date": feeding_info.get("date", datetime.now().strftime("%Y-%m-%d")),
                 "scheduled_time": scheduled_time,
                 "actual_time": datetime.now().strftime("%H:%M:%S"),
                 "amount": amount,
-                "weight_after": weight_result["data"] if weight_result["status"] == "success" else None
+                "weight_after": weight_after,
+                "dispensed": round(dispensed.dispensed, 1),
+                "dispense_status": dispensed.status
             }
             self.save_feeding_history(feeding_data)
 
-            if weight_result["status"] == "success":
-                return {
-                    "status": "success",
-                    "data": {
-                        "amount_fed": amount,
-                        "weight_after": weight_result["data"],
-                        "scheduled_time": scheduled_time
-                    }
-                }
-            else:
-                return {
-                    "status": "partial_success",
-                    "data": {
-                        "amount_fed": amount,
-                        "scheduled_time": scheduled_time
-                    },
-                    "message": "급여 완료됨, 무게 확인 실패"
-                }
+            data = {
+                "amount_fed": dispensed.dispensed,
+                "scheduled_time": scheduled_time,
+                "dispense": dispensed.to_dict()
+            }
+            if weight_after is not None:
+                data["weight_after"] = weight_after
+            if dispensed.status == SUCCESS and weight_after is not None:
+                return {"status": "success", "data": data}
+            return {
+                "status": "partial_success",
+                "data": data,
+                "message": f"급여 {dispensed.dispensed:.1f}g / {amount}g ({dispensed.status})"
+                    if dispensed.status != SUCCESS else "급여 완료됨, 무게 확인 실패"
+            }
 
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -157,27 +196,48 @@ class TaskExecutor:
     def weight_task(self):
         """무게 측정 작업"""
         try:
-            weight = self.weight_sensor.get_weight()
+            events = []
+            reading = self.weight_sensor.get_reading()
+            if reading is not None:
+                weight = reading["weight"]
+                now = time.time()
+                events = self.intake_detector.update(now, weight, reading["stable"])
+                self.timeseries.append("weight", now, weight, FLAG_STABLE if reading["stable"] else 0)
+            else:
+                weight = self.weight_sensor.get_weight()
             if weight is not None:
-                print(f"현재 무게: {weight:.1f}g")
-                return {"status": "success", "data": weight}
+                logger.info(f"현재 무게: {weight:.1f}g")
+                return {"status": "success", "data": weight, "events": events}
             else:
                 return {"status": "error", "message": "무게 측정 실패"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
     def ultrasonic_task(self):
+        """거리 측정 및 방문 감지 작업 (연속 측정 중이면 최신 측정값 사용)"""
         try:
-            distance = random.uniform(5, 30)
-            print(f"Ultrasonic reading: {distance:.1f}cm")
-            time.sleep(0.5)
-            return {"status": "success", "data": distance}
+            if self.ultrasonic is None:
+                return {"status": "error", "message": "초음파 센서가 없습니다"}
+            if self.ultrasonic.is_continuous:
+                distance = self.ultrasonic.latest_distance()
+            else:
+                distance = self.ultrasonic.get_distance()
+            now = time.time()
+            events = self.presence_detector.update(now, distance)
+            if distance is not None:
+                self.timeseries.append("ultrasonic", now, distance)
+            return {
+                "status": "success",
+                "data": distance,
+                "present": self.presence_detector.present,
+                "events": events
+            }
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
     def camera_task(self):
         try:
-            print("Taking a photo...")
+            logger.info("Taking a photo...")
             time.sleep(1)
             return {"status": "success", "data": "image_captured"}
         except Exception as e:
@@ -185,4 +245,7 @@ class TaskExecutor:
 
     def cleanup(self):
         """리소스 정리"""
-        self.weight_sensor.cleanup()
\ No newline at end of file
+        if self._owns_weight_sensor:
+            self.weight_sensor.cleanup()
+        self.feeding_history.close()
+        self.timeseries.close()
\ No newline at end of file
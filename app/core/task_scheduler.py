@@ -1,35 +1,166 @@
+import heapq
+import itertools
+import math
+import time
+
+
 class RTOSScheduler:
-    def __init__(self):
+    """다음 실행 시각(deadline) 힙 기반 주기 작업 스케줄러
+
+    각 작업은 interval 주기로 실행되며, 실행 시각이 된 작업이 여러 개면 priority가
+    낮은 값(높은 우선순위)부터 꺼냅니다. 실행 지연(jitter)과 놓친 주기 수를 기록합니다.
+    """
+
+    def __init__(self, clock=time.monotonic):
         self.tasks = {
-            'ultrasonic': {'priority': 1, 'interval': 0.1},  # 100ms
-            'weight': {'priority': 1, 'interval': 0.1},      # 100ms
-            'schedule': {'priority': 2, 'interval': 1.0},    # 1s
-            'error': {'priority': 3, 'interval': 5.0},       # 5s
-            'camera': {'priority': 2, 'interval': 0.5}       # 500ms (when active)
+            'ultrasonic': {'priority': 1, 'interval': 0.1, 'enabled': True},  # 100ms
+            'weight': {'priority': 1, 'interval': 0.1, 'enabled': True},      # 100ms
+            'schedule': {'priority': 2, 'interval': 1.0, 'enabled': True},    # 1s
+            'error': {'priority': 3, 'interval': 5.0, 'enabled': True},       # 5s
+            'camera': {'priority': 2, 'interval': 0.5, 'enabled': False}      # 500ms (when active)
         }
         self.task_queue = []
         self.task_statuses = {}
         self.last_run_time = {task: 0 for task in self.tasks}
-        
+
+        self.clock = clock
+        self._heap = []          # (deadline, priority, seq, task_id)
+        self._active = {}        # task_id -> 힙에 있는 유효한 항목의 seq
+        self._dispatched = {}    # task_id -> 실행 중인 작업의 deadline
+        self._seq = itertools.count()
+        self.stats = {task: self._empty_stats() for task in self.tasks}
+
+        now = self.clock()
+        for task_id, task in self.tasks.items():
+            if task['enabled']:
+                self._push(task_id, now)
+
+    @staticmethod
+    def _empty_stats():
+        return {'runs': 0, 'missed': 0, 'jitter_sum': 0.0, 'jitter_max': 0.0}
+
+    def _push(self, task_id, deadline):
+        seq = next(self._seq)
+        self._active[task_id] = seq
+        heapq.heappush(self._heap, (deadline, self.tasks[task_id]['priority'], seq, task_id))
+
+    def _is_valid(self, entry):
+        _, _, seq, task_id = entry
+        return self._active.get(task_id) == seq
+
+    def add_task(self, task_id, priority, interval, enabled=True):
+        """작업 등록"""
+        self.tasks[task_id] = {'priority': priority, 'interval': interval, 'enabled': enabled}
+        self.last_run_time.setdefault(task_id, 0)
+        self.stats.setdefault(task_id, self._empty_stats())
+        if enabled:
+            self._push(task_id, self.clock())
+
+    def enable_task(self, task_id, current_time=None):
+        """작업 활성화 (즉시 1회 실행 예정)"""
+        task = self.tasks[task_id]
+        task['enabled'] = True
+        if task_id not in self._active and task_id not in self._dispatched:
+            self._push(task_id, self.clock() if current_time is None else current_time)
+
+    def disable_task(self, task_id):
+        """작업 비활성화 (힙의 항목은 꺼낼 때 무시됨)"""
+        self.tasks[task_id]['enabled'] = False
+        self._active.pop(task_id, None)
+
+    def restart(self, current_time=None):
+        """활성 작업의 다음 실행 시각을 지금으로 다시 맞춤 (생성 후 시작까지 걸린 시간은 지연으로 보지 않음)"""
+        if current_time is None:
+            current_time = self.clock()
+        for task_id, task in self.tasks.items():
+            if task['enabled'] and task_id not in self._dispatched:
+                self._push(task_id, current_time)
+
     def should_run_task(self, task_id, current_time):
         if task_id not in self.last_run_time:
             return True
         return (current_time - self.last_run_time[task_id]) >= self.tasks[task_id]['interval']
-    
+
     def update_task_time(self, task_id, current_time):
         self.last_run_time[task_id] = current_time
-        
+
     def get_next_task(self, current_time):
-        eligible_tasks = [
-            task for task in self.tasks 
-            if self.should_run_task(task, current_time)
-        ]
-        if not eligible_tasks:
+        """실행 시각이 된 작업 중 우선순위가 가장 높은 작업을 꺼냄
+
+        꺼낸 작업은 complete_task()를 호출할 때까지 다시 예약되지 않습니다.
+        """
+        due = []
+        while self._heap and self._heap[0][0] <= current_time:
+            entry = heapq.heappop(self._heap)
+            if self._is_valid(entry):
+                due.append(entry)
+        if not due:
             return None
-            
-        return min(eligible_tasks, key=lambda x: self.tasks[x]['priority'])
-    
+
+        best = min(due, key=lambda entry: (entry[1], entry[0], entry[2]))
+        for entry in due:
+            if entry is not best:
+                heapq.heappush(self._heap, entry)
+
+        deadline, _, _, task_id = best
+        del self._active[task_id]
+
+        jitter = max(0.0, current_time - deadline)
+        stats = self.stats[task_id]
+        # 한 주기 넘게 늦게 꺼냈으면 지나간 주기는 놓친 것으로 보고 가장 최근 주기로 실행
+        late_periods = math.floor(jitter / self.tasks[task_id]['interval'])
+        if late_periods:
+            stats['missed'] += late_periods
+            deadline += late_periods * self.tasks[task_id]['interval']
+        self._dispatched[task_id] = deadline
+        stats['runs'] += 1
+        stats['jitter_sum'] += jitter
+        stats['jitter_max'] = max(stats['jitter_max'], jitter)
+        self.update_task_time(task_id, current_time)
+        return task_id
+
+    def complete_task(self, task_id, current_time=None):
+        """작업 완료 처리 후 다음 주기 예약
+
+        실행이 길어져 다음 주기 시각을 넘겼으면 가장 최근 주기로 바로 다시 실행하고,
+        그 사이에 지나간 주기는 놓친 것으로 집계합니다.
+        """
+        deadline = self._dispatched.pop(task_id, None)
+        task = self.tasks[task_id]
+        if deadline is None or not task['enabled']:
+            return
+
+        if current_time is None:
+            current_time = self.clock()
+        interval = task['interval']
+        next_deadline = deadline + interval
+        if next_deadline <= current_time:
+            elapsed_periods = max(1, math.floor((current_time - deadline) / interval))
+            self.stats[task_id]['missed'] += elapsed_periods - 1
+            next_deadline = deadline + elapsed_periods * interval
+        self._push(task_id, next_deadline)
+
+    def time_until_next(self, current_time):
+        """다음 작업까지 남은 시간 (초), 예약된 작업이 없으면 None"""
+        while self._heap and not self._is_valid(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - current_time)
+
+    def get_stats(self):
+        """작업별 실행 횟수, 놓친 주기 수, 평균/최대 지연 (ms)"""
+        return {
+            task_id: {
+                'runs': stats['runs'],
+                'missed': stats['missed'],
+                'jitter_avg_ms': stats['jitter_sum'] / stats['runs'] * 1000 if stats['runs'] else 0.0,
+                'jitter_max_ms': stats['jitter_max'] * 1000,
+            }
+            for task_id, stats in self.stats.items()
+        }
+
     def set_task_status(self, task_id, status):
         self.task_statuses[task_id] = status
         if status == "ready":
-            self.task_queue.append(task_id)
\ No newline at end of file
+            self.task_queue.append(task_id)
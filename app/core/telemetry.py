@@ -0,0 +1,219 @@
+# app/core/telemetry.py
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.metrics import TELEMETRY_DROPPED
+
+logger = logging.getLogger(__name__)
+
+# 최신 값만 의미 있는 센서 스트림 (읽지 않은 이전 값은 새 값으로 교체)
+DEFAULT_COALESCE_TOPICS = ("weight", "distance")
+TOPICS = ("weight", "distance", "presence", "intake", "feeding", "detection")
+# 구독 응답/오류 (구독 주제와 관계없이 항상 전달)
+CONTROL_TOPIC = "control"
+
+
+class Subscription:
+    """구독자 한 명의 제한된 전송 대기열
+
+    coalesce 주제는 아직 보내지 않은 이전 값을 새 값으로 덮어써 대기열에 주제당 한 건만
+    남고, 나머지 주제(이벤트)는 대기열이 가득 차면 가장 오래된 메시지를 버립니다.
+    대기열 크기가 고정되어 있으므로 느린 클라이언트도 메모리를 계속 늘리지 않습니다.
+    """
+
+    def __init__(self,
+                 topics: Optional[Iterable[str]] = None,
+                 maxsize: int = 64,
+                 coalesce: Iterable[str] = DEFAULT_COALESCE_TOPICS):
+        """
+        Args:
+            topics (Iterable[str]): 받을 주제 (None이면 전체)
+            maxsize (int): 대기열 최대 메시지 수
+            coalesce (Iterable[str]): 최신 값만 유지할 주제
+        """
+        self.topics: Optional[Set[str]] = None if topics is None else set(topics)
+        self.maxsize = max(1, int(maxsize))
+        self.coalesce = set(coalesce)
+        self.dropped = 0
+        self.coalesced = 0
+        self._queue: Deque[list] = deque()               # [주제, 직렬화된 메시지]
+        self._pending: Dict[str, list] = {}              # coalesce 주제 -> 대기열 안의 항목
+        self._ready = asyncio.Event()
+
+    def wants(self, topic: str) -> bool:
+        return self.topics is None or topic in self.topics
+
+    def set_topics(self, topics: Optional[Iterable[str]]):
+        """구독 주제 변경 (이미 대기 중인 다른 주제 메시지는 버리고 control 메시지는 유지)"""
+        self.topics = None if topics is None else set(topics)
+        if self.topics is not None:
+            kept = [entry for entry in self._queue if entry[0] in self.topics or entry[0] == CONTROL_TOPIC]
+            self._queue = deque(kept)
+            self._pending = {topic: entry for topic, entry in self._pending.items() if topic in self.topics}
+            if not self._queue:
+                self._ready.clear()
+
+    def offer(self, topic: str, message: str):
+        """메시지 추가 (기다리지 않음)"""
+        entry = self._pending.get(topic)
+        if entry is not None:
+            entry[1] = message
+            self.coalesced += 1
+            return
+
+        if len(self._queue) >= self.maxsize:
+            oldest = self._queue.popleft()
+            if self._pending.get(oldest[0]) is oldest:
+                del self._pending[oldest[0]]
+            self.dropped += 1
+            TELEMETRY_DROPPED.inc()
+
+        entry = [topic, message]
+        self._queue.append(entry)
+        if topic in self.coalesce:
+            self._pending[topic] = entry
+        self._ready.set()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def get_nowait(self) -> Optional[str]:
+        if not self._queue:
+            return None
+        topic, message = entry = self._queue.popleft()
+        if self._pending.get(topic) is entry:
+            del self._pending[topic]
+        if not self._queue:
+            self._ready.clear()
+        return message
+
+    async def get(self) -> str:
+        """다음 메시지 (없으면 도착할 때까지 대기)"""
+        while not self._queue:
+            await self._ready.wait()
+        return self.get_nowait()
+
+
+class TelemetryHub:
+    """센서/이벤트 텔레메트리를 웹소켓 구독자에게 나눠 주는 발행/구독 허브
+
+    생산자는 publish()를 한 번 호출하고, 메시지는 한 번만 JSON으로 직렬화되어
+    각 구독자의 제한된 대기열에 들어갑니다. publish()는 대기하지 않으므로 느린
+    클라이언트가 있어도 제어 루프가 멈추지 않습니다. 이벤트 루프 밖의 스레드에서
+    호출하면 루프 스레드로 넘겨서 처리합니다.
+    """
+
+    def __init__(self, queue_size: int = 64, coalesce: Iterable[str] = DEFAULT_COALESCE_TOPICS):
+        """
+        Args:
+            queue_size (int): 구독자별 대기열 크기
+            coalesce (Iterable[str]): 최신 값만 유지할 주제
+        """
+        self.queue_size = queue_size
+        self.coalesce = tuple(coalesce)
+        self.published = 0
+        self._subscribers: List[Subscription] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None,
+                  queue_size: Optional[int] = None) -> Subscription:
+        """
+        구독 추가 (이벤트 루프 안에서 호출)
+        Args:
+            topics (Iterable[str]): 받을 주제 (None이면 전체)
+            queue_size (int): 대기열 크기 (기본: 허브 설정)
+        """
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(topics, queue_size or self.queue_size, self.coalesce)
+        self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, topic: str, data: Any, timestamp: Optional[float] = None):
+        """
+        텔레메트리 발행 (구독자가 없으면 직렬화도 하지 않음)
+        Args:
+            topic (str): 주제 (weight, distance, presence, intake, feeding, detection)
+            data: JSON으로 직렬화할 값
+            timestamp (float): 측정 시각 (epoch 초, 기본: 현재)
+        """
+        if not self._subscribers:
+            return
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is not loop:
+            loop.call_soon_threadsafe(self.publish, topic, data, timestamp)
+            return
+
+        message = None
+        for subscription in self._subscribers:
+            if not subscription.wants(topic):
+                continue
+            if message is None:
+                message = json.dumps({
+                    "topic": topic,
+                    "time": time.time() if timestamp is None else timestamp,
+                    "data": data
+                }, ensure_ascii=False, default=str)
+            subscription.offer(topic, message)
+        if message is not None:
+            self.published += 1
+
+    def stats(self) -> Dict:
+        """구독자 수와 구독자별 대기/버림/병합 건수"""
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "clients": [
+                {"queued": len(s), "dropped": s.dropped, "coalesced": s.coalesced}
+                for s in self._subscribers
+            ],
+        }
+
+
+def parse_topics(topics: Any) -> Tuple[Optional[str], Optional[List[str]]]:
+    """
+    구독 주제 확인
+    Args:
+        topics: 주제 목록 또는 "*" (전체)
+    Returns:
+        (오류 메시지, 주제 목록) - 주제 목록이 None이면 전체,
+        오류가 있으면 알 수 있는 주제만 남긴 목록 (전체로 넓히지 않음)
+    """
+    if topics == "*":
+        return None, None
+    if not isinstance(topics, list):
+        return f"주제 목록이 아닙니다 (사용 가능: {', '.join(TOPICS)})", []
+    unknown = [topic for topic in topics if topic not in TOPICS]
+    if unknown:
+        valid = [topic for topic in topics if topic in TOPICS]
+        return f"알 수 없는 주제입니다: {', '.join(map(str, unknown))} (사용 가능: {', '.join(TOPICS)})", valid
+    return None, topics
+
+
+def parse_subscription(text: str) -> Tuple[Optional[str], Optional[List[str]]]:
+    """
+    클라이언트 구독 메시지 해석
+        {"subscribe": ["weight", "feeding"]}  -> 해당 주제만 수신
+        {"subscribe": "*"}                    -> 전체 수신
+    """
+    try:
+        topics = json.loads(text)["subscribe"]
+    except (ValueError, TypeError, KeyError):
+        return '{"subscribe": [주제, ...]} 형식이 아닙니다', []
+    return parse_topics(topics)
@@ -0,0 +1,343 @@
+# app/core/upload_queue.py
+
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class UploadError(Exception):
+    """일시적인 업로드 실패 (네트워크 끊김, 5xx 등) - 백오프 후 다시 시도"""
+
+
+class PermanentUploadError(UploadError):
+    """다시 보내도 실패할 업로드 (잘못된 데이터 등) - 재시도하지 않음"""
+
+
+class AuthenticationError(PermanentUploadError):
+    """인증 실패 (토큰 만료/잘못된 토큰/권한 없음) - 묶음 전체를 재시도하지 않음"""
+
+
+class RestRTDBSink:
+    """Firebase Realtime Database REST API로 다중 경로 업데이트 전송
+
+    PATCH /.json 요청 한 번에 {경로: 값} 여러 개를 원자적으로 기록합니다.
+    """
+
+    def __init__(self, db_url: str, auth_token: Optional[str] = None, timeout: float = 10.0):
+        """
+        Args:
+            db_url (str): 데이터베이스 URL (예: https://<project>.firebaseio.com)
+            auth_token (str): 인증 토큰 (auth 쿼리 파라미터)
+            timeout (float): 요청 타임아웃 (초)
+        """
+        import requests
+
+        self.url = db_url.rstrip("/") + "/.json"
+        self.params = {"auth": auth_token} if auth_token else None
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def update(self, updates: Dict[str, Any]):
+        import requests
+
+        try:
+            response = self.session.patch(self.url, json=updates, params=self.params, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise UploadError(str(e)) from e
+
+        if response.status_code < 300:
+            return
+        message = f"HTTP {response.status_code}: {response.text[:200]}"
+        # 토큰이 만료되었거나 권한이 없으면 다시 보내도 같은 결과
+        if response.status_code in (401, 403):
+            raise AuthenticationError(message)
+        # 요청 제한/서버 오류는 일시적 실패로 보고 재시도
+        if response.status_code in (408, 429) or response.status_code >= 500:
+            raise UploadError(message)
+        raise PermanentUploadError(message)
+
+    def close(self):
+        self.session.close()
+
+
+class FirebaseAdminSink:
+    """firebase_admin SDK의 db.reference('/').update()로 다중 경로 업데이트 전송"""
+
+    def __init__(self, cert_path: str, db_url: str):
+        import firebase_admin
+        from firebase_admin import credentials, db
+
+        if not firebase_admin._apps:
+            firebase_admin.initialize_app(credentials.Certificate(cert_path), {'databaseURL': db_url})
+        self._root = db.reference('/')
+
+    def update(self, updates: Dict[str, Any]):
+        from firebase_admin import exceptions
+
+        try:
+            self._root.update(updates)
+        except (exceptions.UnauthenticatedError, exceptions.PermissionDeniedError) as e:
+            raise AuthenticationError(str(e)) from e
+        except exceptions.InvalidArgumentError as e:
+            raise PermanentUploadError(str(e)) from e
+        except Exception as e:
+            raise UploadError(str(e)) from e
+
+    def close(self):
+        pass
+
+
+class UploadQueue:
+    """디스크(SQLite)에 보관하는 업로드 대기열과 백그라운드 전송 워커
+
+    enqueue()는 로컬 DB에 한 건 기록하고 바로 반환하므로 제어 루프를 막지 않습니다.
+    워커는 오래된 순서로 최대 batch_size건을 묶어 다중 경로 업데이트 한 번으로 보내고,
+    성공한 항목만 삭제합니다. 실패하면 지수 백오프로 다시 시도하며, 네트워크가 끊긴 동안
+    쌓인 항목은 재시작 후에도 남아 있다가 연결되면 전송됩니다.
+    """
+
+    def __init__(self,
+                 db_path: str = "data/upload_queue.db",
+                 sink=None,
+                 batch_size: int = 50,
+                 base_delay: float = 1.0,
+                 max_delay: float = 300.0,
+                 jitter: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로 (":memory:" 가능)
+            sink: update(dict)를 제공하는 전송 대상 (RestRTDBSink, FirebaseAdminSink 등)
+                None이면 전송하지 않고 쌓기만 함
+            batch_size (int): 한 번에 보낼 최대 항목 수
+            base_delay (float): 첫 재시도 대기 시간 (초)
+            max_delay (float): 최대 재시도 대기 시간 (초)
+            jitter (bool): 재시도 대기 시간을 무작위로 줄여 여러 장치의 재시도가 겹치지 않게 함
+            clock: 백오프 계산용 시계
+        """
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.sink = sink
+        self.batch_size = batch_size
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.clock = clock
+
+        self.failures = 0          # 연속 실패 횟수
+        self.next_attempt = 0.0    # 다음 전송 가능 시각 (clock 기준)
+        self.sent = 0
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                dead INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            )
+        """)
+        self._conn.commit()
+
+    def enqueue(self, path: str, data: Any) -> int:
+        """
+        업로드 항목 추가
+        Args:
+            path (str): 데이터베이스 경로 (예: devices/SN1/health/feeding/20240101_080000)
+            data: JSON으로 직렬화 가능한 값
+        Returns:
+            int: 항목 ID
+        """
+        payload = json.dumps(data, ensure_ascii=False)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (path, payload, created) VALUES (?, ?, ?)",
+                (path.strip("/"), payload, time.time()))
+            self._conn.commit()
+        self._wakeup.set()
+        return cursor.lastrowid
+
+    def pending(self) -> int:
+        """전송 대기 중인 항목 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE dead = 0").fetchone()[0]
+
+    def dead_letters(self) -> List[Dict]:
+        """재시도하지 않고 보관 중인 실패 항목"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, path, payload, attempts, error FROM outbox WHERE dead = 1 ORDER BY id").fetchall()
+        return [{"id": r[0], "path": r[1], "data": json.loads(r[2]), "attempts": r[3], "error": r[4]}
+                for r in rows]
+
+    def _next_batch(self) -> List[Tuple[int, str, str]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, path, payload FROM outbox WHERE dead = 0 ORDER BY id LIMIT ?",
+                (self.batch_size,)).fetchall()
+
+    def _send(self, batch: List[Tuple[int, str, str]]):
+        # 같은 경로가 여러 번 있으면 나중 값이 남음 (추가 순서대로 적용한 것과 동일)
+        self.sink.update({path: json.loads(payload) for _, path, payload in batch})
+
+    def _delete(self, ids: List[int]):
+        with self._lock:
+            self._conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+            self._conn.commit()
+
+    def _mark_failed(self, ids: List[int], error: str, dead: bool):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, error = ?, dead = ? WHERE id = ?",
+                [(error, int(dead), i) for i in ids])
+            self._conn.commit()
+
+    def backoff_delay(self) -> float:
+        """현재 연속 실패 횟수 기준 재시도 대기 시간 (초)"""
+        if self.failures == 0:
+            return 0.0
+        delay = min(self.max_delay, self.base_delay * 2 ** min(self.failures - 1, 30))
+        if self.jitter:
+            delay *= random.uniform(0.5, 1.0)
+        return delay
+
+    def flush_once(self) -> int:
+        """
+        대기 중인 항목 1묶음 전송 (백오프 대기 중이면 보내지 않음)
+        Returns:
+            int: 전송에 성공한 항목 수
+        """
+        if self.sink is None or self.clock() < self.next_attempt:
+            return 0
+        batch = self._next_batch()
+        if not batch:
+            return 0
+
+        try:
+            self._send(batch)
+        except AuthenticationError as e:
+            # 항목 문제가 아니므로 한 건씩 다시 보내지 않고 묶음 전체를 보관
+            logger.error(f"업로드 인증 실패, {len(batch)}건을 재시도하지 않고 보관: {e}")
+            self._mark_failed([row[0] for row in batch], str(e), dead=True)
+            return 0
+        except PermanentUploadError as e:
+            return self._send_individually(batch, e)
+        except Exception as e:
+            self._mark_failed([row[0] for row in batch], str(e), dead=False)
+            self._schedule_retry(e)
+            return 0
+
+        self._delete([row[0] for row in batch])
+        self.failures = 0
+        self.sent += len(batch)
+        return len(batch)
+
+    def _send_individually(self, batch, error) -> int:
+        """잘못된 항목 하나가 묶음 전체를 막지 않도록 한 건씩 보내고, 거부된 항목만 보관"""
+        if len(batch) == 1:
+            logger.error(f"업로드 거부, 재시도하지 않음 ({batch[0][1]}): {error}")
+            self._mark_failed([batch[0][0]], str(error), dead=True)
+            return 0
+
+        sent = 0
+        for row in batch:
+            try:
+                self._send([row])
+            except PermanentUploadError as e:
+                logger.error(f"업로드 거부, 재시도하지 않음 ({row[1]}): {e}")
+                self._mark_failed([row[0]], str(e), dead=True)
+                continue
+            except Exception as e:
+                self._schedule_retry(e)
+                break
+            self._delete([row[0]])
+            sent += 1
+        else:
+            self.failures = 0
+        self.sent += sent
+        return sent
+
+    def _schedule_retry(self, error: Exception):
+        self.failures += 1
+        delay = self.backoff_delay()
+        self.next_attempt = self.clock() + delay
+        logger.warning(f"업로드 실패 ({self.failures}회 연속), {delay:.1f}초 후 재시도: {error}")
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """대기열이 빌 때까지 전송 (백오프 대기 포함), 시간 안에 비우면 True"""
+        if self.sink is None:
+            return self.pending() == 0
+        deadline = time.monotonic() + timeout
+        while self.pending():
+            wait = self.next_attempt - self.clock()
+            if wait > 0:
+                if time.monotonic() + wait > deadline:
+                    return False
+                time.sleep(wait)
+            self.flush_once()
+            if time.monotonic() > deadline:
+                return self.pending() == 0
+        return True
+
+    def start(self):
+        """백그라운드 전송 워커 시작"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._worker_loop, name="upload-worker", daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 5.0):
+        """워커 중지 (남은 항목은 DB에 보관되어 다음 실행 때 전송)"""
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout=timeout)
+            self._worker = None
+
+    @property
+    def is_running(self):
+        return self._worker is not None and self._worker.is_alive()
+
+    def _worker_loop(self, idle_interval: float = 5.0):
+        while not self._stop_event.is_set():
+            wait = self.next_attempt - self.clock()
+            if wait > 0:
+                self._stop_event.wait(wait)
+                continue
+            self._wakeup.clear()
+            try:
+                self.flush_once()
+                # 묶음 전체가 보관 처리되어 보낸 건이 없어도 남은 항목이 있으면 바로 이어서 전송
+                idle = self.failures == 0 and (self.sink is None or self.pending() == 0)
+            except Exception as e:
+                logger.error(f"업로드 워커 오류: {e}")
+                idle = True
+            if idle:
+                # 대기열이 비었으면 enqueue()가 깨울 때까지 대기
+                self._wakeup.wait(idle_interval)
+
+    def close(self):
+        self.stop()
+        if self.sink is not None and hasattr(self.sink, "close"):
+            self.sink.close()
+        with self._lock:
+            self._conn.close()
@@ -1,11 +1,18 @@
-# from picamera2 import Picamera2  # 주석 처리
-import subprocess
+import logging
+import asyncio
 import os
+from collections import deque
 from datetime import datetime
 import json
 from pathlib import Path
 import time
-from typing import Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict, Union
+
+from utils.metrics import CAMERA_CAPTURE
+
+from .camera_backends import CaptureBackend, create_capture_backend
+
+logger = logging.getLogger(__name__)
 
 class CameraIMX219:
     """라즈베리파이 카메라 (IMX219) 제어 클래스"""
@@ -14,57 +21,53 @@ class CameraIMX219:
                  save_dir: str = "data/images",
                  resolution: tuple = (3840, 2160),  # 4K UHD
                  format: str = "jpg",
-                 rotation: int = 0):
+                 rotation: int = 0,
+                 backend: Union[str, CaptureBackend] = os.environ.get('CAMERA_BACKEND', 'auto')):
         """
         Args:
             save_dir (str): 이미지 저장 경로
             resolution (tuple): 해상도 (width, height)
             format (str): 이미지 포맷 (jpg/png)
             rotation (int): 카메라 회전 각도 (0/90/180/270)
+            backend (str | CaptureBackend): 캡처 백엔드
+                (auto/picamera2/mjpeg/libcamera-still/replay 또는 백엔드 객체)
         """
         try:
-            print("[camera] 카메라 초기화 시작...")
+            logger.info("카메라 초기화 시작...")
             # 저장 디렉토리 생성
             self.save_dir = Path(save_dir)
             self.save_dir.mkdir(parents=True, exist_ok=True)
-            print(f"[camera] 저장 경로 생성: {save_dir}")
+            logger.info(f"저장 경로 생성: {save_dir}")
             
             self.resolution = resolution
             self.format = format.lower()
             self.rotation = rotation
             
-            print(f"[camera] 설정: {resolution} / {format} / 회전: {rotation}도")
+            logger.debug(f"설정: {resolution} / {format} / 회전: {rotation}도")
             
-            # libcamera 설정
-            self.capture_config = {
-                "width": resolution[0],
-                "height": resolution[1],
-                "rotation": rotation,
-                "timeout": 2000,  # 2초 타임아웃
-                "nopreview": True
-            }
+            # 캡처 백엔드 (장치는 한 번만 열고 계속 유지)
+            self.backend = backend if isinstance(backend, CaptureBackend) else \
+                create_capture_backend(backend, resolution, rotation)
+            self.latencies = deque(maxlen=100)
+            logger.info(f"캡처 백엔드: {self.backend.name}")
             
             # 카메라 테스트
-            self._test_camera()
-            self._is_initialized = True
-            print("[camera] 초기화 완료")
+            self._is_initialized = self._test_camera()
+            logger.info("초기화 완료")
             
         except Exception as e:
-            print(f"[camera] 초기화 실패: {str(e)}")
+            logger.error(f"초기화 실패: {str(e)}")
             self._is_initialized = False
     
     def _test_camera(self) -> bool:
-        """카메라 작동 테스트"""
-        print("[camera] 카메라 테스트 중...")
+        """카메라 작동 테스트 (백엔드 시작)"""
+        logger.info("카메라 테스트 중...")
         try:
-            cmd = ["libcamera-still", "--list-cameras"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if "Available cameras" not in result.stdout:
-                raise Exception("카메라를 찾을 수 없습니다")
-            print("[camera] 카메라 테스트 성공")
+            self.backend.start()
+            logger.info("카메라 테스트 성공")
             return True
         except Exception as e:
-            print(f"[camera] 카메라 테스트 실패: {str(e)}")
+            logger.error(f"카메라 테스트 실패: {str(e)}")
             return False
     
     def capture(self) -> Dict:
@@ -74,57 +77,76 @@ class CameraIMX219:
             Dict: {
                 'status': 'success/error',
                 'image_path': str,
-                'message': str
+                'message': str,
+                'latency_ms': float,  # 캡처 요청부터 저장까지 걸린 시간
+                'data': bytes         # 인코딩된 이미지 (재디코딩 없이 Frame 생성용)
             }
         """
         if not self._is_initialized:
-            print("[camera] 카메라가 초기화되지 않았습니다")
+            logger.warning("카메라가 초기화되지 않았습니다")
             return {
                 'status': 'error',
                 'message': '카메라가 초기화되지 않았습니다'
             }
             
         try:
-            print("[camera] 이미지 캡처 시작...")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            start = time.perf_counter()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             image_path = self.save_dir / f"capture_{timestamp}.{self.format}"
             
-            print(f"[camera] 저장 경로: {image_path}")
-            
-            # libcamera-still 명령어 구성
-            cmd = [
-                "libcamera-still",
-                f"--width={self.resolution[0]}",
-                f"--height={self.resolution[1]}",
-                f"--rotation={self.rotation}",
-                "--nopreview",
-                "--immediate",
-                f"--output={str(image_path)}"
-            ]
-            
-            print(f"[camera] 명령어: {' '.join(cmd)}")
+            data = self.backend.grab()
+            image_path.write_bytes(data)
             
-            # 이미지 캡처
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print("[camera] 캡처 성공")
-                return {
-                    'status': 'success',
-                    'image_path': str(image_path),
-                    'message': '이미지 캡처 성공'
-                }
-            else:
-                raise Exception(f"캡처 실패: {result.stderr}")
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.latencies.append(latency_ms)
+            CAMERA_CAPTURE.observe(latency_ms / 1000)
+            logger.debug(f"캡처 성공: {image_path} ({latency_ms:.1f}ms)")
+            return {
+                'status': 'success',
+                'image_path': str(image_path),
+                'message': '이미지 캡처 성공',
+                'latency_ms': latency_ms,
+                'data': data
+            }
                 
         except Exception as e:
             error_msg = str(e)
-            print(f"[camera] 캡처 오류: {error_msg}")
+            logger.error(f"캡처 오류: {error_msg}")
             return {
                 'status': 'error',
                 'message': error_msg
             }
     
+    def capture_burst(self, count: int = 5, interval: float = 0.0) -> List[Dict]:
+        """
+        연속 촬영
+        Args:
+            count (int): 촬영 장수
+            interval (float): 촬영 간격 (초)
+        Returns:
+            List[Dict]: capture() 결과 목록
+        """
+        logger.info(f"연속 촬영 시작 ({count}장)")
+        results = []
+        for i in range(count):
+            results.append(self.capture())
+            if interval and i < count - 1:
+                time.sleep(interval)
+        return results
+    
+    def get_latency_stats(self) -> Dict:
+        """최근 캡처 지연시간 통계 (ms)"""
+        if not self.latencies:
+            return {'count': 0}
+        ordered = sorted(self.latencies)
+        return {
+            'count': len(ordered),
+            'last': self.latencies[-1],
+            'p50': ordered[len(ordered) // 2],
+            'p95': ordered[round((len(ordered) - 1) * 0.95)],
+            'max': ordered[-1]
+        }
+    
     def start_capture_session(self, duration: int = 180, interval: int = 10) -> list:
         """
         지정된 시간 동안 주기적으로 이미지 캡처
@@ -134,22 +156,53 @@ class CameraIMX219:
         Returns:
             list: 캡처된 이미지 경로 리스트
         """
-        print(f"[camera] 캡처 세션 시작 (지속시간: {duration}초, 간격: {interval}초)")
+        logger.info(f"캡처 세션 시작 (지속시간: {duration}초, 간격: {interval}초)")
         captured_images = []
         start_time = time.time()
         
         while time.time() - start_time < duration:
-            print(f"[camera] 경과 시간: {int(time.time() - start_time)}초")
+            logger.debug(f"경과 시간: {int(time.time() - start_time)}초")
             result = self.capture()
             if result['status'] == 'success':
                 captured_images.append(result['image_path'])
-                print(f"[camera] 캡처 완료: {len(captured_images)}장 촬영됨")
+                logger.info(f"캡처 완료: {len(captured_images)}장 촬영됨")
             time.sleep(interval)
         
-        print(f"[camera] 세션 종료. 총 {len(captured_images)}장 촬영")
+        logger.info(f"세션 종료. 총 {len(captured_images)}장 촬영")
         return captured_images
     
+    async def stream_capture_session(self, duration: int = 180, interval: int = 10) -> AsyncIterator[Dict]:
+        """
+        지정된 시간 동안 주기적으로 이미지를 캡처하며 한 장씩 바로 전달 (비동기 제너레이터)
+        캡처는 별도 스레드에서 실행되어 이벤트 루프를 막지 않으며,
+        소비자가 반복을 중단하면 세션도 즉시 종료됩니다.
+        Args:
+            duration (int): 촬영 지속 시간 (초)
+            interval (int): 촬영 간격 (초, 캡처 소요 시간 포함)
+        Yields:
+            Dict: capture() 결과 (status == 'success' 인 경우만)
+        """
+        logger.info(f"스트리밍 캡처 세션 시작 (지속시간: {duration}초, 간격: {interval}초)")
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        count = 0
+        
+        try:
+            while loop.time() - start_time < duration:
+                shot_time = loop.time()
+                result = await asyncio.to_thread(self.capture)
+                if result['status'] == 'success':
+                    count += 1
+                    yield result
+                
+                # 다음 촬영 시각까지 대기
+                await asyncio.sleep(max(0.0, shot_time + interval - loop.time()))
+        finally:
+            logger.info(f"스트리밍 세션 종료. 총 {count}장 촬영")
+    
     def cleanup(self):
         """리소스 정리"""
-        print("[camera] 리소스 정리")
-        self._is_initialized = False
\ No newline at end of file
+        logger.info("리소스 정리")
+        self._is_initialized = False
+        if hasattr(self, 'backend'):
+            self.backend.close()
\ No newline at end of file
@@ -0,0 +1,267 @@
+# app/hardware/camera_backends.py
+
+import io
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from itertools import cycle
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+
+
+class CaptureBackend:
+    """카메라 캡처 백엔드 인터페이스
+
+    start()에서 장치를 한 번 열어 두고, grab()은 JPEG 인코딩된 프레임 바이트를 반환합니다.
+    """
+
+    name = "base"
+
+    def start(self):
+        pass
+
+    def grab(self, timeout: float = 5.0) -> bytes:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class Picamera2Backend(CaptureBackend):
+    """상시 실행되는 Picamera2 인스턴스 (센서 초기화/AE/AWB 수렴 1회)"""
+
+    name = "picamera2"
+
+    def __init__(self, resolution: tuple, rotation: int = 0, quality: int = 90):
+        self.resolution = tuple(resolution)
+        self.rotation = rotation
+        self.quality = quality
+        self.picam2 = None
+
+    def start(self):
+        from picamera2 import Picamera2
+        from libcamera import Transform
+
+        transform = Transform(hflip=True, vflip=True) if self.rotation == 180 else Transform()
+        self.picam2 = Picamera2()
+        config = self.picam2.create_still_configuration(main={"size": self.resolution}, transform=transform)
+        self.picam2.configure(config)
+        self.picam2.options["quality"] = self.quality
+        self.picam2.start()
+        logger.info(f"Picamera2 시작: {self.resolution}")
+
+    def grab(self, timeout: float = 5.0) -> bytes:
+        buffer = io.BytesIO()
+        self.picam2.capture_file(buffer, format="jpeg")
+        return buffer.getvalue()
+
+    def close(self):
+        if self.picam2 is not None:
+            self.picam2.stop()
+            self.picam2.close()
+            self.picam2 = None
+
+
+class MjpegSplitter:
+    """MJPEG 바이트 스트림을 JPEG 프레임 단위로 분리"""
+
+    def __init__(self, max_buffer: int = 32 * 1024 * 1024):
+        self.max_buffer = max_buffer
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self._buffer += chunk
+        frames = []
+        while True:
+            start = self._buffer.find(JPEG_SOI)
+            if start < 0:
+                self._buffer.clear()
+                break
+            end = self._buffer.find(JPEG_EOI, start + 2)
+            if end < 0:
+                if start > 0:
+                    del self._buffer[:start]
+                break
+            frames.append(bytes(self._buffer[start:end + 2]))
+            del self._buffer[:end + 2]
+
+        if len(self._buffer) > self.max_buffer:
+            self._buffer.clear()
+        return frames
+
+
+class MjpegPipeBackend(CaptureBackend):
+    """libcamera-vid MJPEG 출력을 파이프로 읽는 백엔드
+
+    프로세스는 한 번만 실행되며, 읽기 스레드가 항상 최신 프레임을 보관합니다.
+    grab()은 호출 이후에 도착한 프레임을 반환합니다.
+    """
+
+    name = "mjpeg"
+
+    def __init__(self, resolution: tuple, rotation: int = 0, framerate: int = 5, quality: int = 90):
+        self.resolution = tuple(resolution)
+        self.rotation = rotation
+        self.framerate = framerate
+        self.quality = quality
+        self.process: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+        self._latest: Optional[bytes] = None
+        self._sequence = 0
+
+    def start(self):
+        cmd = [
+            "libcamera-vid",
+            "--timeout=0",
+            "--codec=mjpeg",
+            f"--quality={self.quality}",
+            f"--width={self.resolution[0]}",
+            f"--height={self.resolution[1]}",
+            f"--rotation={self.rotation}",
+            f"--framerate={self.framerate}",
+            "--nopreview",
+            "--output=-"
+        ]
+        logger.debug(f"명령어: {' '.join(cmd)}")
+        self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0)
+        self._reader = threading.Thread(target=self._read_loop, name="mjpeg-reader", daemon=True)
+        self._reader.start()
+
+    def _read_loop(self):
+        splitter = MjpegSplitter()
+        stream = self.process.stdout
+        while True:
+            chunk = stream.read(65536)
+            if not chunk:
+                break
+            frames = splitter.feed(chunk)
+            if frames:
+                with self._condition:
+                    self._latest = frames[-1]
+                    self._sequence += 1
+                    self._condition.notify_all()
+        with self._condition:
+            self._condition.notify_all()
+
+    def grab(self, timeout: float = 5.0) -> bytes:
+        with self._condition:
+            sequence = self._sequence
+            if not self._condition.wait_for(
+                    lambda: self._sequence > sequence or self.process.poll() is not None, timeout):
+                raise TimeoutError("프레임 수신 시간 초과")
+            if self._sequence == sequence:
+                raise RuntimeError("libcamera-vid 프로세스가 종료되었습니다")
+            return self._latest
+
+    def close(self):
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+            self.process = None
+
+
+class StillSubprocessBackend(CaptureBackend):
+    """사진마다 libcamera-still 프로세스를 실행하는 기존 방식 (폴백)"""
+
+    name = "libcamera-still"
+
+    def __init__(self, resolution: tuple, rotation: int = 0):
+        self.resolution = tuple(resolution)
+        self.rotation = rotation
+
+    def start(self):
+        result = subprocess.run(["libcamera-still", "--list-cameras"], capture_output=True, text=True)
+        if "Available cameras" not in result.stdout:
+            raise RuntimeError("카메라를 찾을 수 없습니다")
+
+    def grab(self, timeout: float = 10.0) -> bytes:
+        cmd = [
+            "libcamera-still",
+            f"--width={self.resolution[0]}",
+            f"--height={self.resolution[1]}",
+            f"--rotation={self.rotation}",
+            "--nopreview",
+            "--immediate",
+            "--encoding=jpg",
+            "--output=-"
+        ]
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+        if result.returncode != 0:
+            raise RuntimeError(f"캡처 실패: {result.stderr.decode(errors='replace')}")
+        return result.stdout
+
+
+class FileReplayBackend(CaptureBackend):
+    """이미지 파일을 순서대로 재생하는 백엔드 (카메라 없는 환경/테스트용)"""
+
+    name = "replay"
+
+    def __init__(self, source: Union[str, Sequence[str]], loop: bool = True, delay: float = 0.0):
+        """
+        Args:
+            source (str | list): 이미지 디렉토리 또는 파일 경로 목록
+            loop (bool): 마지막 파일 이후 처음부터 반복
+            delay (float): 캡처마다 추가할 지연 (초)
+        """
+        if isinstance(source, (str, Path)):
+            paths = sorted(p for p in Path(source).iterdir() if p.suffix.lower() in (".jpg", ".jpeg", ".png"))
+        else:
+            paths = [Path(p) for p in source]
+        if not paths:
+            raise FileNotFoundError(f"재생할 이미지가 없습니다: {source}")
+
+        self.paths = paths
+        self.delay = delay
+        self._iterator = cycle(paths) if loop else iter(paths)
+        self._lock = threading.Lock()
+
+    def grab(self, timeout: float = 5.0) -> bytes:
+        with self._lock:
+            try:
+                path = next(self._iterator)
+            except StopIteration:
+                raise RuntimeError("재생할 이미지가 더 이상 없습니다")
+        if self.delay:
+            time.sleep(self.delay)
+        return path.read_bytes()
+
+
+def create_capture_backend(name: str, resolution: tuple, rotation: int = 0) -> CaptureBackend:
+    """
+    캡처 백엔드 생성
+    Args:
+        name (str): auto / picamera2 / mjpeg / libcamera-still / replay
+            auto는 Picamera2 -> libcamera-vid(MJPEG) -> libcamera-still 순으로 선택
+            replay는 CAMERA_REPLAY_DIR 환경변수의 이미지를 재생
+        resolution (tuple): 해상도 (width, height)
+        rotation (int): 회전 각도
+    """
+    name = (name or "auto").lower()
+    if name == "auto":
+        try:
+            import picamera2  # noqa: F401
+            name = "picamera2"
+        except ImportError:
+            name = "mjpeg" if shutil.which("libcamera-vid") else "libcamera-still"
+
+    if name == "picamera2":
+        return Picamera2Backend(resolution, rotation)
+    if name == "mjpeg":
+        return MjpegPipeBackend(resolution, rotation)
+    if name == "libcamera-still":
+        return StillSubprocessBackend(resolution, rotation)
+    if name == "replay":
+        return FileReplayBackend(os.environ.get("CAMERA_REPLAY_DIR", "data/replay"))
+    raise ValueError(f"알 수 없는 카메라 백엔드: {name}")
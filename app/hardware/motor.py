@@ -4,7 +4,7 @@ import os
 
 # GPIO 선택적 임포트
 if os.environ.get('MOCK_GPIO', 'false').lower() == 'true':
-    from .gpio_mock import GPIOMock as GPIO
+    from .simulation.gpio import GPIO
 else:
     import RPi.GPIO as GPIO
 import time
@@ -12,22 +12,30 @@ import time
 logger = logging.getLogger(__name__)
 
 class MotorController:
-    def __init__(self, forward_pin=17, backward_pin=18, speed_pin=12):
+    def __init__(self, forward_pin=17, backward_pin=18, speed_pin=12, gpio=None):
+        """
+        Args:
+            forward_pin (int): 정방향 핀 번호
+            backward_pin (int): 역방향 핀 번호
+            speed_pin (int): PWM 핀 번호
+            gpio: RPi.GPIO 호환 모듈 (기본: RPi.GPIO, MOCK_GPIO면 시뮬레이션 GPIO)
+        """
+        self.gpio = gpio if gpio is not None else GPIO
         self.forward_pin = forward_pin
         self.backward_pin = backward_pin
         self.speed_pin = speed_pin
         
         # GPIO 설정
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setwarnings(False)
+        self.gpio.setmode(self.gpio.BCM)
+        self.gpio.setwarnings(False)
         
         # 핀 설정
-        GPIO.setup(self.forward_pin, GPIO.OUT)
-        GPIO.setup(self.backward_pin, GPIO.OUT)
-        GPIO.setup(self.speed_pin, GPIO.OUT)
+        self.gpio.setup(self.forward_pin, self.gpio.OUT)
+        self.gpio.setup(self.backward_pin, self.gpio.OUT)
+        self.gpio.setup(self.speed_pin, self.gpio.OUT)
         
         # PWM 설정
-        self.pwm = GPIO.PWM(self.speed_pin, 1000)  # 1kHz
+        self.pwm = self.gpio.PWM(self.speed_pin, 1000)  # 1kHz
         self.pwm.start(0)
         logger.info("모터 컨트롤러 초기화 완료")
 
@@ -38,23 +46,23 @@ class MotorController:
 
     def forward(self, speed=50):
         """정방향 회전"""
-        GPIO.output(self.forward_pin, GPIO.HIGH)
-        GPIO.output(self.backward_pin, GPIO.LOW)
+        self.gpio.output(self.forward_pin, self.gpio.HIGH)
+        self.gpio.output(self.backward_pin, self.gpio.LOW)
         self.set_speed(speed)
         logger.info(f"모터 정방향 회전 (속도: {speed}%)")
 
     def backward(self, speed=50):
         """역방향 회전"""
-        GPIO.output(self.forward_pin, GPIO.LOW)
-        GPIO.output(self.backward_pin, GPIO.HIGH)
+        self.gpio.output(self.forward_pin, self.gpio.LOW)
+        self.gpio.output(self.backward_pin, self.gpio.HIGH)
         self.set_speed(speed)
         logger.info(f"모터 역방향 회전 (속도: {speed}%)")
 
     def stop(self):
         """모터 정지"""
         self.set_speed(0)
-        GPIO.output(self.forward_pin, GPIO.LOW)
-        GPIO.output(self.backward_pin, GPIO.LOW)
+        self.gpio.output(self.forward_pin, self.gpio.LOW)
+        self.gpio.output(self.backward_pin, self.gpio.LOW)
         logger.info("모터 정지")
 
     def cleanup(self):
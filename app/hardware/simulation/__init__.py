@@ -0,0 +1,10 @@
+from .auger import AugerPlant
+from .camera import write_replay_frames
+from .clock import SimulationClock
+from .devices import SimulatedHardware
+from .gpio import GPIO, SimulatedGPIO, SimulatedPWM
+from .hcsr04 import SimulatedHCSR04
+from .hx711 import MockHX711
+
+__all__ = ['AugerPlant', 'GPIO', 'MockHX711', 'SimulatedGPIO', 'SimulatedHCSR04', 'SimulatedHardware',
+           'SimulatedPWM', 'SimulationClock', 'write_replay_frames']
@@ -0,0 +1,129 @@
+# app/hardware/simulation/auger.py
+
+import threading
+import time
+from typing import List, Optional
+
+from .gpio import SimulatedGPIO
+
+
+class AugerPlant:
+    """PWM 모터로 돌아가는 오거(사료 배출구)와 밥그릇 저울 모델
+
+    SimulatedGPIO의 방향 핀/PWM 듀티를 따라 배출 유량이 바뀌고, 배출된 사료는
+    fall_time 뒤에 밥그릇에 도달합니다 (모터를 멈춘 뒤에도 잠시 무게가 늘어남).
+    유량이 바뀌는 시점마다 구간을 나눠 기록하고 무게는 구간을 적분해 계산하므로,
+    시간 간격과 무관하게 같은 명령 순서에는 항상 같은 무게가 나옵니다.
+    """
+
+    def __init__(self,
+                 gpio: SimulatedGPIO,
+                 forward_pin: int = 17,
+                 backward_pin: int = 18,
+                 speed_pin: int = 12,
+                 max_flow: float = 20.0,
+                 stall_duty: float = 20.0,
+                 fall_time: float = 0.3,
+                 jam_clears_on_reverse: bool = True,
+                 clock=time.monotonic):
+        """
+        Args:
+            gpio (SimulatedGPIO): 모터가 연결된 GPIO
+            forward_pin (int): 정방향 핀
+            backward_pin (int): 역방향 핀
+            speed_pin (int): PWM 핀
+            max_flow (float): 듀티 100%일 때 배출 유량 (g/s)
+            stall_duty (float): 이 듀티(%) 이하에서는 모터가 돌지 않음
+            fall_time (float): 배출구에서 밥그릇까지 낙하 시간 (초)
+            jam_clears_on_reverse (bool): 역회전하면 막힘이 풀림
+            clock: 시각 함수 (SimulationClock.monotonic 등)
+        """
+        self.gpio = gpio
+        self.forward_pin = forward_pin
+        self.backward_pin = backward_pin
+        self.speed_pin = speed_pin
+        self.max_flow = max_flow
+        self.stall_duty = stall_duty
+        self.fall_time = fall_time
+        self.jam_clears_on_reverse = jam_clears_on_reverse
+        self.clock = clock
+
+        self.jammed = False
+        self._lock = threading.Lock()
+        self._settled = 0.0                     # 밥그릇에 도달이 끝난 양 (g)
+        self._segments: List[list] = []         # [시작, 끝(None이면 진행 중), 유량]
+        self._rate = 0.0
+        self.dispensed_total = 0.0
+        gpio.add_listener(self._on_pin_change)
+
+    def _pin(self, pin) -> int:
+        return self.gpio.pins.get(pin, {}).get("value", 0)
+
+    def flow(self) -> float:
+        """현재 핀 상태에서의 배출 유량 (g/s)"""
+        duty = self.gpio.duty(self.speed_pin)
+        if self.jammed or duty <= self.stall_duty:
+            return 0.0
+        if self._pin(self.forward_pin) and not self._pin(self.backward_pin):
+            return self.max_flow * (duty - self.stall_duty) / (100 - self.stall_duty)
+        return 0.0
+
+    def _on_pin_change(self, pin):
+        if pin not in (self.forward_pin, self.backward_pin, self.speed_pin):
+            return
+        if self.jam_clears_on_reverse and self._pin(self.backward_pin) and self.gpio.duty(self.speed_pin) > 0:
+            self.jammed = False
+        self._set_rate(self.flow())
+
+    def _set_rate(self, rate: float):
+        with self._lock:
+            if rate == self._rate:
+                return
+            now = self.clock()
+            if self._segments and self._segments[-1][1] is None:
+                self._segments[-1][1] = now
+            if rate > 0:
+                self._segments.append([now, None, rate])
+            self._rate = rate
+
+    def jam(self):
+        """배출구 막힘 발생 (역회전 전까지 배출 없음)"""
+        self.jammed = True
+        self._set_rate(0.0)
+
+    def remove(self, grams: float):
+        """밥그릇에서 사료 제거 (고양이가 먹음)"""
+        with self._lock:
+            self._settled -= grams
+
+    def add(self, grams: float):
+        """밥그릇에 직접 사료 추가"""
+        with self._lock:
+            self._settled += grams
+
+    def weight_at(self, now: Optional[float] = None) -> float:
+        """
+        밥그릇 무게 (g)
+        Args:
+            now (float): 시각 (기본: 현재 clock())
+        """
+        if now is None:
+            now = self.clock()
+        arrived_until = now - self.fall_time
+        with self._lock:
+            total = self._settled
+            remaining = []
+            for segment in self._segments:
+                start, end, rate = segment
+                if end is not None and end <= arrived_until:
+                    # 모두 도착한 구간은 합쳐서 정리
+                    self._settled += (end - start) * rate
+                    self.dispensed_total += (end - start) * rate
+                    total += (end - start) * rate
+                    continue
+                remaining.append(segment)
+                stop = arrived_until if end is None else min(end, arrived_until)
+                if stop > start:
+                    total += (stop - start) * rate
+            self._segments = remaining
+        return total
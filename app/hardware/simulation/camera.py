@@ -0,0 +1,50 @@
+# app/hardware/simulation/camera.py
+
+from pathlib import Path
+from typing import List
+
+
+def write_replay_frames(directory: str, count: int = 3, resolution: tuple = (640, 480), seed: int = 0) -> List[Path]:
+    """
+    FileReplayBackend로 재생할 합성 JPEG 프레임 생성 (이미 있으면 그대로 사용)
+
+    배경 잡음 위에 고양이 얼굴 모양(머리, 두 눈)을 프레임마다 조금씩 옮겨 그립니다.
+    눈은 흰자/홍채/동공/윗눈꺼풀로 그려 OpenCV 눈 검출기도 찾을 수 있습니다.
+    같은 seed는 항상 같은 바이트를 만듭니다.
+
+    Args:
+        directory (str): 저장 디렉토리
+        count (int): 프레임 수
+        resolution (tuple): 해상도 (width, height)
+        seed (int): 난수 시드
+    Returns:
+        List[Path]: 프레임 경로 (이름순)
+    """
+    import cv2
+    import numpy as np
+
+    directory = Path(directory)
+    existing = sorted(p for p in directory.glob("*") if p.suffix.lower() in (".jpg", ".jpeg", ".png"))
+    if existing:
+        return existing
+
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    width, height = resolution
+    paths = []
+    for i in range(count):
+        image = rng.integers(90, 140, size=(height, width, 3), dtype=np.uint8)
+        cx, cy = width // 2 + (i - count // 2) * width // 20, height // 2
+        radius = min(width, height) // 4
+        cv2.circle(image, (cx, cy), radius, (60, 110, 160), -1)
+        for side in (-1, 1):
+            eye = (cx + side * radius // 2, cy - radius // 5)
+            axes = (radius // 4, radius // 8)
+            cv2.ellipse(image, eye, axes, 0, 0, 360, (225, 235, 235), -1)
+            cv2.circle(image, eye, radius // 9, (30, 90, 60), -1)
+            cv2.circle(image, eye, radius // 18, (10, 10, 10), -1)
+            cv2.ellipse(image, eye, axes, 0, 180, 360, (20, 20, 20), max(2, radius // 30))
+        path = directory / f"frame_{i:03d}.jpg"
+        cv2.imwrite(str(path), image, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        paths.append(path)
+    return paths
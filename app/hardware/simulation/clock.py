@@ -0,0 +1,37 @@
+# app/hardware/simulation/clock.py
+
+import threading
+import time
+
+
+class SimulationClock:
+    """실시간보다 time_scale배 빠르게 흐르는 시뮬레이션 시계
+
+    장치 모델과 제어 루프에 clock=sim.monotonic, sleep=sim.sleep으로 주입하면
+    시뮬레이션 시간 1초가 실제로는 1/time_scale초 걸립니다.
+    """
+
+    def __init__(self, time_scale: float = 1.0):
+        """
+        Args:
+            time_scale (float): 시뮬레이션 시간 / 실제 시간 (1.0이면 실시간)
+        """
+        if time_scale <= 0:
+            raise ValueError("time_scale은 0보다 커야 합니다")
+        self.time_scale = time_scale
+        self._real_start = time.monotonic()
+        self._offset = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._offset + (time.monotonic() - self._real_start) * self.time_scale
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds / self.time_scale)
+
+    def advance(self, seconds: float):
+        """기다리지 않고 시뮬레이션 시간만 진행"""
+        with self._lock:
+            self._offset += seconds
@@ -0,0 +1,89 @@
+# app/hardware/simulation/devices.py
+
+from typing import Dict, Optional
+
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+from .auger import AugerPlant
+from .camera import write_replay_frames
+from .clock import SimulationClock
+from .gpio import SimulatedGPIO
+from .hcsr04 import SimulatedHCSR04
+from .hx711 import MockHX711
+
+class SimulatedHardware:
+    """PetFeeder 장치 전체를 시뮬레이션 모델 위에서 생성
+
+    실제 드라이버 클래스(MotorController, WeightSensor, UltrasonicSensor, CameraIMX219)를
+    그대로 쓰고, 그 아래의 핀/장치만 모델로 바꿉니다.
+
+        모터  - SimulatedGPIO + AugerPlant (PWM 듀티에 비례한 배출, 낙하 지연, 막힘)
+        무게  - MockHX711 (24비트 프레임, DOUT ready 타이밍), 값은 AugerPlant의 밥그릇 무게
+        초음파 - MockFactory 핀 + SimulatedHCSR04 (visitor_distance로 방문 재현)
+        카메라 - FileReplayBackend (replay_dir에 이미지가 없으면 합성 프레임 생성)
+    """
+
+    def __init__(self, config: Optional[Dict] = None, time_scale: float = 1.0,
+                 replay_dir: str = "data/replay", seed: int = 0):
+        """
+        Args:
+            config (dict): settings.json의 hardware 설정 (핀 번호 등)
+            time_scale (float): 장치 모델 시간 배속 (SimulationClock 참고)
+            replay_dir (str): 카메라 재생 이미지 디렉토리
+            seed (int): 센서 잡음/합성 프레임 난수 시드
+        """
+        self.config = config or {}
+        self.clock = SimulationClock(time_scale)
+        self.replay_dir = replay_dir
+        self.seed = seed
+
+        self.gpio = SimulatedGPIO()
+        self.plant = AugerPlant(self.gpio, clock=self.clock.monotonic)
+        self.visitor_distance: Optional[float] = None  # 초음파 앞 반사체 거리 (cm), None이면 없음
+
+        if not isinstance(Device.pin_factory, MockFactory):
+            Device.pin_factory = MockFactory()
+        self.pin_factory = Device.pin_factory
+
+    def create_motor(self):
+        from hardware.motor import MotorController
+        return MotorController(self.plant.forward_pin, self.plant.backward_pin, self.plant.speed_pin,
+                               gpio=self.gpio)
+
+    def create_weight_sensor(self):
+        from hardware.weight_sensor import WeightSensor
+        weight_config = self.config.get("weight_sensor", {})
+        self.hx711 = MockHX711(
+            signal=lambda elapsed: self.plant.weight_at(),
+            noise=weight_config.get("simulated_noise", 20.0),
+            seed=self.seed,
+            clock=self.clock.monotonic,
+            sleep=self.clock.sleep
+        )
+        # 시뮬레이션에는 저장된 캘리브레이션을 쓰지 않고 빈 밥그릇으로 영점 조정
+        sensor = WeightSensor(pd_sck=self.hx711.pd_sck, dout=self.hx711.dout,
+                              gain=weight_config.get("gain", 128),
+                              calibration_path=None)
+        sensor.REFERENCE_UNIT = self.hx711.reference_unit
+        return sensor
+
+    def create_ultrasonic(self):
+        from hardware.ultrasonic import UltrasonicSensor
+        ultrasonic_config = self.config.get("ultrasonic", {})
+        trigger_pin = ultrasonic_config.get("trigger_pin", 23)
+        echo_pin = ultrasonic_config.get("echo_pin", 24)
+        self.hcsr04 = SimulatedHCSR04(self.pin_factory, trigger_pin, echo_pin,
+                                      distance=lambda: self.visitor_distance)
+        return UltrasonicSensor(
+            echo_pin=echo_pin,
+            trigger_pin=trigger_pin,
+            max_distance=ultrasonic_config.get("max_distance", 1.0),
+            threshold_distance=ultrasonic_config.get("threshold_distance", 0.15)
+        )
+
+    def create_camera(self):
+        from hardware.camera import CameraIMX219
+        from hardware.camera_backends import FileReplayBackend
+        write_replay_frames(self.replay_dir, seed=self.seed)
+        return CameraIMX219(backend=FileReplayBackend(self.replay_dir))
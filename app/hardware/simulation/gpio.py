@@ -0,0 +1,113 @@
+# app/hardware/simulation/gpio.py
+
+import threading
+from typing import Callable, Dict, List
+
+
+class SimulatedPWM:
+    """RPi.GPIO.PWM 대체 (듀티 변경을 GPIO 리스너에 알림)"""
+
+    def __init__(self, gpio: "SimulatedGPIO", pin: int, frequency: float):
+        self._gpio = gpio
+        self.pin = pin
+        self.frequency = frequency
+        self.duty_cycle = 0.0
+        self.running = False
+
+    def start(self, dc):
+        self.running = True
+        self.ChangeDutyCycle(dc)
+
+    def ChangeDutyCycle(self, dc):
+        if not 0 <= dc <= 100:
+            raise ValueError("듀티는 0~100 사이여야 합니다")
+        self.duty_cycle = dc
+        self._gpio._notify(self.pin)
+
+    def ChangeFrequency(self, frequency):
+        self.frequency = frequency
+
+    def stop(self):
+        self.running = False
+        self._gpio._notify(self.pin)
+
+    @property
+    def effective_duty(self) -> float:
+        return self.duty_cycle if self.running else 0.0
+
+
+class SimulatedGPIO:
+    """RPi.GPIO 모듈 대체 (결정적 동작)
+
+    출력 핀은 마지막으로 쓴 값을, 입력 핀은 set_input()으로 지정한 값을 읽습니다.
+    핀/PWM 상태가 바뀌면 add_listener()로 등록한 장치 모델(모터 등)에 알립니다.
+    """
+
+    BCM = "BCM"
+    BOARD = "BOARD"
+    OUT = "OUT"
+    IN = "IN"
+    HIGH = 1
+    LOW = 0
+
+    def __init__(self):
+        self.mode = None
+        self.warnings = True
+        self.pins: Dict[int, Dict] = {}
+        self.pwm_instances: Dict[int, SimulatedPWM] = {}
+        self._listeners: List[Callable[[int], None]] = []
+        self._lock = threading.RLock()
+
+    def setmode(self, mode):
+        self.mode = mode
+
+    def setwarnings(self, flag):
+        self.warnings = flag
+
+    def setup(self, pin, mode, initial=LOW):
+        with self._lock:
+            self.pins[pin] = {"mode": mode, "value": initial}
+
+    def output(self, pin, value):
+        with self._lock:
+            if pin not in self.pins or self.pins[pin]["mode"] != self.OUT:
+                raise RuntimeError(f"출력으로 설정되지 않은 핀입니다: {pin}")
+            self.pins[pin]["value"] = int(bool(value))
+        self._notify(pin)
+
+    def input(self, pin):
+        with self._lock:
+            if pin not in self.pins:
+                raise RuntimeError(f"설정되지 않은 핀입니다: {pin}")
+            return self.pins[pin]["value"]
+
+    def set_input(self, pin, value):
+        """입력 핀 값 지정 (장치 모델이 사용)"""
+        with self._lock:
+            self.pins.setdefault(pin, {"mode": self.IN, "value": 0})["value"] = int(bool(value))
+
+    def PWM(self, pin, frequency):
+        pwm = SimulatedPWM(self, pin, frequency)
+        self.pwm_instances[pin] = pwm
+        return pwm
+
+    def duty(self, pin) -> float:
+        """핀의 현재 PWM 듀티 (%), PWM이 없으면 0"""
+        pwm = self.pwm_instances.get(pin)
+        return pwm.effective_duty if pwm is not None else 0.0
+
+    def add_listener(self, callback: Callable[[int], None]):
+        """핀/PWM 상태 변경 시 callback(pin) 호출"""
+        self._listeners.append(callback)
+
+    def _notify(self, pin):
+        for callback in list(self._listeners):
+            callback(pin)
+
+    def cleanup(self):
+        self.pins.clear()
+        self.pwm_instances.clear()
+
+
+# MOCK_GPIO 환경에서 `import RPi.GPIO as GPIO` 대신 사용하는 공용 인스턴스
+GPIO = SimulatedGPIO()
@@ -0,0 +1,68 @@
+# app/hardware/simulation/hcsr04.py
+
+from typing import Callable, Optional, Union
+
+from gpiozero.pins.mock import MockFactory, MockPin
+
+SOUND_CM_PER_SECOND = 34300  # 음속 (cm/s), hardware.ultrasonic과 같은 값
+NO_ECHO_PULSE = 0.038        # 반사체가 없을 때 HC-SR04가 내보내는 에코 펄스 (초)
+TRIGGER_LATENCY = 0.0005     # 트리거 하강 후 초음파 발사까지 지연 (초)
+
+
+class _EchoPin(MockPin):
+    """에지 시각(tick)을 모델이 계산한 값으로 기록하는 Echo 핀"""
+
+    def drive_at(self, state: bool, ticks: float):
+        if self._change_state(state):
+            self._last_change = ticks
+            if self._edges in ('both', 'rising' if state else 'falling') and self._when_changed is not None:
+                self._call_when_changed()
+
+
+class _TriggerPin(MockPin):
+    def __init__(self, factory, info, sensor: "SimulatedHCSR04" = None):
+        super().__init__(factory, info)
+        self.sensor = sensor
+
+    def _set_state(self, value):
+        was_high = self._state
+        super()._set_state(value)
+        if was_high and not value and self.sensor is not None:
+            self.sensor._fire(self._last_change)
+
+
+class SimulatedHCSR04:
+    """HC-SR04 에코 모델 (gpiozero MockFactory 핀)
+
+    Trigger 펄스가 끝나면 거리에 해당하는 왕복 시간만큼의 Echo 펄스를 바로 만들되,
+    에지 tick은 물리적으로 발생했어야 할 시각으로 기록합니다. 실제로 기다리지 않으므로
+    실시간보다 빠르고, 스레드 스케줄링과 무관하게 측정 거리가 항상 같습니다.
+    """
+
+    def __init__(self,
+                 factory: MockFactory,
+                 trigger_pin: int = 23,
+                 echo_pin: int = 24,
+                 distance: Union[None, float, Callable[[], Optional[float]]] = None):
+        """
+        Args:
+            factory (MockFactory): gpiozero 모의 핀 팩토리 (Device.pin_factory)
+            trigger_pin (int): Trigger 핀 번호
+            echo_pin (int): Echo 핀 번호
+            distance (float | Callable): 반사체까지 거리 (cm) 또는 거리 함수, None이면 반사체 없음
+        """
+        self.distance = distance
+        self.pings = 0
+        self.echo = factory.pin(echo_pin, pin_class=_EchoPin)
+        self.trigger = factory.pin(trigger_pin, pin_class=_TriggerPin, sensor=self)
+
+    def current_distance(self) -> Optional[float]:
+        return self.distance() if callable(self.distance) else self.distance
+
+    def _fire(self, ticks: float):
+        self.pings += 1
+        distance = self.current_distance()
+        pulse = NO_ECHO_PULSE if distance is None else 2 * distance / SOUND_CM_PER_SECOND
+        rise = ticks + TRIGGER_LATENCY
+        self.echo.drive_at(True, rise)
+        self.echo.drive_at(False, rise + pulse)
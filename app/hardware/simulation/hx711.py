@@ -0,0 +1,139 @@
+# app/hardware/simulation/hx711.py
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+
+class _MockClockPin:
+    """PD_SCK 출력 (DigitalOutputDevice 대체)"""
+
+    def __init__(self, chip: "MockHX711"):
+        self._chip = chip
+        self.value = 0
+
+    def on(self):
+        self.value = 1
+        self._chip._clock_pulse()
+
+    def off(self):
+        self.value = 0
+
+    def close(self):
+        pass
+
+
+class _MockDataPin:
+    """DOUT 입력 (DigitalInputDevice 대체) - 변환 완료 시 LOW"""
+
+    def __init__(self, chip: "MockHX711"):
+        self._chip = chip
+
+    @property
+    def value(self) -> int:
+        return self._chip._dout_level()
+
+    def wait_for_inactive(self, timeout: Optional[float] = None) -> bool:
+        return self._chip._wait_ready(timeout)
+
+    def close(self):
+        pass
+
+
+class MockHX711:
+    """HX711 신호 발생기
+
+    sample_rate 주기로 변환을 완료하고, PD_SCK 펄스마다 24비트 2의 보수 값을
+    MSB부터 DOUT으로 내보냅니다. WeightSensor(pd_sck=mock.pd_sck, dout=mock.dout)로
+    주입해 실제 드라이버 코드(비트 뱅잉 포함)를 그대로 실행할 수 있습니다.
+    """
+
+    def __init__(self,
+                 signal: Optional[Callable[[float], float]] = None,
+                 reference_unit: float = 400.0,
+                 offset: int = 8000,
+                 noise: float = 0.0,
+                 sample_rate: float = 80.0,
+                 seed: int = 0,
+                 clock=time.monotonic,
+                 sleep=time.sleep):
+        """
+        Args:
+            signal: 경과 시간(초) -> 무게(g) 함수 (기본: set_weight()로 지정한 값)
+            reference_unit (float): 1g당 raw 값
+            offset (int): 0g일 때 raw 값
+            noise (float): raw 값 가우시안 잡음 표준편차
+            sample_rate (float): 초당 변환 횟수 (HX711: 10 또는 80)
+            seed (int): 잡음 난수 시드
+            clock: 시각 함수
+            sleep: 변환 완료 대기 함수 (clock과 같은 시간 척도)
+        """
+        self.signal = signal
+        self.reference_unit = reference_unit
+        self.offset = offset
+        self.noise = noise
+        self.period = 1.0 / sample_rate
+        self.clock = clock
+        self.sleep = sleep
+        self._random = random.Random(seed)
+        self._weight = 0.0
+        self._lock = threading.Lock()
+
+        self._started_at = clock()
+        self._ready_at = self._started_at + self.period
+        self._shift_value = 0
+        self._shifting = False
+        self._bit_index = 0
+        self._dout = 1
+        self.conversions = 0
+
+        self.pd_sck = _MockClockPin(self)
+        self.dout = _MockDataPin(self)
+
+    def set_weight(self, grams: float):
+        """signal이 없을 때 출력할 무게 (g)"""
+        self._weight = grams
+
+    def weight_at(self, elapsed: float) -> float:
+        return self.signal(elapsed) if self.signal else self._weight
+
+    def raw_value(self, now: float) -> int:
+        raw = self.offset + self.weight_at(now - self._started_at) * self.reference_unit
+        if self.noise:
+            raw += self._random.gauss(0.0, self.noise)
+        return max(-(1 << 23), min((1 << 23) - 1, int(round(raw))))
+
+    def _dout_level(self) -> int:
+        with self._lock:
+            if self._shifting:
+                return self._dout
+            return 0 if self.clock() >= self._ready_at else 1
+
+    def _wait_ready(self, timeout: Optional[float]) -> bool:
+        remaining = self._ready_at - self.clock()
+        if remaining > 0:
+            if timeout is not None and remaining > timeout:
+                time.sleep(timeout)
+                return False
+            self.sleep(remaining)
+        return True
+
+    def _clock_pulse(self):
+        with self._lock:
+            if self._shifting and self._bit_index == 24:
+                # 25번째 펄스: 다음 변환까지 DOUT HIGH (이후 게인 펄스는 무시)
+                self._shifting = False
+                return
+            if not self._shifting:
+                now = self.clock()
+                if now < self._ready_at:
+                    return
+                self._shift_value = self.raw_value(now) & 0xFFFFFF
+                self._shifting = True
+                self._bit_index = 0
+                self._ready_at = now + self.period
+                self.conversions += 1
+
+            self._dout = (self._shift_value >> (23 - self._bit_index)) & 1
+            self._bit_index += 1
@@ -1,113 +1,196 @@
 # app/hardware/ultrasonic.py
 
+import logging
 from gpiozero import DigitalOutputDevice, DigitalInputDevice
+import math
+import statistics
+import threading
 import time
 from typing import Optional
 
+from utils.metrics import ULTRASONIC_PING
+from utils.ring_buffer import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+SOUND_CM_PER_SECOND = 34300  # 음속 (cm/s)
+
 class UltrasonicSensor:
-    """HC-SR04 초음파 센서 클래스"""
-    
-    def __init__(self, echo_pin=24, trigger_pin=23):
+    """HC-SR04 초음파 센서 클래스
+
+    에코 핀의 에지 콜백에서 핀 드라이버가 제공하는 tick(에지 발생 시각)을 기록해
+    펄스 폭을 계산하므로, 루프로 핀 값을 확인하는 방식보다 지연/흔들림이 작습니다.
+    start_continuous() 이후에는 백그라운드 스레드가 주기적으로 측정해 링 버퍼에 쌓고,
+    check_obstacle()은 최신 측정값만 확인합니다.
+    """
+
+    def __init__(self, echo_pin=24, trigger_pin=23, max_distance=1.0, threshold_distance=0.15,
+                 buffer_size=256):
         """
         Args:
             echo_pin (int): Echo 핀 번호 (기본값: 24)
             trigger_pin (int): Trigger 핀 번호 (기본값: 23)
+            max_distance (float): 최대 측정 거리 (m), 이보다 멀면 측정 실패로 처리
+            threshold_distance (float): 물체 감지 임계 거리 (m)
+            buffer_size (int): 연속 측정 링 버퍼 크기
         """
+        self.max_distance_cm = max_distance * 100
+        self.threshold_cm = threshold_distance * 100
+        # 최대 거리 왕복 시간 + 센서 응답 지연 여유
+        self.echo_timeout = 2 * self.max_distance_cm / SOUND_CM_PER_SECOND + 0.03
+        self.readings = RingBuffer(buffer_size)   # (time.monotonic(), cm), 실패는 NaN
+        self.stale_after = 0.5  # 연속 측정값 유효 시간 (초)
+
+        self._ping_lock = threading.Lock()
+        self._echo_done = threading.Event()
+        self._rise_ticks = None
+        self._pulse_seconds: Optional[float] = None
+        self._ranger: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
         try:
-            print("[ultrasonic] 초음파 센서 초기화 시작...")
-            print(f"[ultrasonic] 설정: echo={echo_pin}, trigger={trigger_pin}")
-            
+            logger.info("초음파 센서 초기화 시작...")
+            logger.debug(f"설정: echo={echo_pin}, trigger={trigger_pin}")
+
             self.echo = DigitalInputDevice(echo_pin)
             self.trigger = DigitalOutputDevice(trigger_pin)
+            # 에코 에지마다 핀 드라이버의 tick으로 시각 기록
+            self._ticks_diff = self.echo.pin_factory.ticks_diff
+            self.echo.pin.when_changed = self._on_echo_edge
             self._is_initialized = True
-            
-            print("[ultrasonic] 초기화 완료")
-            
+
+            logger.info("초기화 완료")
+
         except Exception as e:
-            print(f"[ultrasonic] 초기화 실패: {str(e)}")
+            logger.error(f"초기화 실패: {str(e)}")
             self._is_initialized = False
-    
-    def get_distance(self) -> Optional[float]:
-        """거리 측정 (센티미터 단위로 반환)"""
+
+    def _on_echo_edge(self, ticks, state):
+        if state:
+            self._rise_ticks = ticks
+        elif self._rise_ticks is not None:
+            self._pulse_seconds = self._ticks_diff(ticks, self._rise_ticks)
+            self._rise_ticks = None
+            self._echo_done.set()
+
+    def get_pulse_duration(self) -> Optional[float]:
+        """초음파 센서의 펄스 지속 시간 반환 (초), 응답이 없으면 None"""
         if not self._is_initialized:
-            print("[ultrasonic] 센서가 초기화되지 않았습니다")
             return None
-            
+
         try:
-            # 트리거 신호 전송
-            self.trigger.on()
-            time.sleep(0.00001)  # 10μs
-            self.trigger.off()
-            
-            # 에코 신호 대기
-            pulse_start = time.time()
-            while not self.echo.value:
-                pulse_start = time.time()
-                if time.time() - pulse_start > 0.1:  # 타임아웃
-                    return None
-            
-            # 에코 신호 수신
-            pulse_end = time.time()
-            while self.echo.value:
-                pulse_end = time.time()
-                if time.time() - pulse_start > 0.1:  # 타임아웃
-                    return None
-            
-            # 거리 계산
-            pulse_duration = pulse_end - pulse_start
-            distance = pulse_duration * 17150  # (340m/s * 100cm/m) / 2
-            
-            return round(distance, 2)
-            
+            with self._ping_lock:
+                self._echo_done.clear()
+                self._rise_ticks = None
+                self._pulse_seconds = None
+
+                start = time.perf_counter()
+                self.trigger.on()
+                time.sleep(0.00001)  # 10μs
+                self.trigger.off()
+
+                received = self._echo_done.wait(self.echo_timeout)
+                ULTRASONIC_PING.observe(time.perf_counter() - start)
+                return self._pulse_seconds if received else None
+
         except Exception as e:
-            print(f"[ultrasonic] 거리 측정 실패: {str(e)}")
+            logger.error(f"펄스 측정 실패: {str(e)}")
+            return None
+
+    def get_distance(self) -> Optional[float]:
+        """거리 측정 (센티미터 단위로 반환), 측정 범위를 벗어나면 None"""
+        if not self._is_initialized:
+            logger.warning("센서가 초기화되지 않았습니다")
             return None
-    
+
+        pulse_duration = self.get_pulse_duration()
+        if pulse_duration is None:
+            return None
+
+        # 거리 계산 (왕복 시간의 절반)
+        distance = pulse_duration * SOUND_CM_PER_SECOND / 2
+        if distance > self.max_distance_cm:
+            return None
+        return round(distance, 2)
+
+    def measure(self, pings=5, interval=0.06) -> Optional[float]:
+        """
+        여러 번 측정한 거리의 중앙값 (cm)
+        Args:
+            pings (int): 측정 횟수
+            interval (float): 측정 간격 (초), 이전 초음파 잔향이 사라질 시간
+        """
+        distances = []
+        for i in range(pings):
+            if i:
+                time.sleep(interval)
+            distance = self.get_distance()
+            if distance is not None:
+                distances.append(distance)
+        # 절반 이상 실패하면 신뢰할 수 없는 측정으로 처리
+        if len(distances) * 2 < pings:
+            return None
+        return statistics.median(distances)
+
+    def start_continuous(self, rate=10.0, pings=1):
+        """
+        백그라운드 연속 측정 시작
+        Args:
+            rate (float): 초당 측정 횟수
+            pings (int): 측정 1회당 중앙값을 낼 핑 수
+        """
+        if self._ranger is not None and self._ranger.is_alive():
+            return
+        self._stop_event.clear()
+        self._ranger = threading.Thread(target=self._range_loop, args=(1.0 / rate, pings),
+                                        name="ultrasonic-ranger", daemon=True)
+        self._ranger.start()
+        logger.info(f"연속 측정 시작 ({rate}Hz)")
+
+    def stop_continuous(self):
+        """백그라운드 연속 측정 중지"""
+        self._stop_event.set()
+        if self._ranger is not None:
+            self._ranger.join(timeout=2)
+            self._ranger = None
+
+    @property
+    def is_continuous(self):
+        return self._ranger is not None and self._ranger.is_alive()
+
+    def _range_loop(self, period, pings):
+        next_time = time.monotonic()
+        while not self._stop_event.is_set():
+            distance = self.measure(pings, interval=min(0.06, period / pings)) if pings > 1 else self.get_distance()
+            self.readings.append(time.monotonic(), math.nan if distance is None else distance)
+            next_time = max(next_time + period, time.monotonic())
+            self._stop_event.wait(next_time - time.monotonic())
+
+    def latest_distance(self) -> Optional[float]:
+        """연속 측정의 최신 거리 (cm), 측정 실패/오래된 값이면 None"""
+        latest = self.readings.latest()
+        if latest is None or time.monotonic() - latest[0] > self.stale_after or math.isnan(latest[1]):
+            return None
+        return latest[1]
+
     def check_obstacle(self) -> bool:
-        """물체가 임계값(15cm)보다 가까이 있는지 확인[4]"""
+        """물체가 임계 거리보다 가까이 있는지 확인 (연속 측정 중이면 대기 없이 최신 값 사용)"""
         if not self._is_initialized:
-            print("[ultrasonic] 센서가 초기화되지 않았습니다")
+            logger.warning("센서가 초기화되지 않았습니다")
             return False
-        distance = self.get_distance()
+        distance = self.latest_distance() if self.is_continuous else self.get_distance()
         if distance is None:
             return False
-        is_detected = distance <= 15.0
+        is_detected = distance <= self.threshold_cm
         if is_detected:
-            print(f"[ultrasonic] 물체 감지! (거리: {distance:.1f}cm)")
+            logger.info(f"물체 감지! (거리: {distance:.1f}cm)")
         return is_detected
-    
+
     def cleanup(self):
         """센서 리소스 정리"""
-        print("[ultrasonic] 리소스 정리")
+        logger.info("리소스 정리")
+        self.stop_continuous()
         if hasattr(self, 'trigger'):
             self.trigger.close()
         if hasattr(self, 'echo'):
             self.echo.close()
-
-    def get_pulse_duration(self) -> Optional[float]:
-        """초음파 센서의 펄스 지속 시간 반환"""
-        if not self._is_initialized:
-            return None
-        
-        try:
-            self.trigger.on()
-            time.sleep(0.00001)  # 10μs
-            self.trigger.off()
-            
-            pulse_start = time.time()
-            while not self.echo.value:
-                pulse_start = time.time()
-                if time.time() - pulse_start > 0.1:  # 타임아웃
-                    return None
-            
-            pulse_end = time.time()
-            while self.echo.value:
-                pulse_end = time.time()
-                if time.time() - pulse_start > 0.1:  # 타임아웃
-                    return None
-            
-            return pulse_end - pulse_start
-            
-        except Exception as e:
-            print(f"[ultrasonic] 펄스 측정 실패: {str(e)}")
-            return None
@@ -1,35 +1,83 @@
+import logging
 from gpiozero import DigitalInputDevice, DigitalOutputDevice
+import threading
 import time
 from typing import Optional, Tuple
-import statistics
 import json
 import os
 
+from utils.metrics import HX711_READ
+from utils.ring_buffer import RingBuffer
+from utils.signal_filters import build_filter_pipeline
+
+logger = logging.getLogger(__name__)
+
 class WeightSensor:
-    """HX711 무게 센서 클래스"""
-    
-    def __init__(self, dout_pin=14, sck_pin=15, gain=128):
+    """HX711 무게 센서 클래스
+
+    start_sampling() 이후에는 백그라운드 스레드가 변환 완료(DOUT LOW) 에지를 기다려
+    raw 값을 계속 읽어 링 버퍼에 쌓고, 필터(중앙값/칼만 등)를 거친 무게와 안정 여부를
+    갱신합니다. get_weight()는 최신 필터 값을 즉시 반환합니다.
+    """
+
+    def __init__(self, dout_pin=14, sck_pin=15, gain=128,
+                 pd_sck=None, dout=None, buffer_size=1024, average_samples=3, auto_start=True,
+                 filter_config=None, calibration_path='weight_calibration.json'):
+        """
+        Args:
+            dout_pin (int): DOUT 핀 번호
+            sck_pin (int): PD_SCK 핀 번호
+            gain (int): 게인 (128 또는 64)
+            pd_sck: PD_SCK 출력 장치 (테스트용 주입, 기본: DigitalOutputDevice)
+            dout: DOUT 입력 장치 (테스트용 주입, 기본: DigitalInputDevice)
+            buffer_size (int): 링 버퍼 크기 (샘플 수)
+            average_samples (int): get_weight()에서 평균할 최근 샘플 수
+            auto_start (bool): 초기화 후 백그라운드 샘플링 시작
+            filter_config (dict): 필터 설정 (utils.signal_filters.build_filter_pipeline 참고)
+            calibration_path (str): 캘리브레이션 데이터 파일 (있으면 영점 조정 생략, None이면 항상 영점 조정)
+        """
+        self.samples = RingBuffer(buffer_size)           # raw 값
+        self.filtered = RingBuffer(buffer_size)          # 필터를 거친 무게 (g)
+        self.filters = build_filter_pipeline(filter_config)
+        self.stable = False
+        self.weight_std = 0.0
+        self.average_samples = average_samples
+        self.calibration_path = calibration_path
+        self.stale_after = 0.5  # 이보다 오래된 샘플만 있으면 직접 측정 (초)
+        self.read_timeout = 1.0
+        self._bus_lock = threading.Lock()
+        self._filter_lock = threading.Lock()  # 필터 상태/영점 (샘플링 스레드와 tare/calibrate 사이)
+        self._sample_ready = threading.Condition()
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
         try:
-            print("[weight] 무게 센서 초기화 시작...")
-            print(f"[weight] 설정: DOUT={dout_pin}, SCK={sck_pin}, GAIN={gain}")
-            
-            self.pd_sck = DigitalOutputDevice(sck_pin)
-            self.dout = DigitalInputDevice(dout_pin)
-            
+            logger.info("무게 센서 초기화 시작...")
+            logger.debug(f"설정: DOUT={dout_pin}, SCK={sck_pin}, GAIN={gain}")
+
+            self.pd_sck = pd_sck if pd_sck is not None else DigitalOutputDevice(sck_pin)
+            self.dout = dout if dout is not None else DigitalInputDevice(dout_pin)
+
             self.GAIN = 0
             self.REFERENCE_UNIT = 1
             self.OFFSET = 0
-            
+
             self.set_gain(gain)
             self._is_initialized = True
-            
-            # 영점 조정
-            print("[weight] 캘리브레이션 데이터가 없습니다. 영점 조정을 실행합니다...")
-            self.tare()
-            print("[weight] 초기화 완료")
-            
+
+            # 저장된 캘리브레이션이 있으면 그대로 사용 (영점 조정은 약 1.5초 소요)
+            if self.load_calibration():
+                logger.info(f"캘리브레이션 데이터 로드: {self.calibration_path}")
+            else:
+                logger.info("캘리브레이션 데이터가 없습니다. 영점 조정을 실행합니다...")
+                self.tare()
+            logger.info("초기화 완료")
+
+            if auto_start:
+                self.start_sampling()
+
         except Exception as e:
-            print(f"[weight] 초기화 실패: {str(e)}")
+            logger.error(f"초기화 실패: {str(e)}")
             self._is_initialized = False
 
     def is_ready(self):
@@ -42,99 +90,206 @@ class WeightSensor:
             self.GAIN = 3
         else:
             raise ValueError("게인은 128 또는 64만 설정 가능합니다.")
-        
+
         self.pd_sck.off()
         self.read()
 
-    def read(self):
+    def _wait_ready(self, timeout):
+        """변환 완료(DOUT LOW)까지 에지 이벤트로 대기"""
+        deadline = time.monotonic() + timeout
         while not self.is_ready():
-            pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.dout.wait_for_inactive(remaining):
+                raise TimeoutError("HX711 응답 시간 초과")
+
+    def read(self, timeout=None):
+        with self._bus_lock:
+            self._wait_ready(self.read_timeout if timeout is None else timeout)
+            start = time.perf_counter()
 
-        dataBits = [0] * 24
-        for i in range(24):
-            self.pd_sck.on()
-            dataBits[i] = self.dout.value
-            self.pd_sck.off()
+            # 속성 조회를 줄이기 위해 메서드를 지역 변수로 바인딩
+            clock_on = self.pd_sck.on
+            clock_off = self.pd_sck.off
+            dout = self.dout
 
-        for i in range(self.GAIN):
-            self.pd_sck.on()
-            self.pd_sck.off()
+            dataBytes = 0
+            for _ in range(24):
+                clock_on()
+                dataBytes = (dataBytes << 1) | dout.value
+                clock_off()
 
-        dataBytes = 0
-        for i in range(24):
-            dataBytes = (dataBytes << 1) | dataBits[i]
+            for _ in range(self.GAIN):
+                clock_on()
+                clock_off()
+            HX711_READ.observe(time.perf_counter() - start)
 
-        if dataBits[0]:
-            dataBytes = dataBytes - (1 << 24)
+        if dataBytes & 0x800000:
+            dataBytes -= 1 << 24
 
         return dataBytes
 
+    def start_sampling(self):
+        """백그라운드 샘플링 시작"""
+        if self._sampler is not None and self._sampler.is_alive():
+            return
+        self._stop_event.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="hx711-sampler", daemon=True)
+        self._sampler.start()
+        logger.info("백그라운드 샘플링 시작")
+
+    def stop_sampling(self):
+        """백그라운드 샘플링 중지"""
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=2)
+            self._sampler = None
+
+    @property
+    def is_sampling(self):
+        return self._sampler is not None and self._sampler.is_alive()
+
+    def _sample_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                value = self.read()
+                timestamp = time.monotonic()
+                self.samples.append(timestamp, value)
+                with self._filter_lock:
+                    result = self.filters.update((value - self.OFFSET) / self.REFERENCE_UNIT)
+                    self.filtered.append(timestamp, result.value)
+                    self.stable = result.stable
+                    self.weight_std = result.std
+            except TimeoutError:
+                continue
+            except Exception as e:
+                # 오류가 나도 샘플링 스레드는 계속 실행 (멈추면 모든 읽기가 직접 측정으로 바뀜)
+                logger.error(f"샘플링 오류: {str(e)}")
+                self._stop_event.wait(0.1)
+                continue
+            with self._sample_ready:
+                self._sample_ready.notify_all()
+
+    def _wait_new_samples(self, times):
+        """샘플링 스레드가 새 샘플 times개를 쌓을 때까지 대기"""
+        start = self.samples.total
+        timeout = self.read_timeout * times
+        with self._sample_ready:
+            if not self._sample_ready.wait_for(lambda: self.samples.total - start >= times, timeout):
+                raise TimeoutError("HX711 샘플 수집 시간 초과")
+        return self.samples.since(start)[1][:times]
+
+    def get_raw(self):
+        """최신 raw 값 (최근 average_samples개 평균), 샘플이 오래됐으면 직접 측정"""
+        latest = self.samples.latest()
+        if self.is_sampling and latest is not None and time.monotonic() - latest[0] <= self.stale_after:
+            return float(self.samples.last(self.average_samples)[1].mean())
+        return self.read_average(self.average_samples)
+
+    def get_reading(self):
+        """최신 필터 무게와 안정 여부 {'weight', 'stable', 'std', 'timestamp'}, 샘플링 중이 아니면 None"""
+        latest = self.filtered.latest()
+        if not self.is_sampling or latest is None or time.monotonic() - latest[0] > self.stale_after:
+            return None
+        return {'weight': latest[1], 'stable': self.stable, 'std': self.weight_std, 'timestamp': latest[0]}
+
+    def wait_until_stable(self, timeout=5.0):
+        """
+        무게가 안정될 때까지 대기 후 반환
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+        Returns:
+            float | None: 안정된 무게 (g), 시간 초과 시 None
+        """
+        with self._sample_ready:
+            if not self._sample_ready.wait_for(lambda: self.stable, timeout):
+                return None
+        reading = self.get_reading()
+        return reading['weight'] if reading else None
+
     def get_weight(self):
         if not self._is_initialized:
-            print("[weight] 센서가 초기화되지 않았습니다")
+            logger.warning("센서가 초기화되지 않았습니다")
             return None
-            
+
+        reading = self.get_reading()
+        if reading is not None:
+            return reading['weight']
+
         try:
-            value = self.read_average() - self.OFFSET
+            value = self.get_raw() - self.OFFSET
             value = value / self.REFERENCE_UNIT
             return value
         except Exception as e:
-            print(f"[weight] 무게 측정 실패: {str(e)}")
+            logger.error(f"무게 측정 실패: {str(e)}")
             return None
 
     def read_average(self, times=3):
+        # 샘플링 중이면 버스를 직접 읽지 않고 새로 들어오는 샘플을 사용
+        if self.is_sampling:
+            return float(self._wait_new_samples(times).mean())
         total = 0
         for _ in range(times):
             total += self.read()
-            time.sleep(0.1)
         return total / times
 
     def tare(self, times=15):
-        print("[weight] 영점 조정 시작 (샘플 수: {times})")
+        logger.info(f"영점 조정 시작 (샘플 수: {times})")
         self.OFFSET = self.read_average(times)
-        print("[weight] 영점 조정 완료")
+        self._reset_filters()
+        logger.info("영점 조정 완료")
+
+    def _reset_filters(self):
+        """영점/기준 단위가 바뀌면 이전 무게 기준의 필터 상태를 버림"""
+        with self._filter_lock:
+            self.filters.reset()
+            self.stable = False
 
     def calibrate(self, known_weight: float, times: int = 15) -> Tuple[bool, float]:
-        print(f"[weight] 캘리브레이션 시작 (기준 무게: {known_weight}g)")
+        logger.info(f"캘리브레이션 시작 (기준 무게: {known_weight}g)")
         try:
             self.tare(times)
             measured_value = self.read_average(times)
             self.REFERENCE_UNIT = abs(measured_value / known_weight)
-            print(f"[weight] 캘리브레이션 완료 (reference_unit: {self.REFERENCE_UNIT})")
+            self._reset_filters()
+            logger.info(f"캘리브레이션 완료 (reference_unit: {self.REFERENCE_UNIT})")
             return True, self.REFERENCE_UNIT
         except Exception as e:
-            print(f"[weight] 캘리브레이션 실패: {str(e)}")
+            logger.error(f"캘리브레이션 실패: {str(e)}")
             return False, 0
 
     def save_calibration(self) -> bool:
         """캘리브레이션 데이터 저장"""
+        if not self.calibration_path:
+            return False
         try:
             calibration_data = {
                 'reference_unit': self.REFERENCE_UNIT,
                 'offset': self.OFFSET
             }
-            with open('weight_calibration.json', 'w') as f:
+            with open(self.calibration_path, 'w') as f:
                 json.dump(calibration_data, f)
             return True
         except Exception as e:
-            print(f"캘리브레이션 데이터 저장 실패: {str(e)}")
+            logger.error(f"캘리브레이션 데이터 저장 실패: {str(e)}")
             return False
 
     def load_calibration(self) -> bool:
         """저장된 캘리브레이션 데이터 로드"""
         try:
-            if os.path.exists('weight_calibration.json'):
-                with open('weight_calibration.json', 'r') as f:
+            if self.calibration_path and os.path.exists(self.calibration_path):
+                with open(self.calibration_path, 'r') as f:
                     data = json.load(f)
                 self.REFERENCE_UNIT = data['reference_unit']
                 self.OFFSET = data['offset']
+                self._reset_filters()
                 return True
             return False
         except Exception as e:
-            print(f"캘리브레이션 데이터 로드 실패: {str(e)}")
+            logger.error(f"캘리브레이션 데이터 로드 실패: {str(e)}")
             return False
 
     def cleanup(self):
+        self.stop_sampling()
         if hasattr(self, 'pd_sck'):
             self.pd_sck.close()
         if hasattr(self, 'dout'):
@@ -5,29 +5,28 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime
+from dataclasses import asdict
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, WebSocket
+import uvicorn
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from hardware import MotorController, CameraIMX219, UltrasonicSensor, WeightSensor
 from core.task_scheduler import RTOSScheduler
 from core.task_executor import TaskExecutor
+from core.async_executor import AsyncTaskExecutor
 from core.firebase_manager import FirebaseManager
-from models.eye_detection import EyeDetectionModel
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('logs/pet_feeder.log', encoding='utf-8')
-    ]
-)
+from core.object_storage import build_storage
+from core.startup import StartupOrchestrator
+from core.telemetry import CONTROL_TOPIC, Subscription, TelemetryHub, parse_subscription, parse_topics
+from services.feeding_service import COMPLETED_STATUSES, FeedingTrigger
+from api.routes import router as schedule_router
+from utils.logging_setup import setup_logging, shutdown_logging
+from utils import metrics
+
 logger = logging.getLogger(__name__)
 
 # GPIO 모드 설정
@@ -45,13 +44,22 @@ class PetFeeder:
     def __init__(self):
         """시스템 초기화"""
         self.config = self._load_config()
+        startup_config = self.config.get("startup", {})
+        self.startup = StartupOrchestrator(max_workers=startup_config.get("max_workers", 4))
         self._init_directories()
         self._init_hardware()
         self._init_components()
         self._init_api()
         
+        # 모델 스택(TFLite, OpenCV)은 첫 카메라 세션에서 로드하거나 백그라운드에서 미리 로드
+        if startup_config.get("warm_up_models", True):
+            self.eye_detector.start_warmup()
+            self.image_publisher.start_warmup()
+        
         self.running = True
-        logger.info("시스템 초기화 완료")
+        timings = self.startup.report()
+        breakdown = ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in timings["components"].items())
+        logger.info(f"시스템 초기화 완료 ({timings['total']:.2f}초: {breakdown})")
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -69,26 +77,143 @@ class PetFeeder:
             Path(dir_path).mkdir(parents=True, exist_ok=True)
 
     def _init_hardware(self):
-        """하드웨어 컴포넌트 초기화"""
+        """하드웨어 컴포넌트 초기화 (서로 독립적인 장치는 동시에 초기화)"""
         try:
-            self.motor = MotorController()
-            self.camera = CameraIMX219()
-            self.ultrasonic = UltrasonicSensor()
-            self.weight_sensor = WeightSensor()
-            logger.info("하드웨어 초기화 완료")
+            self.simulation = None
+            hardware_config = self.config["hardware"]
+            backend = os.environ.get("HARDWARE_BACKEND", hardware_config.get("backend", "gpio"))
+            if backend == "simulation":
+                # 실제 드라이버는 그대로 두고 핀/장치만 시뮬레이션 모델로 교체
+                from hardware.simulation import SimulatedHardware
+                simulation_config = hardware_config.get("simulation", {})
+                self.simulation = SimulatedHardware(
+                    hardware_config,
+                    time_scale=simulation_config.get("time_scale", 1.0),
+                    replay_dir=simulation_config.get("replay_dir", "data/replay")
+                )
+                factories = {
+                    "motor": self.simulation.create_motor,
+                    "camera": self.simulation.create_camera,
+                    "ultrasonic": self.simulation.create_ultrasonic,
+                    "weight_sensor": self.simulation.create_weight_sensor,
+                }
+            else:
+                factories = {
+                    "motor": MotorController,
+                    "camera": CameraIMX219,
+                    "ultrasonic": self._create_ultrasonic,
+                    "weight_sensor": self._create_weight_sensor,
+                }
+            devices = self.startup.initialize(factories)
+            self.motor = devices["motor"]
+            self.camera = devices["camera"]
+            self.ultrasonic = devices["ultrasonic"]
+            self.weight_sensor = devices["weight_sensor"]
+            # 스케줄러 작업은 최신 측정값만 읽도록 백그라운드에서 연속 측정
+            self.ultrasonic.start_continuous(rate=hardware_config["ultrasonic"].get("rate", 10))
+            logger.info(f"하드웨어 초기화 완료 ({backend})")
         except Exception as e:
             logger.error(f"하드웨어 초기화 실패: {e}")
             raise
 
+    def _create_ultrasonic(self) -> UltrasonicSensor:
+        ultrasonic_config = self.config["hardware"]["ultrasonic"]
+        return UltrasonicSensor(
+            echo_pin=ultrasonic_config.get("echo_pin", 24),
+            trigger_pin=ultrasonic_config.get("trigger_pin", 23),
+            max_distance=ultrasonic_config.get("max_distance", 1.0),
+            threshold_distance=ultrasonic_config.get("threshold_distance", 0.15)
+        )
+
+    def _create_weight_sensor(self) -> WeightSensor:
+        weight_config = self.config["hardware"].get("weight_sensor", {})
+        return WeightSensor(
+            dout_pin=weight_config.get("dout_pin", 14),
+            sck_pin=weight_config.get("sck_pin", 15),
+            gain=weight_config.get("gain", 128),
+            calibration_path=weight_config.get("calibration_path", "weight_calibration.json")
+        )
+
+    @staticmethod
+    def _create_eye_detector():
+        from models.eye_detection import EyeDetectionModel
+        return EyeDetectionModel()
+
+    def _create_image_publisher(self):
+        from services.image_publisher import ImagePublisher
+        storage_config = self.config.get("storage", {})
+        publisher = ImagePublisher(
+            build_storage(storage_config),
+            manifest_path=os.path.join(storage_config.get("image_dir", "data/images"), "manifest.json"),
+            thumbnail_width=storage_config.get("thumbnail_width", 640),
+            retry_delay=storage_config.get("upload_retry_delay", 30.0),
+            retry_max_delay=storage_config.get("upload_retry_max_delay", 600.0),
+            on_published=self._save_published_detection
+        )
+        # 이전 실행이나 네트워크 끊김으로 남은 게시 작업은 백그라운드에서 재시도
+        publisher.start()
+        return publisher
+
+    def _save_published_detection(self, detection: dict, images: dict):
+        """재시도로 이미지 게시가 끝난 감지 결과 저장 (게시 워커 스레드에서 호출)"""
+        self.firebase.save_detection_result({**detection, "images": images})
+
     def _init_components(self):
         """시스템 컴포넌트 초기화"""
+        # 스케줄러 시계는 이벤트 루프 시계(time.monotonic)와 동일
         self.scheduler = RTOSScheduler()
-        self.task_executor = TaskExecutor(self.scheduler)
-        self.firebase = FirebaseManager()
-        self.eye_detector = EyeDetectionModel()
+        self.task_executor = TaskExecutor(
+            self.scheduler,
+            ultrasonic=self.ultrasonic,
+            presence_config=self.config["hardware"]["ultrasonic"],
+            weight_sensor=self.weight_sensor,
+            motor=self.motor,
+            dispenser_config=self.config.get("feeding", {}).get("dispenser")
+        )
+        if self.simulation is not None and self.task_executor.dispenser is not None:
+            # 급여 제어 루프도 장치 모델과 같은 시계로 실행
+            self.task_executor.dispenser.clock = self.simulation.clock.monotonic
+            self.task_executor.dispenser.sleep = self.simulation.clock.sleep
+        # 블로킹 센서 작업은 이벤트 루프 밖의 전용 스레드 풀에서 실행
+        self.async_executor = AsyncTaskExecutor(self.task_executor)
+        # 결과 업로드는 대기열에 기록 후 백그라운드 워커가 전송
+        firebase_config = self.config.get("firebase", {})
+        self.firebase = FirebaseManager(
+            cert_path=firebase_config.get("cert_path", "config/firebase-cert.json"),
+            db_url=firebase_config.get("db_url", "https://your-project.firebaseio.com"),
+            serial_number=firebase_config.get("serial_number", "SN1"),
+            queue_path=firebase_config.get("queue_path", "data/upload_queue.db")
+        )
+        metrics.track_upload_queue(self.firebase.pending_uploads)
+        # 웹소켓 구독자에게 센서 값/이벤트 전달 (구독자별 제한된 대기열)
+        self.telemetry = TelemetryHub(queue_size=self.config.get("telemetry", {}).get("queue_size", 64))
+        self.eye_detector = self.startup.lazy("eye_detector", self._create_eye_detector)
+        # 세션 결과 이미지는 썸네일/눈 영역만 저장소에 올리고 원본은 삭제
+        self.image_publisher = self.startup.lazy("image_publisher", self._create_image_publisher)
+        
+        # 급여 타이머 (다음 급여 시각까지 대기 후 급여)
+        feeding_config = self.config.get("feeding", {})
+        self.feeding_trigger = FeedingTrigger(
+            self.task_executor.schedule_cache,
+            self.task_executor.feeding_history.is_fed,
+            timezone=feeding_config.get("timezone"),
+            window_minutes=self.task_executor.feeding_window_minutes,
+            catch_up=feeding_config.get("catch_up_policy", "latest"),
+            catch_up_limit=timedelta(hours=feeding_config.get("catch_up_hours", 6)),
+            retry_delay=feeding_config.get("retry_delay", 5.0),
+            retry_max_delay=feeding_config.get("retry_max_delay", 60.0)
+        )
+        self.feeding_trigger_task: Optional[asyncio.Task] = None
+        self.loop_monitor_task: Optional[asyncio.Task] = None
+        self.api_server: Optional[uvicorn.Server] = None
+        self.api_task: Optional[asyncio.Task] = None
         
         # 시스템 상태
         self.camera_active = False
+        self.camera_task: Optional[asyncio.Task] = None
+        self.camera_started_at = 0.0
+        self._running_tasks = set()
+        self._task_completed = asyncio.Event()
         self.feeding_in_progress = False
 
     def _init_api(self):
@@ -115,60 +240,252 @@ class PetFeeder:
 
         @self.app.get("/health")
         async def health_check():
-            return {"status": "healthy"}
+            return {"status": "healthy", "startup": self.startup.report(), "telemetry": self.telemetry.stats()}
+
+        @self.app.get("/metrics")
+        async def metrics_endpoint():
+            # 업로드 대기열 조회(SQLite)가 루프를 막지 않도록 스레드에서 수집
+            body, content_type = await asyncio.to_thread(metrics.render)
+            return Response(content=body, media_type=content_type)
+
+        self.app.include_router(schedule_router)
 
     async def _handle_websocket(self, websocket: WebSocket):
-        """웹소켓 연결 처리"""
+        """웹소켓 연결 처리 (텔레메트리 구독)
+
+        받을 주제는 /ws?topics=weight,feeding 또는 {"subscribe": [...]} 메시지로 지정합니다.
+        전송은 구독자별 작업이 대기열에서 꺼내 보내므로 느린 클라이언트는 자기 대기열만
+        밀리고, send_timeout 동안 한 건도 보내지 못하면 연결을 끊습니다.
+        """
         await websocket.accept()
+        query = websocket.query_params.get("topics")
+        # 잘못된 주제가 섞여 있으면 알 수 있는 주제만 구독하고 오류를 알림
+        error, topics = parse_topics(query.split(",") if query else "*")
+        subscription = self.telemetry.subscribe(topics)
+        if error:
+            self._send_control(subscription, {"error": error})
+
+        tasks = {
+            asyncio.create_task(self._send_telemetry(websocket, subscription)),
+            asyncio.create_task(self._receive_subscriptions(websocket, subscription)),
+        }
         try:
-            while True:
-                data = await websocket.receive_text()
-                # 웹소켓 메시지 처리 로직
-                await websocket.send_text(f"Message received: {data}")
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                if not task.cancelled() and task.exception() is not None and \
+                        not isinstance(task.exception(), WebSocketDisconnect):
+                    logger.warning(f"웹소켓 연결 종료: {task.exception()!r}")
+                    await websocket.close(code=1011)
         except Exception as e:
             logger.error(f"웹소켓 오류: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.telemetry.unsubscribe(subscription)
+
+    async def _send_telemetry(self, websocket: WebSocket, subscription: Subscription):
+        """구독 대기열의 메시지를 순서대로 전송"""
+        timeout = self.config.get("telemetry", {}).get("send_timeout", 5.0)
+        while True:
+            message = await subscription.get()
+            await asyncio.wait_for(websocket.send_text(message), timeout)
+
+    async def _receive_subscriptions(self, websocket: WebSocket, subscription: Subscription):
+        """클라이언트의 구독 변경 메시지 처리"""
+        while True:
+            error, topics = parse_subscription(await websocket.receive_text())
+            if error:
+                # 잘못된 요청은 기존 구독을 그대로 유지
+                self._send_control(subscription, {"error": error})
+                continue
+            subscription.set_topics(topics)
+            self._send_control(subscription, {"subscribed": topics or "*"})
+
+    @staticmethod
+    def _send_control(subscription: Subscription, data: dict):
+        # 응답도 같은 대기열로 보내 전송 작업 하나만 소켓에 쓰도록 함
+        subscription.offer(CONTROL_TOPIC, json.dumps({"topic": CONTROL_TOPIC, "data": data}, ensure_ascii=False))
 
     async def main_loop(self):
-        """메인 시스템 루프"""
+        """메인 시스템 루프 (스케줄러가 정한 주기/우선순위에 따라 작업 실행)"""
         logger.info("시스템 모니터링 시작")
         
+        handlers = {
+            "ultrasonic": self._ultrasonic_task,
+            "weight": self._weight_task,
+            "camera": self._camera_watchdog_task,
+        }
+        # 처리할 수 없는 작업은 예약하지 않음
+        for task_id, task in self.scheduler.tasks.items():
+            if task_id not in handlers and task["enabled"]:
+                self.scheduler.disable_task(task_id)
+        
+        # 급여는 스케줄러 주기 작업이 아닌 급여 타이머가 담당
+        self.feeding_trigger_task = asyncio.create_task(self.feeding_trigger.run(self._feeding_callback))
+        self.loop_monitor_task = asyncio.create_task(
+            metrics.monitor_event_loop(self.config.get("metrics", {}).get("loop_lag_interval", 0.5)))
+        
+        loop = asyncio.get_running_loop()
+        # 초기화 중에 지난 첫 주기는 놓친 것으로 세지 않도록 시작 시각 기준으로 예약
+        self.scheduler.restart(loop.time())
         while self.running:
             try:
-                # 초음파 센서 확인
-                if await self.task_executor.execute_task("ultrasonic"):
-                    if not self.camera_active:
-                        await self._start_camera_session()
-
-                # 무게 센서 모니터링
-                await self.task_executor.execute_task("weight")
-
-                # 급여 스케줄 확인
-                await self.task_executor.execute_task("feeding")
-
-                await asyncio.sleep(0.1)  # 100ms 대기
+                now = loop.time()
+                task_id = self.scheduler.get_next_task(now)
+                if task_id is None:
+                    # 실행 중인 작업이 모두 끝나 예약된 작업이 없을 수 있으므로 작업 완료 시 바로 깨어남
+                    wait = self.scheduler.time_until_next(now)
+                    self._task_completed.clear()
+                    try:
+                        await asyncio.wait_for(self._task_completed.wait(),
+                                               0.1 if wait is None else min(wait, 0.1))
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                
+                # 작업은 서로 다른 장치를 쓰므로 동시에 진행될 수 있음
+                task = asyncio.create_task(self._run_scheduled_task(task_id, handlers[task_id]))
+                self._running_tasks.add(task)
+                task.add_done_callback(self._running_tasks.discard)
 
             except Exception as e:
                 logger.error(f"시스템 오류: {e}")
                 await asyncio.sleep(1)
 
+    async def _run_scheduled_task(self, task_id: str, handler):
+        """스케줄러 작업 1회 실행 후 다음 주기 예약"""
+        try:
+            await handler()
+        except Exception as e:
+            logger.error(f"작업 오류 ({task_id}): {e}")
+        finally:
+            self.scheduler.complete_task(task_id, asyncio.get_running_loop().time())
+            self._task_completed.set()
+
+    async def _ultrasonic_task(self):
+        """초음파 센서 확인 (방문 도착이 확정될 때만 카메라 세션 시작)"""
+        result = await self.async_executor.execute_task("ultrasonic")
+        if result.get("status") == "success":
+            self.telemetry.publish("distance", {"distance": result["data"], "present": result["present"]})
+        for event in result.get("events", []):
+            self.telemetry.publish("presence", asdict(event), event.timestamp)
+            if event.kind == "arrival":
+                logger.info(f"방문 감지 (거리: {event.distance:.1f}cm)")
+                if not self.camera_active:
+                    # 카메라 세션은 메인 루프와 별도로 진행
+                    self.camera_active = True
+                    self.camera_task = asyncio.create_task(self._start_camera_session())
+            else:
+                logger.info(f"방문 종료 ({event.duration:.0f}초 체류)")
+
+    async def _weight_task(self):
+        """무게 센서 모니터링"""
+        result = await self.async_executor.execute_task("weight")
+        if result.get("status") == "success":
+            self.telemetry.publish("weight", {"weight": result["data"]})
+        for event in result.get("events", []):
+            self.telemetry.publish("intake", {**asdict(event), "change": event.change}, event.end_time)
+            if event.kind == "intake":
+                intake = event.to_intake_data()
+                logger.info(f"섭취 감지: {intake.amount:.1f}g, {intake.duration:.0f}초")
+                self.firebase.save_intake_result(intake, datetime.fromtimestamp(event.end_time))
+            else:
+                logger.info(f"무게 이벤트: {event.kind} ({event.change:+.1f}g)")
+
+    async def _feeding_callback(self, occurrence) -> Optional[str]:
+        """급여 타이머가 급여 시각에 호출 (결과 상태를 반환, 실패하면 타이머가 다시 시도)"""
+        if occurrence.late:
+            logger.info(f"놓친 급여 보충: {occurrence.date} {occurrence.scheduled_time}")
+        result = await self.async_executor.execute_task("feeding", occurrence.to_feeding_info())
+        logger.info(f"급여 결과 ({occurrence.scheduled_time}): {result.get('status')}")
+        self.telemetry.publish("feeding", {
+            "scheduled_time": occurrence.scheduled_time,
+            "status": result.get("status"),
+            "message": result.get("message"),
+            "data": result.get("data")
+        })
+        if result.get("status") in COMPLETED_STATUSES:
+            self.firebase.save_feeding_result(result["data"]["amount_fed"])
+        return result.get("status")
+
+    async def _camera_watchdog_task(self):
+        """카메라 세션 감시 (세션 진행 중에만 500ms 주기로 실행)"""
+        camera_config = self.config["hardware"]["camera"]
+        limit = camera_config.get("session_duration", 180) + 30
+        if self.camera_task and not self.camera_task.done() and \
+                asyncio.get_running_loop().time() - self.camera_started_at > limit:
+            logger.error("카메라 세션 시간 초과, 세션 중단")
+            self.camera_task.cancel()
+
     async def _start_camera_session(self):
-        """카메라 세션 시작"""
-        if not self.camera_active:
-            self.camera_active = True
-            logger.info("카메라 세션 시작")
-            
-            try:
-                images = await self.camera.start_capture_session()
-                if images:
-                    results = self.eye_detector.batch_process(images)
-                    if results:
-                        await self.firebase.save_detection_result(results)
-            finally:
-                self.camera_active = False
+        """카메라 세션 시작 (촬영과 눈 분석을 파이프라인으로 실행)"""
+        self.camera_active = True
+        self.camera_started_at = asyncio.get_running_loop().time()
+        self.scheduler.enable_task("camera")
+        logger.info("카메라 세션 시작")
+        
+        camera_config = self.config["hardware"]["camera"]
+        try:
+            from core.camera_session import CameraSession
+            # 예열이 끝나지 않았으면 완료까지 (시작 전이면 지금) 로드
+            eye_detector = await asyncio.to_thread(self.eye_detector.get)
+            image_publisher = await asyncio.to_thread(self.image_publisher.get)
+            session = CameraSession(
+                self.camera,
+                eye_detector,
+                duration=camera_config.get("session_duration", 180),
+                interval=camera_config.get("capture_interval", 10),
+                queue_size=camera_config.get("analysis_queue_size", 2),
+                confidence_threshold=camera_config.get("early_stop_confidence", 0.85),
+                delete_unused=image_publisher.delete_original
+            )
+            results = await session.run()
+            if results:
+                try:
+                    images = await asyncio.wrap_future(image_publisher.submit(results))
+                    if image_publisher.delete_original:
+                        # 렌더링 후 삭제된 원본 경로는 기록하지 않음 (썸네일 위치는 images에 있음)
+                        results.pop("image_path", None)
+                except Exception as e:
+                    logger.error(f"이미지 게시 실패: {e}")
+                    images = {}
+                if images is None:
+                    # 업로드 실패: 게시 작업이 디스크에 남아 재시도되고, 완료되면 결과를 저장
+                    logger.warning("이미지 업로드 재시도 대기, 게시 완료 후 감지 결과를 저장합니다")
+                else:
+                    if images:
+                        results["images"] = images
+                    self.firebase.save_detection_result(results)
+                self.telemetry.publish("detection", results)
+        except Exception as e:
+            logger.error(f"카메라 세션 오류: {e}")
+        finally:
+            self.scheduler.disable_task("camera")
+            self.camera_active = False
+
+    async def _serve_api(self):
+        """REST API와 /ws 텔레메트리 서버 (메인 루프와 같은 이벤트 루프에서 실행)"""
+        api_config = self.config.get("api", {})
+        config = uvicorn.Config(
+            self.app,
+            host=api_config.get("host", "0.0.0.0"),
+            port=api_config.get("port", 8000),
+            log_config=None,  # setup_logging()의 로그 설정을 그대로 사용
+            timeout_graceful_shutdown=api_config.get("shutdown_timeout", 5.0)
+        )
+        self.api_server = uvicorn.Server(config)
+        try:
+            await self.api_server.serve()
+        except (OSError, SystemExit) as e:
+            # 포트 사용 중 등으로 시작하지 못해도 급여/센서 루프는 계속 실행
+            logger.error(f"API 서버 시작 실패: {e}")
 
     async def run(self):
-        """시스템 실행"""
+        """시스템 실행 (메인 루프와 API 서버)"""
         try:
+            self.api_task = asyncio.create_task(self._serve_api())
             await self.main_loop()
         except KeyboardInterrupt:
             logger.info("시스템 종료 요청")
@@ -179,16 +496,48 @@ class PetFeeder:
         """시스템 종료 및 리소스 정리"""
         self.running = False
         
+        # 진행 중인 카메라 세션, 급여 타이머, 루프 지연 측정 중단
+        for task in (self.camera_task, self.feeding_trigger_task, self.loop_monitor_task):
+            if task and not task.done():
+                task.cancel()
+        
+        # 새 요청을 받지 않고 열린 연결(웹소켓 포함)을 닫은 뒤 하드웨어 정리
+        if self.api_task is not None and not self.api_task.done():
+            if self.api_server is None:
+                self.api_task.cancel()
+            else:
+                self.api_server.should_exit = True
+            try:
+                await asyncio.wait_for(self.api_task, self.config.get("api", {}).get("shutdown_timeout", 5.0) + 1.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+        
+        # 하드웨어 작업 스레드 정리 후 급여 이력/시계열 저장소 닫기
+        self.async_executor.shutdown()
+        self.task_executor.cleanup()
+        
         # 하드웨어 정리
         self.motor.cleanup()
         self.ultrasonic.cleanup()
         self.weight_sensor.cleanup()
         self.camera.cleanup()
+        # 로드되지 않은 모델은 정리할 필요 없음
+        eye_detector = self.eye_detector.if_ready()
+        if eye_detector is not None:
+            eye_detector.cleanup()
+        image_publisher = self.image_publisher.if_ready()
+        if image_publisher is not None:
+            image_publisher.close()
+        
+        # 업로드 워커 중지 (남은 결과는 다음 실행 때 전송)
+        self.firebase.close()
         
         logger.info("시스템 종료 완료")
 
 def main():
     """메인 함수"""
+    # 로그는 큐를 거쳐 별도 스레드에서 콘솔과 logs/pet_feeder.jsonl에 기록
+    setup_logging(log_dir="logs")
     try:
         # root 권한 체크 (테스트 환경에서는 스킵)
         if not ROOT_CHECK_DISABLED and os.geteuid() != 0:
@@ -202,6 +551,8 @@ def main():
     except Exception as e:
         logger.error(f"프로그램 오류: {e}")
         sys.exit(1)
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
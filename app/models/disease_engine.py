@@ -0,0 +1,207 @@
+# app/models/disease_engine.py
+
+import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import cv2
+import numpy as np
+
+from utils.metrics import INFERENCE
+
+logger = logging.getLogger(__name__)
+
+# 질병 키 -> 모델 파일명 접두어 (app/models/<접두어>_mobilenetv2_int8.tflite)
+DISEASE_MODELS = {
+    "blepharitis": "안검염",
+    "conjunctivitis": "결막염",
+    "corneal_sequestrum": "각막부골편",
+    "keratitis": "비궤양성각막염",
+    "ulcer": "각막궤양",
+}
+MODEL_SUFFIX = "_mobilenetv2_int8.tflite"
+DEFAULT_MODEL_DIR = Path(__file__).resolve().parent
+
+
+def _resolve_interpreter_class():
+    """사용 가능한 TFLite 런타임의 Interpreter 클래스 반환"""
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    import tensorflow as tf
+    return tf.lite.Interpreter
+
+
+def _default_interpreter_factory(num_threads: int) -> Callable:
+    interpreter_class = _resolve_interpreter_class()
+
+    def factory(model_path: str):
+        return interpreter_class(model_path=model_path, num_threads=num_threads)
+
+    return factory
+
+
+class _ModelSlot:
+    """할당된 텐서를 재사용하는 인터프리터 1개"""
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.interpreter.allocate_tensors()
+        self.input_detail = interpreter.get_input_details()[0]
+        self.output_detail = interpreter.get_output_details()[0]
+        self.batch_size = int(self.input_detail['shape'][0])
+
+        out_scale, out_zero_point = self.output_detail.get('quantization', (0.0, 0))
+        self.out_scale = float(out_scale)
+        self.out_zero_point = int(out_zero_point)
+
+    def run(self, batch: np.ndarray) -> np.ndarray:
+        """배치 추론 후 양성 클래스 확률(float32, shape=(n,)) 반환"""
+        if batch.shape[0] != self.batch_size:
+            # 배치 크기가 바뀔 때만 재할당 (보통 눈 2개로 고정)
+            self.interpreter.resize_tensor_input(self.input_detail['index'], list(batch.shape))
+            self.interpreter.allocate_tensors()
+            self.batch_size = batch.shape[0]
+
+        self.interpreter.set_tensor(self.input_detail['index'], batch)
+        self.interpreter.invoke()
+        output = self.interpreter.get_tensor(self.output_detail['index'])
+
+        if self.out_scale:
+            output = (output.astype(np.float32) - self.out_zero_point) * self.out_scale
+        else:
+            output = output.astype(np.float32)
+
+        # (n, 1) 시그모이드 출력 또는 (n, 2) 소프트맥스의 양성 클래스
+        return output.reshape(batch.shape[0], -1)[:, -1]
+
+
+class DiseaseInferenceEngine:
+    """눈 질병 분류 모델 5종 일괄 추론 엔진
+
+    모델별로 pool_size 개의 인터프리터를 미리 로드해 두고, 모든 눈 이미지를
+    하나의 배치로 묶어 5개 모델에 동시에 추론합니다.
+    """
+
+    def __init__(self,
+                 model_dir: str = str(DEFAULT_MODEL_DIR),
+                 pool_size: int = 1,
+                 num_threads: int = 1,
+                 interpreter_factory: Optional[Callable] = None):
+        """
+        Args:
+            model_dir (str): *_mobilenetv2_int8.tflite 모델 디렉토리
+            pool_size (int): 모델당 인터프리터 수 (동시 추론 가능 요청 수)
+            num_threads (int): 인터프리터당 TFLite 스레드 수
+            interpreter_factory (Callable): model_path -> Interpreter (테스트용)
+        """
+        self.model_dir = Path(model_dir)
+        self.pool_size = max(1, int(pool_size))
+        factory = interpreter_factory or _default_interpreter_factory(num_threads)
+
+        self._pools: Dict[str, queue.Queue] = {}
+        self._inference_times = {disease: INFERENCE.labels(model=disease) for disease in DISEASE_MODELS}
+        reference_slot = None
+        for disease, prefix in DISEASE_MODELS.items():
+            model_path = self.model_dir / f"{prefix}{MODEL_SUFFIX}"
+            if not model_path.exists():
+                raise FileNotFoundError(f"모델 파일이 없습니다: {model_path}")
+
+            pool = queue.Queue()
+            for _ in range(self.pool_size):
+                slot = _ModelSlot(factory(str(model_path)))
+                reference_slot = reference_slot or slot
+                pool.put(slot)
+            self._pools[disease] = pool
+            logger.info(f"질병 모델 로드: {disease} ({model_path.name} x{self.pool_size})")
+
+        # 입력 형식은 모든 모델이 동일하다고 가정 (MobileNetV2 224x224x3)
+        reference = reference_slot.input_detail
+        self.input_height = int(reference['shape'][1])
+        self.input_width = int(reference['shape'][2])
+        self.input_dtype = np.dtype(reference['dtype'])
+        self._input_lut = self._build_input_lut(reference)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.pool_size * len(DISEASE_MODELS),
+            thread_name_prefix="disease-engine"
+        )
+
+    def _build_input_lut(self, input_detail: Dict) -> Optional[np.ndarray]:
+        """uint8 픽셀 -> 모델 입력 값 변환 테이블 (항등 변환이면 None)
+
+        모델은 [0, 1] 범위의 이미지로 학습되었으므로 픽셀 p는 p/255 에 해당합니다.
+        uint8/scale=1/255/zero_point=0 인 기본 모델은 픽셀을 그대로 입력합니다.
+        """
+        scale, zero_point = input_detail.get('quantization', (0.0, 0))
+        pixels = np.arange(256, dtype=np.float32) / 255.0
+
+        if np.issubdtype(self.input_dtype, np.floating):
+            return pixels.astype(self.input_dtype)
+
+        if not scale:
+            return None if self.input_dtype == np.uint8 else pixels.astype(self.input_dtype)
+
+        info = np.iinfo(self.input_dtype)
+        lut = np.clip(np.round(pixels / scale + zero_point), info.min, info.max).astype(self.input_dtype)
+        if self.input_dtype == np.uint8 and np.array_equal(lut, np.arange(256, dtype=np.uint8)):
+            return None
+        return lut
+
+    def prepare_batch(self, eye_images: Sequence[np.ndarray]) -> np.ndarray:
+        """BGR 눈 이미지 목록을 모델 입력 배치로 변환"""
+        batch = np.empty((len(eye_images), self.input_height, self.input_width, 3), dtype=np.uint8)
+        for i, eye_image in enumerate(eye_images):
+            cv2.resize(eye_image, (self.input_width, self.input_height),
+                       dst=batch[i], interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(batch[i], cv2.COLOR_BGR2RGB, dst=batch[i])
+
+        if self._input_lut is not None:
+            return self._input_lut[batch]
+        return batch
+
+    def _run_model(self, disease: str, batch: np.ndarray) -> np.ndarray:
+        pool = self._pools[disease]
+        slot = pool.get()
+        try:
+            start = time.perf_counter()
+            scores = slot.run(batch)
+            self._inference_times[disease].observe(time.perf_counter() - start)
+            return scores
+        finally:
+            pool.put(slot)
+
+    def predict(self, eye_images: Sequence[np.ndarray]) -> List[Dict[str, float]]:
+        """모든 눈 이미지를 5개 모델에 일괄 추론
+
+        Returns:
+            List[Dict]: 이미지별 {질병명: 확률}
+        """
+        if not eye_images:
+            return []
+
+        batch = self.prepare_batch(eye_images)
+        futures = {
+            disease: self._executor.submit(self._run_model, disease, batch)
+            for disease in self._pools
+        }
+        scores = {disease: future.result() for disease, future in futures.items()}
+
+        return [
+            {disease: float(scores[disease][i]) for disease in DISEASE_MODELS}
+            for i in range(len(eye_images))
+        ]
+
+    def close(self):
+        """스레드 풀 정리"""
+        self._executor.shutdown(wait=True)
@@ -1,59 +1,86 @@
 # app/models/eye_detection.py
 
-import cv2
+import logging
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-import tensorflow as tf
+from typing import Dict, List, Optional, Tuple, Union
 import os
-from inference_sdk import InferenceHTTPClient
+import time
 from datetime import datetime
 import json
 
+from models.disease_engine import DEFAULT_MODEL_DIR, DiseaseInferenceEngine
+from models.eye_localizer import EyeLocalizer, create_eye_localizer
+from models.frame import Frame
+from utils.metrics import INFERENCE
+
+logger = logging.getLogger(__name__)
+
 class EyeDetectionModel:
     """고양이 눈 질병 감지 AI 모델"""
     
     def __init__(self, 
-                 disease_model_path: str = "models/eye_detection/model.tflite",
+                 model_dir: str = str(DEFAULT_MODEL_DIR),
                  api_url: str = os.environ.get('RF_API_URL'),
-                 api_key: str = os.environ.get('RF_API_KEY')):
+                 api_key: str = os.environ.get('RF_API_KEY'),
+                 pool_size: int = int(os.environ.get('EYE_MODEL_POOL_SIZE', 1)),
+                 num_threads: int = int(os.environ.get('EYE_MODEL_THREADS', 1)),
+                 localizer_backend: str = os.environ.get('EYE_LOCALIZER', 'auto'),
+                 localizer: Optional[EyeLocalizer] = None):
         """
         Args:
-            disease_model_path (str): 질병 감지 TFLite 모델 경로
+            model_dir (str): 질병별 int8 TFLite 모델(5종) 디렉토리
             api_url (str): Roboflow API URL
             api_key (str): Roboflow API Key
+            pool_size (int): 모델당 인터프리터 수
+            num_threads (int): 인터프리터당 추론 스레드 수
+            localizer_backend (str): 눈 검출기 (auto/tflite/opencv/roboflow)
+            localizer (EyeLocalizer): 직접 지정할 눈 검출기 (지정 시 backend 무시)
         """
         try:
-            print("[eye_detection] 모델 초기화 시작...")
+            logger.info("모델 초기화 시작...")
             
-            # 눈 감지 API 클라이언트 초기화
-            self.eye_detector = InferenceHTTPClient(
+            # 눈 검출기 초기화 (TFLite 모델 > Roboflow > OpenCV 순으로 사용)
+            self.eye_localizer = localizer or create_eye_localizer(
+                localizer_backend,
                 api_url=api_url,
                 api_key=api_key
             )
+            logger.info(f"눈 검출기: {self.eye_localizer.name}")
             
-            # 질병 감지 모델 초기화
-            self.interpreter = tf.lite.Interpreter(model_path=disease_model_path)
-            self.interpreter.allocate_tensors()
-            
-            self.input_details = self.interpreter.get_input_details()
-            self.output_details = self.interpreter.get_output_details()
+            # 질병 감지 모델 5종 로드 (인터프리터 풀)
+            self.disease_engine = DiseaseInferenceEngine(
+                model_dir=model_dir,
+                pool_size=pool_size,
+                num_threads=num_threads
+            )
             
             self._is_initialized = True
-            print("[eye_detection] 초기화 완료")
+            logger.info("초기화 완료")
             
         except Exception as e:
-            print(f"[eye_detection] 초기화 실패: {str(e)}")
+            logger.error(f"초기화 실패: {str(e)}")
             self._is_initialized = False
     
-    def detect_eyes(self, image_path: str) -> List[Dict]:
-        """이미지에서 고양이 눈 위치 감지"""
-        print(f"[eye_detection] 눈 감지 시작: {image_path}")
+    def detect_eyes(self, image_path: str, image: Optional[np.ndarray] = None) -> List[Dict]:
+        """이미지에서 고양이 눈 위치 감지 (경로 기반 API, detect_eyes_in_frame 래퍼)"""
+        if image is not None:
+            frame = Frame.from_array(image, path=image_path)
+        else:
+            frame = Frame.from_path(image_path)
+        return self.detect_eyes_in_frame(frame)
+    
+    def detect_eyes_in_frame(self, frame: Frame) -> List[Dict]:
+        """프레임의 축소 프록시에서 눈 위치 감지 후 원본 좌표로 변환"""
+        logger.debug(f"눈 감지 시작: {frame.path}")
         try:
-            result = self.eye_detector.infer(image_path, model_id="cat-eye-2mdft-8k8ts/2")
+            start = time.perf_counter()
+            predictions = self.eye_localizer.locate(frame.proxy)
+            INFERENCE.labels(model=f"eye_localizer_{self.eye_localizer.name}").observe(time.perf_counter() - start)
             eyes = []
             
-            for pred in result['predictions']:
+            for pred in predictions:
                 if pred['confidence'] > 0.7:  # 신뢰도 70% 이상만 처리
+                    pred = frame.proxy_to_full(pred)
                     eye = {
                         'x': int(pred['x']),
                         'y': int(pred['y']),
@@ -62,12 +89,12 @@ class EyeDetectionModel:
                         'confidence': pred['confidence']
                     }
                     eyes.append(eye)
-                    print(f"[eye_detection] 눈 감지됨: {eye}")
+                    logger.debug(f"눈 감지됨: {eye}")
             
             return eyes
             
         except Exception as e:
-            print(f"[eye_detection] 눈 감지 실패: {str(e)}")
+            logger.error(f"눈 감지 실패: {str(e)}")
             return []
     
     def crop_eye(self, image: np.ndarray, eye: Dict) -> np.ndarray:
@@ -88,61 +115,42 @@ class EyeDetectionModel:
     
     def analyze_eye(self, eye_image: np.ndarray) -> Dict:
         """개별 눈 이미지 질병 분석"""
+        results = self.analyze_eyes([eye_image])
+        return results[0] if results else {}
+    
+    def analyze_eyes(self, eye_images: List[np.ndarray]) -> List[Dict]:
+        """여러 눈 이미지를 5개 질병 모델에 한 번에 배치 추론"""
         try:
-            # 이미지 전처리
-            processed_img = cv2.resize(eye_image, (224, 224))
-            processed_img = processed_img.astype(np.float32) / 255.0
-            processed_img = np.expand_dims(processed_img, axis=0)
-            
-            # 모델 추론
-            self.interpreter.set_tensor(self.input_details[0]['index'], processed_img)
-            self.interpreter.invoke()
-            
-            # 결과 추출
-            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
-            
-            diseases = {
-                "blepharitis": float(output_data[0][0]),
-                "conjunctivitis": float(output_data[0][1]),
-                "corneal_sequestrum": float(output_data[0][2]),
-                "keratitis": float(output_data[0][3]),
-                "ulcer": float(output_data[0][4])
-            }
-            
-            return diseases
-            
+            return self.disease_engine.predict(eye_images)
         except Exception as e:
-            print(f"[eye_detection] 눈 분석 실패: {str(e)}")
-            return {}
+            logger.error(f"눈 분석 실패: {str(e)}")
+            return [{} for _ in eye_images]
     
     def process_image(self, image_path: str) -> Optional[Dict]:
-        """이미지 처리 및 분석"""
+        """이미지 처리 및 분석 (경로 기반 API, process_frame 래퍼)"""
+        return self.process_frame(Frame.from_path(image_path))
+    
+    def process_frame(self, frame: Frame) -> Optional[Dict]:
+        """프레임 처리 및 분석 (디코딩 결과를 검출/자르기/분류에 공유)"""
         if not self._is_initialized:
-            print("[eye_detection] 모델이 초기화되지 않았습니다")
+            logger.warning("모델이 초기화되지 않았습니다")
             return None
             
         try:
-            print(f"[eye_detection] 이미지 처리 시작: {image_path}")
-            
-            # 이미지 로드
-            image = cv2.imread(image_path)
-            if image is None:
-                raise Exception("이미지를 불러올 수 없습니다")
+            logger.debug(f"이미지 처리 시작: {frame.path}")
             
-            # 눈 감지
-            eyes = self.detect_eyes(image_path)
+            # 눈 감지 (축소 프록시)
+            eyes = self.detect_eyes_in_frame(frame)
             if not eyes:
-                print("[eye_detection] 눈이 감지되지 않았습니다")
+                logger.warning("눈이 감지되지 않았습니다")
                 return None
             
+            # 원본 해상도에서 눈 영역 추출 후 전체를 한 번에 질병 분석
+            eye_images = [self.crop_eye(frame.image, eye) for eye in eyes]
+            all_diseases = self.analyze_eyes(eye_images)
+            
             results = []
-            for i, eye in enumerate(eyes):
-                # 눈 영역 추출
-                eye_img = self.crop_eye(image, eye)
-                
-                # 질병 분석
-                diseases = self.analyze_eye(eye_img)
-                
+            for i, (eye, diseases) in enumerate(zip(eyes, all_diseases)):
                 # 결과 저장
                 result = {
                     "eye_id": i,
@@ -151,30 +159,30 @@ class EyeDetectionModel:
                 }
                 results.append(result)
                 
-                print(f"[eye_detection] 눈 {i} 분석 완료: {diseases}")
+                logger.debug(f"눈 {i} 분석 완료: {diseases}")
             
             # 종합 결과
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             final_result = {
                 "timestamp": timestamp,
-                "image_path": image_path,
+                "image_path": frame.path,
                 "eyes": results
             }
             
             return final_result
             
         except Exception as e:
-            print(f"[eye_detection] 이미지 처리 실패: {str(e)}")
+            logger.error(f"이미지 처리 실패: {str(e)}")
             return None
     
     def get_best_eye_results(self, results: List[Dict]) -> Optional[Dict]:
         """여러 이미지 중 최상의 눈 감지 결과 선택"""
         if not results:
-            print("[eye_detection] 분석 결과가 없습니다")
+            logger.warning("분석 결과가 없습니다")
             return None
         
         try:
-            print("[eye_detection] 최적의 결과 선택 중...")
+            logger.info("최적의 결과 선택 중...")
             
             # 각 이미지별로 양쪽 눈의 평균 신뢰도 계산
             best_result = None
@@ -203,45 +211,57 @@ class EyeDetectionModel:
                     if total_score > best_confidence:
                         best_confidence = total_score
                         best_result = result
-                        print(f"[eye_detection] 새로운 최적 결과 발견 (점수: {total_score:.3f})")
+                        logger.debug(f"새로운 최적 결과 발견 (점수: {total_score:.3f})")
             
             if best_result:
-                print(f"[eye_detection] 최종 선택된 이미지: {best_result['image_path']}")
-                
-                # 선택되지 않은 이미지들 삭제
-                for result in results:
-                    if result != best_result:
-                        try:
-                            os.remove(result['image_path'])
-                            print(f"[eye_detection] 미사용 이미지 삭제: {result['image_path']}")
-                        except Exception as e:
-                            print(f"[eye_detection] 이미지 삭제 실패: {str(e)}")
-                
+                logger.info(f"최종 선택된 이미지: {best_result['image_path']}")
                 return best_result
             
-            print("[eye_detection] 적합한 결과를 찾을 수 없습니다")
+            logger.warning("적합한 결과를 찾을 수 없습니다")
             return None
             
         except Exception as e:
-            print(f"[eye_detection] 결과 선택 중 오류 발생: {str(e)}")
+            logger.error(f"결과 선택 중 오류 발생: {str(e)}")
             return None
     
-    def batch_process(self, image_paths: List[str]) -> Optional[Dict]:
-        """여러 이미지 일괄 처리 후 최적의 결과 반환"""
-        print(f"[eye_detection] 일괄 처리 시작 (이미지 {len(image_paths)}개)")
+    def batch_process(self, images: List[Union[str, Frame]]) -> Optional[Dict]:
+        """여러 이미지(경로 또는 Frame) 일괄 처리 후 최적의 결과 반환"""
+        logger.info(f"일괄 처리 시작 (이미지 {len(images)}개)")
         
-        # 모든 이미지 처리
+        # 모든 이미지 처리 (처리한 프레임의 픽셀은 바로 해제)
         results = []
-        for image_path in image_paths:
-            result = self.process_image(image_path)
+        for image in images:
+            frame = image if isinstance(image, Frame) else Frame.from_path(image)
+            result = self.process_frame(frame)
+            if frame is not image:
+                frame.release()
             if result:
                 results.append(result)
         
-        print(f"[eye_detection] 일괄 처리 완료 (성공: {len(results)}개)")
+        logger.info(f"일괄 처리 완료 (성공: {len(results)}개)")
         
-        # 최적의 결과 선택
+        # 최적의 결과 선택 후 선택되지 않은 이미지(눈이 없는 이미지 포함) 삭제
         best_result = self.get_best_eye_results(results)
-        
+        keep = best_result["image_path"] if best_result else None
+        for image in images:
+            path = image.path if isinstance(image, Frame) else image
+            if path and path != keep:
+                try:
+                    os.remove(path)
+                    logger.debug(f"미사용 이미지 삭제: {path}")
+                except Exception as e:
+                    logger.error(f"이미지 삭제 실패: {str(e)}")
+        return self.to_detection_result(best_result)
+    
+    def is_confident_result(self, result: Optional[Dict], threshold: float) -> bool:
+        """양쪽 눈이 모두 감지되고 평균 신뢰도가 임계값 이상인지 확인"""
+        if not result or len(result.get('eyes', [])) != 2:
+            return False
+        avg_confidence = sum(eye['position']['confidence'] for eye in result['eyes']) / 2
+        return avg_confidence >= threshold
+    
+    def to_detection_result(self, best_result: Optional[Dict]) -> Optional[Dict]:
+        """최적 결과를 Firebase 저장용 구조(좌/우 눈)로 변환"""
         if best_result:
             # Firebase 저장을 위한 데이터 구조 변환
             firebase_data = {
@@ -264,3 +284,11 @@ class EyeDetectionModel:
             return firebase_data
         
         return None
+    
+    def cleanup(self):
+        """리소스 정리"""
+        logger.info("리소스 정리")
+        if hasattr(self, 'disease_engine'):
+            self.disease_engine.close()
+        if hasattr(self, 'eye_localizer'):
+            self.eye_localizer.close()
@@ -0,0 +1,253 @@
+# app/models/eye_localizer.py
+
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ROBOFLOW_MODEL_ID = "cat-eye-2mdft-8k8ts/2"
+DEFAULT_TFLITE_MODEL = Path(__file__).resolve().parent / "eye_localizer.tflite"
+
+ImageInput = Union[str, np.ndarray]
+
+
+def _load_image(image: ImageInput) -> np.ndarray:
+    if isinstance(image, np.ndarray):
+        return image
+    loaded = cv2.imread(str(image))
+    if loaded is None:
+        raise ValueError(f"이미지를 불러올 수 없습니다: {image}")
+    return loaded
+
+
+def _box(cx: float, cy: float, width: float, height: float, confidence: float) -> Dict:
+    return {
+        'x': cx,
+        'y': cy,
+        'width': width,
+        'height': height,
+        'confidence': float(confidence)
+    }
+
+
+class EyeLocalizer:
+    """눈 위치 검출기 인터페이스
+
+    locate()는 이미지 좌표계 기준 중심점/크기와 신뢰도를 담은
+    {'x', 'y', 'width', 'height', 'confidence'} 목록을 반환합니다.
+    """
+
+    name = "base"
+
+    def locate(self, image: ImageInput) -> List[Dict]:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RoboflowEyeLocalizer(EyeLocalizer):
+    """Roboflow 추론 API를 사용하는 원격 검출기 (HTTP 왕복 1회/이미지)"""
+
+    name = "roboflow"
+
+    def __init__(self, api_url: str, api_key: str, model_id: str = ROBOFLOW_MODEL_ID):
+        from inference_sdk import InferenceHTTPClient
+
+        self.client = InferenceHTTPClient(api_url=api_url, api_key=api_key)
+        self.model_id = model_id
+
+    def locate(self, image: ImageInput) -> List[Dict]:
+        result = self.client.infer(image, model_id=self.model_id)
+        return [
+            _box(pred['x'], pred['y'], pred['width'], pred['height'], pred['confidence'])
+            for pred in result.get('predictions', [])
+        ]
+
+
+class OpenCVEyeLocalizer(EyeLocalizer):
+    """OpenCV Haar cascade 기반 온디바이스 검출기 (최선 노력 폴백)
+
+    축소한 이미지에서 고양이 얼굴을 먼저 찾고, 얼굴 위쪽 영역에서만 눈을 찾습니다.
+    cascade의 level weight를 시그모이드로 변환해 신뢰도로 사용합니다.
+    OpenCV에 포함된 눈 cascade는 사람 눈으로 학습된 것이라 고양이 눈 검출률은
+    검증되지 않았습니다. 고양이 눈 TFLite 모델이나 Roboflow를 쓸 수 없을 때만 사용합니다.
+    """
+
+    name = "opencv"
+
+    def __init__(self, max_side: int = 640):
+        """
+        Args:
+            max_side (int): 검출에 사용할 축소 이미지의 긴 변 길이
+        """
+        self.max_side = max_side
+        cascade_dir = cv2.data.haarcascades
+        self.face_cascade = cv2.CascadeClassifier(
+            os.path.join(cascade_dir, "haarcascade_frontalcatface_extended.xml"))
+        self.eye_cascade = cv2.CascadeClassifier(
+            os.path.join(cascade_dir, "haarcascade_eye.xml"))
+        if self.face_cascade.empty() or self.eye_cascade.empty():
+            raise RuntimeError("Haar cascade 파일을 불러올 수 없습니다")
+
+    def _detect(self, cascade, gray: np.ndarray, min_size: int):
+        boxes, _, weights = cascade.detectMultiScale3(
+            gray, scaleFactor=1.1, minNeighbors=4,
+            minSize=(min_size, min_size), outputRejectLevels=True)
+        if len(boxes) == 0:
+            return []
+        return list(zip(boxes, np.asarray(weights).reshape(-1)))
+
+    def locate(self, image: ImageInput) -> List[Dict]:
+        image = _load_image(image)
+        scale = min(1.0, self.max_side / max(image.shape[:2]))
+        small = image if scale == 1.0 else cv2.resize(
+            image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        gray = cv2.equalizeHist(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY))
+
+        # 얼굴이 없으면 전체 이미지에서 눈 검색
+        faces = self._detect(self.face_cascade, gray, min_size=48)
+        regions = [(x, y, w, h // 2 + h // 8) for (x, y, w, h), _ in faces] or \
+                  [(0, 0, gray.shape[1], gray.shape[0])]
+
+        eyes = []
+        for rx, ry, rw, rh in regions:
+            roi = gray[ry:ry + rh, rx:rx + rw]
+            for (x, y, w, h), weight in self._detect(self.eye_cascade, roi, min_size=12):
+                confidence = 1.0 / (1.0 + math.exp(-float(weight)))
+                eyes.append(_box(
+                    (rx + x + w / 2) / scale,
+                    (ry + y + h / 2) / scale,
+                    w / scale,
+                    h / scale,
+                    confidence
+                ))
+
+        eyes.sort(key=lambda eye: eye['confidence'], reverse=True)
+        return eyes
+
+
+class TFLiteEyeLocalizer(EyeLocalizer):
+    """SSD 계열 TFLite 검출 모델 기반 온디바이스 검출기
+
+    출력은 TFLite_Detection_PostProcess 형식(boxes, classes, scores, count)이며
+    boxes는 [ymin, xmin, ymax, xmax] 정규화 좌표입니다.
+    """
+
+    name = "tflite"
+
+    def __init__(self, model_path: str = str(DEFAULT_TFLITE_MODEL), num_threads: int = 1):
+        from models.disease_engine import _resolve_interpreter_class
+
+        if not Path(model_path).exists():
+            raise FileNotFoundError(f"눈 검출 모델이 없습니다: {model_path}")
+
+        self.interpreter = _resolve_interpreter_class()(model_path=model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.input_detail = self.interpreter.get_input_details()[0]
+        self.output_details = self.interpreter.get_output_details()
+        self.input_height = int(self.input_detail['shape'][1])
+        self.input_width = int(self.input_detail['shape'][2])
+
+    def locate(self, image: ImageInput) -> List[Dict]:
+        image = _load_image(image)
+        height, width = image.shape[:2]
+
+        resized = cv2.resize(image, (self.input_width, self.input_height), interpolation=cv2.INTER_AREA)
+        tensor = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)[np.newaxis]
+        if self.input_detail['dtype'] == np.float32:
+            tensor = tensor.astype(np.float32) / 255.0
+
+        self.interpreter.set_tensor(self.input_detail['index'], tensor)
+        self.interpreter.invoke()
+        boxes, _, scores, count = (
+            self.interpreter.get_tensor(detail['index']) for detail in self.output_details[:4]
+        )
+
+        eyes = []
+        for i in range(int(count[0])):
+            ymin, xmin, ymax, xmax = boxes[0][i]
+            eyes.append(_box(
+                (xmin + xmax) / 2 * width,
+                (ymin + ymax) / 2 * height,
+                (xmax - xmin) * width,
+                (ymax - ymin) * height,
+                scores[0][i]
+            ))
+        return eyes
+
+
+class FallbackEyeLocalizer(EyeLocalizer):
+    """여러 검출기를 순서대로 시도 (오류 또는 검출 실패 시 다음 검출기)"""
+
+    name = "fallback"
+
+    def __init__(self, localizers: Sequence[EyeLocalizer]):
+        if not localizers:
+            raise ValueError("검출기가 하나 이상 필요합니다")
+        self.localizers = list(localizers)
+
+    def locate(self, image: ImageInput) -> List[Dict]:
+        eyes: List[Dict] = []
+        for localizer in self.localizers:
+            try:
+                eyes = localizer.locate(image)
+            except Exception as e:
+                logger.warning(f"{localizer.name} 눈 검출 실패, 다음 검출기 사용: {e}")
+                continue
+            if eyes:
+                return eyes
+        return eyes
+
+    def close(self):
+        for localizer in self.localizers:
+            localizer.close()
+
+
+def create_eye_localizer(backend: str = "auto",
+                         api_url: Optional[str] = None,
+                         api_key: Optional[str] = None,
+                         model_path: str = str(DEFAULT_TFLITE_MODEL)) -> EyeLocalizer:
+    """설정에 맞는 눈 검출기 생성
+
+    Args:
+        backend (str): auto / tflite / opencv / roboflow
+            auto는 고양이 눈으로 학습된 검출기를 우선합니다. TFLite 모델이 있으면 TFLite,
+            없으면 API 정보가 있을 때 Roboflow를 먼저 사용하고, OpenCV(사람 눈 cascade)는
+            둘 다 없거나 실패했을 때만 쓰는 최선 노력 폴백입니다.
+        api_url (str): Roboflow API URL
+        api_key (str): Roboflow API Key
+        model_path (str): TFLite 눈 검출 모델 경로
+    """
+    backend = (backend or "auto").lower()
+    if backend == "roboflow":
+        return RoboflowEyeLocalizer(api_url, api_key)
+    if backend == "opencv":
+        return OpenCVEyeLocalizer()
+    if backend == "tflite":
+        return TFLiteEyeLocalizer(model_path)
+    if backend != "auto":
+        raise ValueError(f"알 수 없는 눈 검출기: {backend}")
+
+    localizers: List[EyeLocalizer] = []
+    if Path(model_path).exists():
+        localizers.append(TFLiteEyeLocalizer(model_path))
+
+    if api_url and api_key:
+        try:
+            localizers.append(RoboflowEyeLocalizer(api_url, api_key))
+        except ImportError:
+            logger.warning("inference_sdk가 없어 Roboflow 검출기를 사용하지 않습니다")
+
+    if not localizers:
+        logger.warning(f"고양이 눈 검출 모델({model_path})과 Roboflow 설정이 없어 "
+                       "OpenCV 검출기만 사용합니다 (검출률이 낮을 수 있음)")
+    localizers.append(OpenCVEyeLocalizer())
+
+    return localizers[0] if len(localizers) == 1 else FallbackEyeLocalizer(localizers)
@@ -0,0 +1,116 @@
+# app/models/frame.py
+
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+# JPEG DCT 축소 디코딩 플래그 (원본 대비 1/2, 1/4, 1/8)
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+DEFAULT_REDUCTION = 4  # 3840x2160 -> 960x540
+
+
+class Frame:
+    """캡처 1장의 디코딩 결과 (원본 해상도 이미지 + 축소 프록시)
+
+    눈 검출은 프록시에서, 눈 영역 자르기와 질병 분석은 원본에서 수행합니다.
+    파일/JPEG 바이트로 만든 프레임은 원본을 처음 사용할 때 한 번만 디코딩하고,
+    프록시는 JPEG 축소 디코딩으로 만들어 눈이 없는 프레임은 원본 디코딩을 하지 않습니다.
+    """
+
+    def __init__(self,
+                 image: Optional[np.ndarray] = None,
+                 path: Optional[str] = None,
+                 data: Optional[bytes] = None,
+                 reduction: int = DEFAULT_REDUCTION):
+        """
+        Args:
+            image (np.ndarray): 이미 디코딩된 BGR 이미지
+            path (str): 이미지 파일 경로
+            data (bytes): 인코딩된 이미지 바이트 (JPEG 등)
+            reduction (int): 프록시 축소 비율 (1/2/4/8)
+        """
+        if image is None and path is None and data is None:
+            raise ValueError("image, path, data 중 하나는 필요합니다")
+        if reduction not in _REDUCED_FLAGS:
+            raise ValueError("reduction은 1, 2, 4, 8 중 하나여야 합니다")
+
+        self.path = str(path) if path is not None else None
+        self.reduction = reduction
+        self._data = data
+        self._image = image
+        self._proxy: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_path(cls, path: str, reduction: int = DEFAULT_REDUCTION) -> "Frame":
+        return cls(path=path, reduction=reduction)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, path: Optional[str] = None,
+                   reduction: int = DEFAULT_REDUCTION) -> "Frame":
+        return cls(path=path, data=data, reduction=reduction)
+
+    @classmethod
+    def from_array(cls, image: np.ndarray, path: Optional[str] = None,
+                   reduction: int = DEFAULT_REDUCTION) -> "Frame":
+        return cls(image=image, path=path, reduction=reduction)
+
+    def _decode(self, flags: int) -> np.ndarray:
+        if self._data is None and self.path is None:
+            raise ValueError("해제된 프레임입니다")
+        if self._data is not None:
+            image = cv2.imdecode(np.frombuffer(self._data, dtype=np.uint8), flags)
+        else:
+            image = cv2.imread(self.path, flags)
+        if image is None:
+            raise ValueError(f"이미지를 불러올 수 없습니다: {self.path or '<memory>'}")
+        return image
+
+    @property
+    def image(self) -> np.ndarray:
+        """원본 해상도 BGR 이미지 (최초 접근 시 1회 디코딩)"""
+        if self._image is None:
+            self._image = self._decode(cv2.IMREAD_COLOR)
+            self._data = None
+        return self._image
+
+    @property
+    def proxy(self) -> np.ndarray:
+        """눈 검출용 축소 이미지"""
+        if self._proxy is None:
+            if self.reduction == 1:
+                self._proxy = self.image
+            elif self._image is not None:
+                height, width = self._image.shape[:2]
+                self._proxy = cv2.resize(
+                    self._image,
+                    (-(-width // self.reduction), -(-height // self.reduction)),
+                    interpolation=cv2.INTER_AREA
+                )
+            else:
+                self._proxy = self._decode(_REDUCED_FLAGS[self.reduction])
+        return self._proxy
+
+    @property
+    def is_decoded(self) -> bool:
+        """원본 해상도 디코딩 여부"""
+        return self._image is not None
+
+    def proxy_to_full(self, box: Dict) -> Dict:
+        """프록시 좌표계의 박스를 원본 좌표계로 변환"""
+        scale = float(self.reduction)
+        converted = dict(box)
+        for key in ('x', 'y', 'width', 'height'):
+            converted[key] = box[key] * scale
+        return converted
+
+    def release(self):
+        """디코딩된 픽셀 해제 (경로만 유지)"""
+        self._image = None
+        self._proxy = None
+        self._data = None
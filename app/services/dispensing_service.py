@@ -0,0 +1,242 @@
+# app/services/dispensing_service.py
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 급여 결과 상태
+SUCCESS = "success"
+JAMMED = "jammed"
+TIMEOUT = "timeout"
+SENSOR_ERROR = "sensor_error"
+
+
+@dataclass
+class DispenseResult:
+    """급여 결과
+
+    status: success / jammed (역회전 후에도 막힘) / timeout / sensor_error
+    """
+    status: str
+    target: float
+    dispensed: float
+    duration: float
+    overshoot: float = 0.0   # 모터 정지 후 추가로 떨어진 양 (g)
+    reversals: int = 0
+
+    @property
+    def error(self) -> float:
+        return self.dispensed - self.target
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class GravimetricDispenser:
+    """무게 센서 피드백으로 모터를 제어하는 급여 컨트롤러
+
+    고정 주기(control_rate)로 무게를 읽어 남은 양이 slow_zone 안으로 들어오면 PWM
+    듀티를 min_duty까지 줄이고, 남은 양이 학습된 overshoot(정지 후 낙하량) 이하가 되면
+    멈춥니다. jam_timeout 동안 jam_min_gain만큼도 늘지 않으면 막힘으로 보고 잠시
+    역회전한 뒤 다시 돌리며, max_reversals를 넘으면 중단합니다.
+
+    정지 후 settle_time 뒤의 실제 낙하량으로 overshoot를 지수 이동 평균으로 갱신하고
+    state_path에 저장해 다음 급여에 사용합니다.
+    """
+
+    def __init__(self,
+                 motor,
+                 read_weight: Callable[[], Optional[float]],
+                 control_rate: float = 20.0,
+                 max_duty: float = 100.0,
+                 min_duty: float = 35.0,
+                 slow_zone: float = 10.0,
+                 overshoot: float = 1.0,
+                 overshoot_alpha: float = 0.3,
+                 jam_timeout: float = 2.0,
+                 jam_min_gain: float = 0.5,
+                 reverse_duty: float = 60.0,
+                 reverse_time: float = 0.5,
+                 max_reversals: int = 3,
+                 settle_time: float = 1.0,
+                 timeout: float = 60.0,
+                 state_path: Optional[str] = None,
+                 clock=time.monotonic,
+                 sleep=time.sleep):
+        """
+        Args:
+            motor (MotorController): forward/backward/set_speed/stop을 제공하는 모터
+            read_weight (Callable): 현재 무게(g) 반환, 측정 실패 시 None
+            control_rate (float): 제어 주기 (Hz)
+            max_duty (float): 최대 PWM 듀티 (%)
+            min_duty (float): 목표 근처 최소 PWM 듀티 (%, 모터가 멈추지 않는 값)
+            slow_zone (float): 남은 양이 이 값(g) 이하부터 듀티를 줄임
+            overshoot (float): 정지 후 낙하량 초기 추정값 (g)
+            overshoot_alpha (float): 낙하량 학습 비율 (0~1)
+            jam_timeout (float): 이 시간(초) 동안 무게가 늘지 않으면 막힘으로 판단
+            jam_min_gain (float): 진행으로 인정할 최소 무게 증가 (g)
+            reverse_duty (float): 막힘 해소 역회전 듀티 (%)
+            reverse_time (float): 막힘 해소 역회전 시간 (초)
+            max_reversals (int): 최대 역회전 횟수 (넘으면 jammed)
+            settle_time (float): 정지 후 낙하가 끝날 때까지 기다리는 시간 (초)
+            timeout (float): 급여 최대 시간 (초)
+            state_path (str): 학습된 overshoot 저장 파일 (None이면 저장하지 않음)
+            clock: 시각 함수
+            sleep: 대기 함수 (시뮬레이션에서는 가상 시계를 진행)
+        """
+        self.motor = motor
+        self.read_weight = read_weight
+        self.period = 1.0 / control_rate
+        self.max_duty = max_duty
+        self.min_duty = min_duty
+        self.slow_zone = slow_zone
+        self.overshoot = overshoot
+        self.overshoot_alpha = overshoot_alpha
+        self.jam_timeout = jam_timeout
+        self.jam_min_gain = jam_min_gain
+        self.reverse_duty = reverse_duty
+        self.reverse_time = reverse_time
+        self.max_reversals = max_reversals
+        self.settle_time = settle_time
+        self.timeout = timeout
+        self.state_path = state_path
+        self.clock = clock
+        self.sleep = sleep
+        self._load_state()
+
+    def _load_state(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, "r") as f:
+                self.overshoot = float(json.load(f)["overshoot"])
+        except Exception as e:
+            logger.error(f"급여 보정값 로드 실패: {e}")
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+            with open(self.state_path, "w") as f:
+                json.dump({"overshoot": self.overshoot}, f)
+        except Exception as e:
+            logger.error(f"급여 보정값 저장 실패: {e}")
+
+    @property
+    def max_duration(self) -> float:
+        """dispense() 한 번이 걸릴 수 있는 최대 시간 (초)
+
+        timeout은 제어 주기마다 확인하므로 마지막 주기와 역회전 대기만큼 넘어갈 수 있고,
+        정지 후 settle_time 동안 더 기다립니다.
+        """
+        return self.timeout + self.period + self.max_reversals * self.reverse_time + self.settle_time
+
+    def duty_for(self, remaining: float) -> float:
+        """남은 양(g)에 따른 PWM 듀티 (slow_zone 안에서 선형으로 감소)"""
+        if remaining >= self.slow_zone:
+            return self.max_duty
+        ratio = max(remaining, 0.0) / self.slow_zone
+        return self.min_duty + (self.max_duty - self.min_duty) * ratio
+
+    def dispense(self, amount: float) -> DispenseResult:
+        """
+        목표량 급여 (블로킹, 제어 루프가 끝날 때까지 반환하지 않음)
+        Args:
+            amount (float): 목표 급여량 (g)
+        """
+        started = self.clock()
+        start_weight = self.read_weight()
+        if start_weight is None:
+            return DispenseResult(SENSOR_ERROR, amount, 0.0, 0.0)
+
+        logger.info(f"급여 시작: 목표 {amount:.1f}g (예상 낙하량 {self.overshoot:.1f}g)")
+        status = SUCCESS
+        reversals = 0
+        weight = start_weight
+        duty = self.duty_for(amount)
+        self.motor.forward(duty)
+        progress_weight, progress_time = start_weight, started
+        next_tick = started
+        try:
+            while True:
+                next_tick += self.period
+                delay = next_tick - self.clock()
+                if delay > 0:
+                    self.sleep(delay)
+                else:
+                    # 주기를 놓치면 밀린 주기를 몰아서 실행하지 않고 현재 시각부터 다시 맞춤
+                    next_tick = self.clock()
+                now = self.clock()
+
+                reading = self.read_weight()
+                if reading is None:
+                    status = SENSOR_ERROR
+                    break
+                weight = reading
+                remaining = amount - (weight - start_weight)
+                if remaining <= self.overshoot:
+                    break
+                if now - started > self.timeout:
+                    status = TIMEOUT
+                    break
+
+                if weight - progress_weight >= self.jam_min_gain:
+                    progress_weight, progress_time = weight, now
+                elif now - progress_time > self.jam_timeout:
+                    reversals += 1
+                    if reversals > self.max_reversals:
+                        status = JAMMED
+                        break
+                    logger.warning(f"배출구 막힘 감지, 역회전 ({reversals}/{self.max_reversals})")
+                    self.motor.backward(self.reverse_duty)
+                    self.sleep(self.reverse_time)
+                    duty = self.duty_for(remaining)
+                    self.motor.forward(duty)
+                    progress_weight, progress_time = weight, self.clock()
+                    next_tick = progress_time
+                    continue
+
+                new_duty = self.duty_for(remaining)
+                if abs(new_duty - duty) >= 1.0:
+                    duty = new_duty
+                    self.motor.set_speed(duty)
+        finally:
+            self.motor.stop()
+
+        stopped_weight = weight
+        # 정지 후 낙하 중인 사료가 모두 떨어질 때까지 대기
+        self.sleep(self.settle_time)
+        final_weight = self.read_weight()
+        if final_weight is None:
+            final_weight = stopped_weight
+        overshoot = final_weight - stopped_weight
+        if status == SUCCESS:
+            self.overshoot += self.overshoot_alpha * (max(overshoot, 0.0) - self.overshoot)
+            self._save_state()
+
+        result = DispenseResult(
+            status=status,
+            target=amount,
+            dispensed=final_weight - start_weight,
+            duration=self.clock() - started,
+            overshoot=overshoot,
+            reversals=reversals
+        )
+        logger.info(f"급여 종료 ({status}): {result.dispensed:.1f}g / {amount:.1f}g, "
+                    f"{result.duration:.1f}초, 역회전 {reversals}회")
+        return result
+
+
+def build_dispenser(motor, read_weight, config: Optional[Dict] = None) -> GravimetricDispenser:
+    """settings.json의 feeding.dispenser 설정으로 급여 컨트롤러 생성"""
+    config = config or {}
+    keys = ("control_rate", "max_duty", "min_duty", "slow_zone", "overshoot", "overshoot_alpha",
+            "jam_timeout", "jam_min_gain", "reverse_duty", "reverse_time", "max_reversals",
+            "settle_time", "timeout", "state_path")
+    return GravimetricDispenser(motor, read_weight, **{key: config[key] for key in keys if key in config})
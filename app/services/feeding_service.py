@@ -0,0 +1,253 @@
+# app/services/feeding_service.py
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+UTC = timezone.utc
+
+# 중단(전원 꺼짐 등)으로 급여 시간을 놓쳤을 때의 처리 방식
+CATCH_UP_POLICIES = ("skip", "latest", "all")
+
+# 급여가 끝난 것으로 보는 콜백 결과 (그 외 결과는 급여 가능 시간 안에서 다시 시도)
+COMPLETED_STATUSES = ("success", "partial_success")
+
+
+class SystemClock:
+    """실제 시계 (UTC 기준 aware datetime)"""
+
+    def now(self) -> datetime:
+        return datetime.now(UTC)
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+
+class SimulatedClock:
+    """테스트용 시계 - sleep()은 기다리지 않고 시각만 앞으로 이동"""
+
+    def __init__(self, start: datetime):
+        if start.tzinfo is None:
+            raise ValueError("start는 timezone이 지정된 datetime이어야 합니다")
+        self._now = start.astimezone(UTC)
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance(self, delta: timedelta):
+        """시각 이동 (다운타임, 시계 보정 등 재현)"""
+        self._now += delta
+
+    async def sleep(self, seconds: float):
+        self._now += timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+
+@dataclass
+class FeedingOccurrence:
+    """급여 일정의 하루치 발생 시각"""
+    scheduled_at: datetime   # 실제 급여 시각 (aware)
+    date: str                # 현지 날짜 (YYYY-MM-DD)
+    scheduled_time: str      # 일정에 적힌 시각 (HH:MM)
+    amount: float
+    late: bool = False       # 급여 가능 시간이 지난 뒤 보충 급여
+
+    @property
+    def key(self):
+        return (self.date, self.scheduled_time)
+
+    def to_feeding_info(self) -> dict:
+        """TaskExecutor.feeding_task()에 넘길 급여 정보"""
+        return {
+            "amount": self.amount,
+            "scheduled_time": self.scheduled_time,
+            "date": self.date,
+        }
+
+
+class FeedingTrigger:
+    """급여 일정의 다음 시각까지 잠들었다가 급여를 실행하는 타이머
+
+    매 틱마다 현재 시각을 비교하는 대신 일정에서 다음 급여 시각을 계산해 그때까지
+    대기합니다. 모든 비교는 UTC로 하고, 급여 시각은 매번 현지 시간대에서 다시 계산하므로
+    DST 전환이나 시계 보정이 있어도 하루에 한 번씩만 급여합니다.
+
+    - DST로 존재하지 않는 시각(예: 02:30)은 전환 직후 시각(03:30)에 급여
+    - 두 번 나타나는 시각은 첫 번째에 급여
+    """
+
+    def __init__(self,
+                 schedule_cache,
+                 is_fed: Callable[[str, str], bool],
+                 clock=None,
+                 timezone: Union[str, tzinfo, None] = None,
+                 window_minutes: int = 5,
+                 catch_up: str = "latest",
+                 catch_up_limit: timedelta = timedelta(hours=6),
+                 max_sleep: float = 30.0,
+                 retry_delay: float = 5.0,
+                 retry_max_delay: float = 60.0):
+        """
+        Args:
+            schedule_cache: FeedingScheduleCache (sorted_feedings() 제공)
+            is_fed: (date, scheduled_time) 급여 완료 여부 확인 함수
+            clock: now()/sleep()을 제공하는 시계 (기본: SystemClock)
+            timezone (str | tzinfo): 급여 일정의 시간대 (기본: 시스템 현지 시간대)
+            window_minutes (int): 예정 시각 이후 정상 급여로 보는 시간 (분)
+            catch_up (str): 놓친 급여 처리 방식
+                skip - 건너뜀 / latest - 가장 최근 1회만 급여 / all - 모두 급여
+            catch_up_limit (timedelta): 이보다 오래된 급여는 보충하지 않음
+            max_sleep (float): 최대 대기 시간 (초), 일정 변경이 반영되는 최대 지연
+            retry_delay (float): 급여 실패 후 첫 재시도까지 대기 (초, 실패할 때마다 2배)
+            retry_max_delay (float): 재시도 대기 최대값 (초)
+        """
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"알 수 없는 catch_up 정책: {catch_up}")
+
+        self.schedule_cache = schedule_cache
+        self.is_fed = is_fed
+        self.clock = clock or SystemClock()
+        if isinstance(timezone, str):
+            timezone = ZoneInfo(timezone)
+        self.tz = timezone or datetime.now().astimezone().tzinfo
+        self.window = timedelta(minutes=window_minutes)
+        self.catch_up = catch_up
+        self.catch_up_limit = max(catch_up_limit, self.window)
+        self.max_sleep = max_sleep
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self._handled = set()   # 급여를 마쳤거나 건너뛴 (date, scheduled_time)
+        self._retries: Dict[tuple, dict] = {}  # 실패한 급여 -> {attempts, next_at, deadline}
+
+    def _localize(self, day: date, scheduled_time: str) -> datetime:
+        hour, minute = map(int, scheduled_time.split(':'))
+        local = datetime.combine(day, time(hour, minute), tzinfo=self.tz)
+        # UTC 왕복으로 존재하지 않는 시각을 실제 시각으로 정규화
+        return local.astimezone(UTC).astimezone(self.tz)
+
+    def occurrences_between(self, start: datetime, end: datetime) -> List[FeedingOccurrence]:
+        """start < 급여 시각 <= end 인 급여 목록 (시각 순)"""
+        feedings = self.schedule_cache.sorted_feedings()
+        if not feedings:
+            return []
+
+        day = start.astimezone(self.tz).date() - timedelta(days=1)
+        last_day = end.astimezone(self.tz).date()
+        occurrences = []
+        while day <= last_day:
+            for feeding in feedings:
+                scheduled_at = self._localize(day, feeding["time"])
+                if start < scheduled_at <= end:
+                    occurrences.append(FeedingOccurrence(
+                        scheduled_at=scheduled_at,
+                        date=day.strftime("%Y-%m-%d"),
+                        scheduled_time=feeding["time"],
+                        amount=feeding["amount"],
+                    ))
+            day += timedelta(days=1)
+        occurrences.sort(key=lambda occurrence: occurrence.scheduled_at.astimezone(UTC))
+        return occurrences
+
+    def pending(self, now: datetime) -> List[FeedingOccurrence]:
+        """지금 실행해야 할 급여 목록 (catch_up 정책 적용, 재시도 시각이 된 실패 급여 포함)"""
+        candidates = []
+        retries = []
+        for occurrence in self.occurrences_between(now - self.catch_up_limit, now):
+            if occurrence.key in self._handled or self.is_fed(*occurrence.key):
+                continue
+            retry = self._retries.get(occurrence.key)
+            if retry is None:
+                candidates.append(occurrence)
+            elif now > retry["deadline"]:
+                logger.error(f"급여 재시도 포기 ({retry['attempts']}회 실패): "
+                             f"{occurrence.date} {occurrence.scheduled_time}")
+                self._handled.add(occurrence.key)
+                del self._retries[occurrence.key]
+            elif now >= retry["next_at"]:
+                occurrence.late = retry["late"]
+                retries.append(occurrence)
+        on_time = [o for o in candidates if now - o.scheduled_at <= self.window]
+        missed = [o for o in candidates if now - o.scheduled_at > self.window]
+
+        if self.catch_up == "all":
+            catch_up = missed
+        elif self.catch_up == "latest" and missed and not on_time:
+            catch_up = missed[-1:]
+        else:
+            catch_up = []
+
+        for occurrence in missed:
+            if occurrence in catch_up:
+                occurrence.late = True
+            else:
+                logger.warning(f"놓친 급여 건너뜀: {occurrence.date} {occurrence.scheduled_time}")
+                self._handled.add(occurrence.key)
+
+        # 보충 범위를 벗어난 기록은 정리
+        oldest = (now - self.catch_up_limit).astimezone(self.tz).date() - timedelta(days=1)
+        self._handled = {key for key in self._handled if key[0] >= oldest.strftime("%Y-%m-%d")}
+        self._retries = {key: retry for key, retry in self._retries.items()
+                         if key[0] >= oldest.strftime("%Y-%m-%d")}
+        return retries + catch_up + on_time
+
+    def record_result(self, occurrence: FeedingOccurrence, status: Optional[str], now: datetime):
+        """
+        급여 결과 기록 (성공했거나 급여 이력에 남았으면 완료, 아니면 백오프 후 재시도 예약)
+        Args:
+            occurrence (FeedingOccurrence): 실행한 급여
+            status (str): 콜백이 반환한 급여 결과 상태
+            now (datetime): 현재 시각
+        """
+        if status in COMPLETED_STATUSES or self.is_fed(*occurrence.key):
+            self._handled.add(occurrence.key)
+            self._retries.pop(occurrence.key, None)
+            return
+
+        retry = self._retries.setdefault(occurrence.key, {
+            "attempts": 0,
+            "late": occurrence.late,
+            # 정상 급여는 급여 가능 시간 끝까지, 보충 급여는 첫 시도부터 같은 시간 동안 재시도
+            "deadline": max(occurrence.scheduled_at, now) + self.window if occurrence.late
+            else occurrence.scheduled_at + self.window,
+        })
+        retry["attempts"] += 1
+        delay = min(self.retry_max_delay, self.retry_delay * 2 ** (retry["attempts"] - 1))
+        retry["next_at"] = now + timedelta(seconds=delay)
+        logger.warning(f"급여 실패 ({status}), {delay:.0f}초 후 재시도: "
+                       f"{occurrence.date} {occurrence.scheduled_time}")
+
+    def seconds_until_next(self, now: datetime) -> float:
+        """다음 급여 시각까지 대기할 시간 (초, max_sleep 이하)"""
+        wait = self.max_sleep
+        upcoming = self.occurrences_between(now, now + timedelta(days=2))
+        if upcoming:
+            wait = min(wait, (upcoming[0].scheduled_at - now).total_seconds())
+        for retry in self._retries.values():
+            wait = min(wait, max(0.0, (retry["next_at"] - now).total_seconds()))
+        return wait
+
+    async def run(self,
+                  callback: Callable[[FeedingOccurrence], Awaitable],
+                  until: Optional[datetime] = None):
+        """
+        급여 타이머 실행
+        Args:
+            callback: 급여 시각마다 호출할 비동기 함수 (급여 결과 상태를 반환,
+                success/partial_success가 아니고 급여 이력에도 없으면 다시 시도)
+            until (datetime): 이 시각이 지나면 종료 (기본: 취소될 때까지)
+        """
+        while until is None or self.clock.now() < until:
+            for occurrence in self.pending(self.clock.now()):
+                try:
+                    status = await callback(occurrence)
+                except Exception as e:
+                    logger.error(f"급여 실행 오류 ({occurrence.date} {occurrence.scheduled_time}): {e}")
+                    status = "error"
+                self.record_result(occurrence, status, self.clock.now())
+
+            await self.clock.sleep(self.seconds_until_next(self.clock.now()))
@@ -0,0 +1,362 @@
+# app/services/image_publisher.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from core.object_storage import StorageAdapter
+from models.frame import Frame
+
+logger = logging.getLogger(__name__)
+
+
+def _crop_eye(image: np.ndarray, box: Dict, scale: float = 1.0, margin: float = 0.2) -> np.ndarray:
+    """눈 영역을 여유 있게 잘라내기 (EyeDetectionModel.crop_eye와 같은 기준, scale: 원본 대비 이미지 배율)"""
+    x, y = int(box['x'] * scale), int(box['y'] * scale)
+    w, h = int(box['width'] * scale), int(box['height'] * scale)
+    margin_w, margin_h = int(w * margin), int(h * margin)
+    x1 = max(0, x - w // 2 - margin_w)
+    y1 = max(0, y - h // 2 - margin_h)
+    x2 = min(image.shape[1], x + w // 2 + margin_w)
+    y2 = min(image.shape[0], y + h // 2 + margin_h)
+    return image[y1:y2, x1:x2]
+
+
+class ImagePublisher:
+    """감지 결과 이미지를 축소/잘라내어 저장소에 올리는 단계
+
+    원본 4K JPEG 대신 썸네일과 눈 영역만 JPEG으로 인코딩해 올립니다. 렌더링은 원본을
+    다시 전체 디코딩하지 않고 JPEG 축소 디코딩(render_reduction) 결과에서 만들며,
+    인코딩은 스레드 풀에서 실행됩니다(cv2는 GIL을 해제).
+
+    렌더링한 JPEG은 먼저 spool_dir에 저장하고 manifest의 jobs에 게시 작업으로 기록한
+    뒤 원본을 삭제합니다. 업로드는 청크 단위 이어 올리기로 전송하고, 실패한 작업은
+    디스크에 남아 재시도 워커(start())가 백오프하며 다시 올립니다. 끊긴 업로드는
+    manifest의 세션 위치부터 이어서 재개하고, 완료되면 on_published로 결과를 넘깁니다.
+    올린 내용의 SHA-256을 manifest에 기록해 같은 내용은 다시 올리지 않습니다.
+
+        <prefix>/<sha256 앞 2자>/<sha256>.jpg
+    """
+
+    def __init__(self,
+                 storage: StorageAdapter,
+                 manifest_path: str = "data/images/manifest.json",
+                 prefix: str = "images",
+                 thumbnail_width: int = 640,
+                 thumbnail_quality: int = 80,
+                 crop_quality: int = 90,
+                 render_reduction: int = 2,
+                 chunk_size: int = 256 * 1024,
+                 max_workers: int = 2,
+                 delete_original: bool = True,
+                 spool_dir: Optional[str] = None,
+                 retry_delay: float = 30.0,
+                 retry_max_delay: float = 600.0,
+                 on_published: Optional[Callable[[Dict, Dict[str, str]], None]] = None):
+        """
+        Args:
+            storage (StorageAdapter): 업로드 대상 저장소
+            manifest_path (str): 업로드 기록(해시 -> 저장 위치) 파일 경로
+            prefix (str): 저장소 키 접두어
+            thumbnail_width (int): 썸네일 가로 크기 (px)
+            thumbnail_quality (int): 썸네일 JPEG 품질
+            crop_quality (int): 눈 영역 JPEG 품질
+            render_reduction (int): 렌더링용 축소 디코딩 비율 (1/2/4/8, 3840x2160 -> 1920x1080)
+            chunk_size (int): 업로드 청크 크기 (bytes, GCS는 256KiB 배수)
+            max_workers (int): 인코딩/업로드 스레드 수
+            delete_original (bool): 렌더링 결과를 저장한 뒤 원본 이미지 삭제
+            spool_dir (str): 업로드 전 렌더링 결과 보관 디렉토리 (기본: manifest 옆 spool)
+            retry_delay (float): 실패한 게시 작업 첫 재시도 대기 시간 (초)
+            retry_max_delay (float): 최대 재시도 대기 시간 (초)
+            on_published (Callable): 재시도로 게시가 끝난 작업의 (감지 결과, 이름 -> 저장 위치) 처리
+        """
+        self.storage = storage
+        self.manifest_path = manifest_path
+        self.prefix = prefix.strip("/")
+        self.thumbnail_width = thumbnail_width
+        self.thumbnail_quality = thumbnail_quality
+        self.crop_quality = crop_quality
+        self.render_reduction = render_reduction
+        self.chunk_size = chunk_size
+        self.delete_original = delete_original
+        self.spool_dir = spool_dir or os.path.join(os.path.dirname(os.path.abspath(manifest_path)), "spool")
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.on_published = on_published
+
+        self.bytes_uploaded = 0
+        self.uploads_skipped = 0
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-publish")
+        self._manifest = self._load_manifest()
+        self._active_jobs = set()              # 업로드 중인 게시 작업 (동시에 두 번 올리지 않음)
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def _load_manifest(self) -> Dict:
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        except Exception as e:
+            logger.error(f"업로드 기록 로드 실패, 새로 시작합니다: {e}")
+            manifest = {}
+        manifest.setdefault("uploaded", {})
+        manifest.setdefault("pending", {})
+        manifest.setdefault("jobs", {})
+        return manifest
+
+    def _save_manifest(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.manifest_path)), exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            # 감지 결과의 numpy 수치는 파이썬 값으로 저장
+            json.dump(self._manifest, f, indent=2, default=lambda o: o.item() if hasattr(o, "item") else str(o))
+        os.replace(tmp_path, self.manifest_path)
+
+    def render(self, detection: Dict) -> List[Tuple[str, bytes]]:
+        """
+        원본 이미지의 축소 디코딩 결과에서 썸네일과 눈 영역 JPEG 생성
+        Args:
+            detection (dict): EyeDetectionModel.to_detection_result() 결과 (눈 위치는 원본 좌표)
+        Returns:
+            List[(이름, JPEG 바이트)]: thumbnail, left_eye, right_eye
+        """
+        frame = Frame.from_path(detection["image_path"], reduction=self.render_reduction)
+        try:
+            image = frame.proxy
+        except ValueError as e:
+            raise FileNotFoundError(f"이미지를 읽을 수 없습니다: {detection['image_path']}") from e
+        scale = 1.0 / frame.reduction
+
+        outputs = []
+        height, width = image.shape[:2]
+        if width > self.thumbnail_width:
+            size = (self.thumbnail_width, round(height * self.thumbnail_width / width))
+            thumbnail = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        else:
+            thumbnail = image
+        outputs.append(("thumbnail", self._encode(thumbnail, self.thumbnail_quality)))
+
+        for side in ("left_eye", "right_eye"):
+            eye = detection.get(side)
+            if eye and eye.get("position"):
+                crop = _crop_eye(image, eye["position"], scale)
+                if crop.size:
+                    outputs.append((side, self._encode(crop, self.crop_quality)))
+        return outputs
+
+    @staticmethod
+    def _encode(image: np.ndarray, quality: int) -> bytes:
+        ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("JPEG 인코딩 실패")
+        return buffer.tobytes()
+
+    def upload(self, data: bytes, content_type: str = "image/jpeg") -> str:
+        """
+        데이터를 청크 단위로 올리고 저장 위치 반환 (같은 내용은 다시 올리지 않음)
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            uploaded = self._manifest["uploaded"].get(sha256)
+            pending = self._manifest["pending"].get(sha256)
+        if uploaded:
+            with self._lock:
+                self.uploads_skipped += 1
+            return uploaded["url"]
+
+        key = f"{self.prefix}/{sha256[:2]}/{sha256}.jpg"
+        total = len(data)
+        offset = 0
+        session = None
+        if pending:
+            # 이전에 끊긴 업로드는 저장소에 기록된 위치부터 이어서 전송
+            try:
+                session = pending["session"]
+                offset = self.storage.offset(session)
+            except FileExistsError:
+                offset = total
+            except Exception as e:
+                logger.warning(f"이전 업로드 세션을 이어갈 수 없어 새로 시작합니다: {e}")
+                session = None
+                offset = 0
+        if session is None:
+            session = self.storage.begin(key, total, content_type)
+            with self._lock:
+                self._manifest["pending"][sha256] = {"session": session, "key": key}
+                self._save_manifest()
+
+        while offset < total:
+            chunk = data[offset:offset + self.chunk_size]
+            self.storage.put_chunk(session, offset, chunk, total)
+            offset += len(chunk)
+            with self._lock:
+                self.bytes_uploaded += len(chunk)
+
+        url = self.storage.finish(session, key, sha256)
+        with self._lock:
+            self._manifest["pending"].pop(sha256, None)
+            self._manifest["uploaded"][sha256] = {"key": key, "url": url, "size": total}
+            self._save_manifest()
+        return url
+
+    def _spool_path(self, sha256: str) -> str:
+        return os.path.join(self.spool_dir, f"{sha256}.jpg")
+
+    def stage(self, detection: Dict) -> str:
+        """
+        렌더링 결과를 spool에 저장하고 게시 작업으로 기록 (이후 원본은 필요 없음)
+        Returns:
+            str: 게시 작업 ID
+        """
+        renders = self.render(detection)
+        os.makedirs(self.spool_dir, exist_ok=True)
+        images = {}
+        for name, data in renders:
+            sha256 = hashlib.sha256(data).hexdigest()
+            path = self._spool_path(sha256)
+            if not os.path.exists(path):
+                with open(path + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(path + ".tmp", path)
+            images[name] = sha256
+
+        record = dict(detection)
+        if self.delete_original:
+            record.pop("image_path", None)
+        job_id = f"{detection.get('timestamp', '')}_{images['thumbnail'][:12]}"
+        with self._lock:
+            self._manifest["jobs"][job_id] = {"detection": record, "images": images}
+            self._active_jobs.add(job_id)
+            self._save_manifest()
+
+        if self.delete_original:
+            try:
+                os.remove(detection["image_path"])
+            except OSError as e:
+                logger.warning(f"원본 이미지 삭제 실패: {e}")
+        return job_id
+
+    def _claim(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._manifest["jobs"].get(job_id)
+            if job is None or job_id in self._active_jobs:
+                return None
+            self._active_jobs.add(job_id)
+            return job
+
+    def _upload_job(self, job_id: str, job: Dict) -> Dict[str, str]:
+        """게시 작업의 이미지를 올리고 작업과 spool 파일 정리 (실패하면 작업은 남음)"""
+        try:
+            published = {}
+            for name, sha256 in job["images"].items():
+                try:
+                    with open(self._spool_path(sha256), "rb") as f:
+                        data = f.read()
+                except FileNotFoundError:
+                    logger.warning(f"게시할 이미지가 없어 건너뜁니다: {job_id}/{name}")
+                    continue
+                published[name] = self.upload(data)
+
+            with self._lock:
+                self._manifest["jobs"].pop(job_id, None)
+                in_use = {sha256 for other in self._manifest["jobs"].values() for sha256 in other["images"].values()}
+                self._save_manifest()
+            for sha256 in set(job["images"].values()) - in_use:
+                try:
+                    os.remove(self._spool_path(sha256))
+                except OSError:
+                    pass
+            return published
+        finally:
+            with self._lock:
+                self._active_jobs.discard(job_id)
+
+    def publish(self, detection: Dict) -> Optional[Dict[str, str]]:
+        """
+        감지 결과 이미지 게시 (동기)
+        Returns:
+            dict: 이름 -> 저장 위치 (thumbnail, left_eye, right_eye),
+                업로드에 실패해 재시도 워커로 넘긴 경우 None (완료 시 on_published 호출)
+        """
+        job_id = self.stage(detection)
+        with self._lock:
+            job = self._manifest["jobs"][job_id]
+        try:
+            published = self._upload_job(job_id, job)
+        except Exception as e:
+            logger.warning(f"이미지 업로드 실패, 나중에 다시 시도합니다 ({job_id}): {e}")
+            return None
+        logger.info(f"이미지 게시 완료: {job_id} ({len(published)}개)")
+        return published
+
+    @property
+    def pending_jobs(self) -> int:
+        """재시도 대기 중인 게시 작업 수"""
+        with self._lock:
+            return len(self._manifest["jobs"])
+
+    def retry_pending(self) -> bool:
+        """
+        남아 있는 게시 작업 재전송 (이전 실행에서 남은 작업 포함)
+        Returns:
+            bool: 남은 작업을 모두 올렸으면 True, 실패해서 중단했으면 False
+        """
+        with self._lock:
+            job_ids = list(self._manifest["jobs"])
+        for job_id in job_ids:
+            job = self._claim(job_id)
+            if job is None:
+                continue
+            try:
+                published = self._upload_job(job_id, job)
+            except Exception as e:
+                logger.warning(f"이미지 게시 재시도 실패 ({job_id}): {e}")
+                return False
+            logger.info(f"이미지 게시 재시도 성공: {job_id} ({len(published)}개)")
+            if self.on_published is not None:
+                try:
+                    self.on_published(job["detection"], published)
+                except Exception as e:
+                    logger.error(f"게시 결과 처리 실패 ({job_id}): {e}")
+        return True
+
+    def start(self):
+        """실패한 게시 작업 재시도 워커 시작"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._retry_loop, name="image-retry", daemon=True)
+        self._worker.start()
+
+    def _retry_loop(self):
+        delay = self.retry_delay
+        while not self._stop_event.wait(delay):
+            try:
+                done = self.retry_pending()
+            except Exception as e:
+                logger.error(f"이미지 재시도 워커 오류: {e}")
+                done = False
+            delay = self.retry_delay if done else min(delay * 2, self.retry_max_delay)
+
+    def submit(self, detection: Dict) -> Future:
+        """스레드 풀에서 publish() 실행 (asyncio.wrap_future로 기다릴 수 있음)"""
+        return self._executor.submit(self.publish, detection)
+
+    def close(self):
+        """재시도 워커와 스레드 풀 정리 (남은 작업은 다음 실행 때 재시도)"""
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5.0)
+            self._worker = None
+        self._executor.shutdown(wait=True)
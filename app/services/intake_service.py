@@ -0,0 +1,200 @@
+# app/services/intake_service.py
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.schemas import IntakeData
+from utils.signal_filters import build_filter_pipeline
+
+logger = logging.getLogger(__name__)
+
+# 감지기 상태
+IDLE = "idle"
+EATING = "eating"
+REMOVED = "removed"
+
+# 이벤트 종류
+INTAKE = "intake"
+REFILL = "refill"
+BOWL_REMOVED = "bowl_removed"
+BOWL_RETURNED = "bowl_returned"
+
+
+@dataclass
+class IntakeEvent:
+    """무게 변화 이벤트
+
+    kind: intake (섭취) / refill (사료 추가) / bowl_removed / bowl_returned
+    """
+    kind: str
+    start_time: float
+    end_time: float
+    start_weight: float
+    end_weight: float
+
+    @property
+    def change(self) -> float:
+        return self.end_weight - self.start_weight
+
+    def to_intake_data(self) -> IntakeData:
+        """섭취 이벤트를 IntakeData(duration 초, amount g)로 변환"""
+        return IntakeData(duration=self.end_time - self.start_time, amount=-self.change)
+
+    def to_log_record(self) -> Dict:
+        """weight_log.json 형식의 기록 (시각은 epoch 초 기준)"""
+        return {
+            "start_time": datetime.fromtimestamp(self.start_time).strftime("%Y-%m-%d %H:%M:%S"),
+            "end_time": datetime.fromtimestamp(self.end_time).strftime("%Y-%m-%d %H:%M:%S"),
+            "start_weight": self.start_weight,
+            "end_weight": self.end_weight,
+            "total_change": abs(self.change),
+        }
+
+
+class IntakeDetector:
+    """필터를 거친 무게 스트림을 식사 세션 단위로 나누는 상태 기계
+
+    idle    - 무게가 안정된 상태 (baseline 유지)
+    eating  - 무게가 흔들리기 시작하면 진입, session_gap 동안 안정되면 세션 종료
+    removed - 그릇을 들어 무게가 bowl_removed_below 아래로 떨어진 상태
+
+    원시 샘플은 저장하지 않고 세션 경계값만 보관하므로 메모리 사용량이 일정합니다.
+    """
+
+    def __init__(self,
+                 min_intake: float = 1.0,
+                 refill_threshold: float = 5.0,
+                 bowl_removed_below: float = -20.0,
+                 session_gap: float = 60.0,
+                 max_session: float = 1800.0):
+        """
+        Args:
+            min_intake (float): 섭취로 기록할 최소 감소량 (g)
+            refill_threshold (float): 사료 추가로 볼 최소 증가량 (g)
+            bowl_removed_below (float): 이 값(g)보다 가벼우면 그릇을 들어낸 것으로 판단
+            session_gap (float): 마지막 움직임 이후 이 시간(초) 동안 안정되면 세션 종료
+            max_session (float): 세션 최대 길이 (초)
+        """
+        self.min_intake = min_intake
+        self.refill_threshold = refill_threshold
+        self.bowl_removed_below = bowl_removed_below
+        self.session_gap = session_gap
+        self.max_session = max_session
+        self.reset()
+
+    def reset(self):
+        self.state = IDLE
+        self.baseline: Optional[float] = None
+        self.baseline_time = 0.0
+        self.session_start = 0.0
+        self.session_start_weight = 0.0
+        self.last_activity = 0.0
+        self.last_settled = 0.0
+        self.last_settled_time = 0.0
+
+    def _start_session(self, timestamp: float):
+        self.state = EATING
+        self.session_start = timestamp
+        self.session_start_weight = self.baseline
+        self.last_activity = timestamp
+        self.last_settled = self.baseline
+        self.last_settled_time = timestamp
+
+    def _close_session(self, end_weight: float, timestamp: float) -> List[IntakeEvent]:
+        events = []
+        change = end_weight - self.session_start_weight
+        end_time = max(self.last_activity, self.session_start)
+        if change <= -self.min_intake:
+            events.append(IntakeEvent(INTAKE, self.session_start, end_time, self.session_start_weight, end_weight))
+        elif change >= self.refill_threshold:
+            events.append(IntakeEvent(REFILL, self.session_start, end_time, self.session_start_weight, end_weight))
+        self.state = IDLE
+        self.baseline = end_weight
+        self.baseline_time = timestamp
+        return events
+
+    def update(self, timestamp: float, weight: float, stable: bool) -> List[IntakeEvent]:
+        """
+        필터 샘플 1개 처리
+        Args:
+            timestamp (float): 샘플 시각 (초)
+            weight (float): 필터를 거친 무게 (g)
+            stable (bool): 안정 여부
+        Returns:
+            List[IntakeEvent]: 이번 샘플로 확정된 이벤트
+        """
+        if self.baseline is None:
+            if stable:
+                self.baseline = weight
+                self.baseline_time = timestamp
+            return []
+
+        events: List[IntakeEvent] = []
+
+        if self.state == REMOVED:
+            if stable and weight >= self.bowl_removed_below:
+                events.append(IntakeEvent(BOWL_RETURNED, self.baseline_time, timestamp, self.baseline, weight))
+                # 그릇을 비우거나 채워서 돌려놓는 경우가 많으므로 증가분은 사료 추가로 기록
+                if weight - self.baseline >= self.refill_threshold:
+                    events.append(IntakeEvent(REFILL, self.baseline_time, timestamp, self.baseline, weight))
+                self.state = IDLE
+                self.baseline = weight
+                self.baseline_time = timestamp
+            return events
+
+        if stable and weight < self.bowl_removed_below:
+            if self.state == EATING:
+                events.extend(self._close_session(self.last_settled, timestamp))
+            events.append(IntakeEvent(BOWL_REMOVED, timestamp, timestamp, self.baseline, weight))
+            self.state = REMOVED
+            self.baseline_time = timestamp
+            return events
+
+        if not stable:
+            if self.state == IDLE:
+                self._start_session(timestamp)
+            self.last_activity = timestamp
+            return events
+
+        if self.state == IDLE:
+            if abs(weight - self.baseline) < self.min_intake:
+                return events
+            # 흔들림 없이 무게가 바뀐 경우 (샘플 간격이 긴 경우) 즉시 세션으로 처리
+            self._start_session(timestamp)
+
+        # 세션 중 안정된 무게
+        if weight - self.last_settled >= self.refill_threshold:
+            # 식사 도중 사료 추가: 지금까지의 섭취를 먼저 기록
+            refill_start, refill_start_time = self.last_settled, self.last_settled_time
+            events.extend(self._close_session(refill_start, timestamp))
+            events.append(IntakeEvent(REFILL, refill_start_time, timestamp, refill_start, weight))
+            self.baseline = weight
+            return events
+
+        self.last_settled = weight
+        self.last_settled_time = timestamp
+        if timestamp - self.last_activity >= self.session_gap or \
+                timestamp - self.session_start >= self.max_session:
+            events.extend(self._close_session(weight, timestamp))
+        return events
+
+
+def process_trace(trace: Iterable[Tuple[float, float]],
+                  detector: Optional[IntakeDetector] = None,
+                  filter_config: Optional[Dict] = None) -> List[IntakeEvent]:
+    """
+    기록된 (timestamp, weight) 무게 트레이스를 필터와 감지기에 차례로 통과시킴
+    Args:
+        trace: (시각 초, 무게 g) 순서열
+        detector (IntakeDetector): 사용할 감지기 (기본 설정으로 새로 생성)
+        filter_config (dict): 필터 설정 (utils.signal_filters.build_filter_pipeline 참고)
+    """
+    detector = detector or IntakeDetector()
+    pipeline = build_filter_pipeline(filter_config)
+    events = []
+    for timestamp, weight in trace:
+        result = pipeline.update(weight)
+        events.extend(detector.update(timestamp, result.value, result.stable))
+    return events
@@ -0,0 +1,143 @@
+# app/services/presence_service.py
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 감지기 상태
+ABSENT = "absent"
+ARRIVING = "arriving"
+PRESENT = "present"
+LEAVING = "leaving"
+
+# 이벤트 종류
+ARRIVAL = "arrival"
+DEPARTURE = "departure"
+
+
+@dataclass
+class PresenceEvent:
+    """방문 이벤트
+
+    kind: arrival (도착 확정) / departure (떠남 확정)
+    timestamp는 조건을 처음 만족한 시각이며, 확정은 dwell 시간 뒤에 이루어집니다.
+    """
+    kind: str
+    timestamp: float
+    distance: Optional[float]
+    duration: float = 0.0  # departure: 머문 시간 (초)
+
+
+class PresenceDetector:
+    """초음파 거리 스트림에서 방문(도착/떠남)을 판정하는 상태 기계
+
+    absent   - 아무것도 없음
+    arriving - enter_distance 안으로 들어옴, min_dwell 동안 유지되면 도착
+    present  - 도착 확정
+    leaving  - exit_distance 밖으로 나감(또는 에코 없음), exit_dwell 동안 유지되면 떠남
+
+    진입/이탈 거리를 다르게 두어(히스테리시스) 경계에서 값이 흔들려도 이벤트가 반복되지
+    않고, 떠난 뒤 cooldown 동안은 새 도착을 확정하지 않습니다.
+    """
+
+    def __init__(self,
+                 enter_distance: float = 15.0,
+                 exit_distance: float = 25.0,
+                 min_dwell: float = 1.0,
+                 exit_dwell: float = 3.0,
+                 cooldown: float = 30.0):
+        """
+        Args:
+            enter_distance (float): 이 거리(cm) 이하면 접근으로 판단
+            exit_distance (float): 이 거리(cm)보다 멀면 이탈로 판단 (enter_distance 이상)
+            min_dwell (float): 도착으로 확정할 최소 체류 시간 (초)
+            exit_dwell (float): 떠남으로 확정할 최소 이탈 시간 (초)
+            cooldown (float): 떠난 뒤 새 도착을 무시할 시간 (초)
+        """
+        if exit_distance < enter_distance:
+            raise ValueError("exit_distance는 enter_distance 이상이어야 합니다")
+        self.enter_distance = enter_distance
+        self.exit_distance = exit_distance
+        self.min_dwell = min_dwell
+        self.exit_dwell = exit_dwell
+        self.cooldown = cooldown
+        self.reset()
+
+    def reset(self):
+        self.state = ABSENT
+        self.since = 0.0              # 현재 상태(arriving/leaving)에 들어간 시각
+        self.arrived_at = 0.0
+        self.departed_at: Optional[float] = None
+
+    @property
+    def present(self) -> bool:
+        """도착이 확정되어 아직 떠나지 않은 상태"""
+        return self.state in (PRESENT, LEAVING)
+
+    def update(self, timestamp: float, distance: Optional[float]) -> List[PresenceEvent]:
+        """
+        거리 샘플 1개 처리
+        Args:
+            timestamp (float): 샘플 시각 (초)
+            distance (float | None): 거리 (cm), 에코가 없으면 None (범위 밖)
+        Returns:
+            List[PresenceEvent]: 이번 샘플로 확정된 이벤트
+        """
+        near = distance is not None and distance <= self.enter_distance
+        far = distance is None or distance > self.exit_distance
+
+        if self.state == ABSENT:
+            if near:
+                self.state = ARRIVING
+                self.since = timestamp
+            else:
+                return []
+
+        if self.state == ARRIVING:
+            if not near:
+                self.state = ABSENT
+                return []
+            in_cooldown = self.departed_at is not None and timestamp - self.departed_at < self.cooldown
+            if timestamp - self.since >= self.min_dwell and not in_cooldown:
+                self.state = PRESENT
+                self.arrived_at = self.since
+                return [PresenceEvent(ARRIVAL, self.since, distance)]
+            return []
+
+        if self.state == PRESENT:
+            if far:
+                self.state = LEAVING
+                self.since = timestamp
+            else:
+                return []
+
+        # LEAVING
+        if not far:
+            self.state = PRESENT
+            return []
+        if timestamp - self.since >= self.exit_dwell:
+            self.state = ABSENT
+            self.departed_at = self.since
+            return [PresenceEvent(DEPARTURE, self.since, distance, duration=self.since - self.arrived_at)]
+        return []
+
+
+def build_presence_detector(config: Optional[Dict] = None) -> PresenceDetector:
+    """
+    settings.json의 hardware.ultrasonic 설정으로 감지기 생성
+    Args:
+        config (dict): threshold_distance (m), exit_distance (m), dwell_time, exit_dwell_time, cooldown (초)
+            exit_distance가 없으면 threshold_distance의 1.5배 사용
+    """
+    config = config or {}
+    enter = config.get("threshold_distance", 0.15) * 100
+    exit_ = config.get("exit_distance", enter * 1.5 / 100) * 100
+    return PresenceDetector(
+        enter_distance=enter,
+        exit_distance=exit_,
+        min_dwell=config.get("dwell_time", 1.0),
+        exit_dwell=config.get("exit_dwell_time", 3.0),
+        cooldown=config.get("cooldown", 30.0),
+    )
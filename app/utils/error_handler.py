@@ -1,33 +1,40 @@
 import json
+import logging
+import threading
 from pathlib import Path
 from datetime import datetime
-import os
+
+logger = logging.getLogger(__name__)
 
 class ErrorHandler:
-    def __init__(self):
-        self.error_log_path = "logs/errors.json"
-        Path("logs").mkdir(exist_ok=True)
-        
-        if not os.path.exists(self.error_log_path):
-            with open(self.error_log_path, 'w') as f:
-                json.dump({"errors": []}, f)
-    
+    """에러 기록 (logs/errors.jsonl에 한 줄씩 추가)"""
+
+    def __init__(self, error_log_path: str = "logs/errors.jsonl"):
+        self.error_log_path = error_log_path
+        Path(error_log_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
     async def log_error(self, source: str, message: str):
-        """에러 로깅"""
+        """에러 로깅 (기존 기록을 다시 읽지 않고 파일 끝에 추가)"""
         try:
-            print(f"[error_handler] 에러 발생: {source} - {message}")
-            
-            with open(self.error_log_path, 'r') as f:
-                error_log = json.load(f)
-            
-            error_log["errors"].append({
+            logger.error(f"에러 발생: {source} - {message}")
+
+            entry = json.dumps({
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "source": source,
                 "message": message
-            })
-            
-            with open(self.error_log_path, 'w') as f:
-                json.dump(error_log, f, indent=2)
-                
+            }, ensure_ascii=False)
+
+            with self._lock, open(self.error_log_path, 'a', encoding='utf-8') as f:
+                f.write(entry + "\n")
+
         except Exception as e:
-            print(f"[error_handler] 에러 로깅 실패: {str(e)}")
\ No newline at end of file
+            logger.error(f"에러 로깅 실패: {str(e)}")
+
+    def read_errors(self):
+        """기록된 에러 목록"""
+        try:
+            with open(self.error_log_path, 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
@@ -1,8 +1,11 @@
+import logging
 from pathlib import Path
 import json
 import shutil
 import os
 
+logger = logging.getLogger(__name__)
+
 class FileManager:
     def __init__(self, base_dir="data"):
         self.base_dir = Path(base_dir)
@@ -31,12 +34,12 @@ class FileManager:
         
     async def cleanup(self):
         """임시 파일 정리"""
-        print("[file_manager] 임시 파일 정리 시작")
+        logger.info("임시 파일 정리 시작")
         for file_path in self.temp_files:
             try:
                 if os.path.exists(file_path):
                     os.remove(file_path)
-                    print(f"[file_manager] 파일 삭제: {file_path}")
+                    logger.debug(f"파일 삭제: {file_path}")
             except Exception as e:
-                print(f"[file_manager] 파일 삭제 실패: {file_path} - {str(e)}")
+                logger.error(f"파일 삭제 실패: {file_path} - {str(e)}")
         self.temp_files.clear()
\ No newline at end of file
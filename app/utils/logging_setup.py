@@ -0,0 +1,155 @@
+# app/utils/logging_setup.py
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+# LogRecord 기본 속성 (그 외 속성은 extra로 전달된 값으로 보고 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 위치(로거, 파일, 줄)에서 반복되는 로그를 interval마다 1건으로 줄임
+
+    생략된 건수는 다음으로 통과하는 레코드의 suppressed 속성에 기록됩니다.
+    max_level보다 높은 수준(기본: WARNING 이상)은 제한하지 않습니다.
+    """
+
+    def __init__(self, interval: float = 5.0, max_level: int = logging.INFO,
+                 clock=time.monotonic):
+        super().__init__()
+        self.interval = interval
+        self.max_level = max_level
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._last: Dict[tuple, list] = {}  # 위치 -> [마지막 통과 시각, 생략 건수]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.interval <= 0:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        now = self.clock()
+        with self._lock:
+            state = self._last.get(key)
+            if state is not None and now - state[0] < self.interval:
+                state[1] += 1
+                return False
+            suppressed = state[1] if state is not None else 0
+            self._last[key] = [now, 0]
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _ConsoleFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{text} (반복 {suppressed}건 생략)" if suppressed else text
+
+
+def setup_logging(log_dir: str = "logs",
+                  level: int = logging.INFO,
+                  console: bool = True,
+                  filename: str = "pet_feeder.jsonl",
+                  max_bytes: int = 1024 * 1024,
+                  backup_count: int = 5,
+                  buffer_capacity: int = 64,
+                  rate_limit: float = 5.0,
+                  levels: Optional[Dict[str, int]] = None) -> logging.handlers.QueueListener:
+    """
+    루트 로거에 비동기 로깅 파이프라인 설정
+
+    로그를 남기는 스레드는 QueueHandler로 큐에 넣기만 하고, QueueListener 스레드가
+    콘솔과 JSON lines 파일(크기 기준 순환)에 씁니다. 파일 쓰기는 buffer_capacity건씩 모아
+    한 번에 하며 WARNING 이상은 바로 씁니다 (SD 카드 쓰기 횟수 감소).
+
+    Args:
+        log_dir (str): 로그 디렉토리
+        level (int): 루트 로그 수준
+        console (bool): 콘솔 출력 여부
+        filename (str): JSON lines 파일 이름
+        max_bytes (int): 파일 최대 크기 (넘으면 순환)
+        backup_count (int): 보관할 순환 파일 수
+        buffer_capacity (int): 파일에 한 번에 쓸 레코드 수
+        rate_limit (float): 같은 위치의 INFO 이하 로그 최소 간격 (초, 0이면 제한 없음)
+        levels (dict): 로거 이름 -> 수준 (모듈별 수준 지정)
+    Returns:
+        QueueListener: 실행 중인 리스너 (shutdown_logging()으로 정리)
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(log_dir, filename), maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    file_handler.setFormatter(JsonFormatter())
+    handlers = [logging.handlers.MemoryHandler(buffer_capacity, flushLevel=logging.WARNING,
+                                               target=file_handler)]
+    if console:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(_ConsoleFormatter(
+            '%(asctime)s [%(levelname)s] %(name)s: %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+        handlers.append(stream_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    # 생략될 로그는 큐에 넣기 전에 버림
+    _queue_handler.addFilter(RateLimitFilter(rate_limit))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+    for name, logger_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """리스너를 멈추고 버퍼에 남은 로그를 파일에 씀"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+    _listener = None
+    _queue_handler = None
@@ -0,0 +1,68 @@
+# app/utils/metrics.py
+
+import asyncio
+from typing import Callable, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# 측정 구간별 버킷 (초). 기본 버킷(5ms~10s)은 센서 읽기처럼 짧은 구간을 구분하지 못함
+_FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+_PING_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.02, 0.03, 0.04, 0.05, 0.075, 0.1)
+_TASK_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+_INFERENCE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+TASK_DURATION = Histogram(
+    "petfeeder_task_duration_seconds", "TaskExecutor.execute_task 실행 시간",
+    ["task"], buckets=_TASK_BUCKETS)
+HX711_READ = Histogram(
+    "petfeeder_hx711_read_seconds", "HX711 24비트 프레임 읽기 시간 (변환 대기 제외)",
+    buckets=_FAST_BUCKETS)
+ULTRASONIC_PING = Histogram(
+    "petfeeder_ultrasonic_ping_seconds", "초음파 트리거부터 에코 수신(또는 시간 초과)까지",
+    buckets=_PING_BUCKETS)
+CAMERA_CAPTURE = Histogram(
+    "petfeeder_camera_capture_seconds", "카메라 단일 캡처 지연",
+    buckets=_INFERENCE_BUCKETS + (5, 10))
+INFERENCE = Histogram(
+    "petfeeder_inference_seconds", "모델별 추론 시간 (눈 검출기, 질병 분류 모델)",
+    ["model"], buckets=_INFERENCE_BUCKETS)
+UPLOAD_QUEUE_DEPTH = Gauge(
+    "petfeeder_upload_queue_depth", "전송 대기 중인 업로드 결과 수")
+EVENT_LOOP_LAG = Histogram(
+    "petfeeder_event_loop_lag_seconds", "이벤트 루프가 예정보다 늦게 깨어난 시간",
+    buckets=_FAST_BUCKETS + (0.25, 0.5, 1))
+TELEMETRY_DROPPED = Counter(
+    "petfeeder_telemetry_dropped", "느린 웹소켓 구독자 대기열에서 버린 텔레메트리 메시지 수")
+
+
+def track_upload_queue(pending: Callable[[], int]):
+    """
+    업로드 대기열 크기를 수집 시점에 조회하도록 등록
+    Args:
+        pending (Callable): 대기 중인 항목 수를 반환하는 함수 (FirebaseManager.pending_uploads)
+    """
+    def depth():
+        try:
+            return pending()
+        except Exception:
+            # 종료 중(대기열 DB가 닫힌 뒤)에는 값을 비워 둠
+            return float("nan")
+    UPLOAD_QUEUE_DEPTH.set_function(depth)
+
+
+async def monitor_event_loop(interval: float = 0.5):
+    """
+    interval마다 깨어나 예정 시각보다 늦어진 시간을 기록 (블로킹 호출이 루프를 막은 정도)
+    Args:
+        interval (float): 측정 주기 (초)
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - expected))
+
+
+def render() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 형식 (본문, Content-Type)"""
+    return generate_latest(), CONTENT_TYPE_LATEST
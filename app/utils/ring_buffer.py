@@ -0,0 +1,66 @@
+# app/utils/ring_buffer.py
+
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class RingBuffer:
+    """고정 크기 numpy 링 버퍼 (타임스탬프 + 값)
+
+    메모리를 미리 할당해 두고 가장 오래된 샘플부터 덮어씁니다. 쓰기 스레드 1개와
+    여러 읽기 스레드가 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        """
+        Args:
+            capacity (int): 보관할 최대 샘플 수
+            dtype: 값 배열의 자료형
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=dtype)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def append(self, timestamp: float, value):
+        with self._lock:
+            index = self._total % self.capacity
+            self._timestamps[index] = timestamp
+            self._values[index] = value
+            self._total += 1
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """지금까지 추가된 전체 샘플 수 (덮어쓴 샘플 포함)"""
+        return self._total
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """가장 최근 샘플 (timestamp, value), 비어 있으면 None"""
+        with self._lock:
+            if self._total == 0:
+                return None
+            index = (self._total - 1) % self.capacity
+            return float(self._timestamps[index]), self._values[index].item()
+
+    def last(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """최근 n개 샘플 (오래된 순서의 timestamps, values 복사본)"""
+        with self._lock:
+            n = min(n, len(self))
+            indices = np.arange(self._total - n, self._total) % self.capacity
+            return self._timestamps[indices], self._values[indices]
+
+    def since(self, total: int) -> Tuple[np.ndarray, np.ndarray]:
+        """전체 샘플 번호 total 이후에 추가된 샘플 (버퍼에 남아 있는 것만)"""
+        return self.last(self._total - total)
+
+    def clear(self):
+        with self._lock:
+            self._total = 0
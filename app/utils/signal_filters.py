@@ -0,0 +1,230 @@
+# app/utils/signal_filters.py
+
+import bisect
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# 무게 센서 기본 필터 설정 (단위: g)
+DEFAULT_FILTER_CONFIG = {
+    "median": 5,
+    "ema_alpha": None,
+    "kalman": {"process_noise": 0.05, "measurement_noise": 4.0},
+    "stability": {"window": 20, "threshold": 0.5},
+}
+
+
+class MedianFilter:
+    """최근 N개 값의 중앙값 (순간적인 튐 제거)"""
+
+    def __init__(self, size: int = 5):
+        self.size = size
+        self._window = deque()
+        self._sorted: List[float] = []
+
+    def update(self, value: float) -> float:
+        self._window.append(value)
+        bisect.insort(self._sorted, value)
+        if len(self._window) > self.size:
+            old = self._window.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, old)]
+
+        n = len(self._sorted)
+        middle = n // 2
+        if n % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    def reset(self):
+        self._window.clear()
+        self._sorted.clear()
+
+
+class EMAFilter:
+    """지수 이동 평균"""
+
+    def __init__(self, alpha: float = 0.3):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha는 0보다 크고 1 이하여야 합니다")
+        self.alpha = alpha
+        self.value: Optional[float] = None
+
+    def update(self, value: float) -> float:
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def reset(self):
+        self.value = None
+
+
+class Kalman1D:
+    """1차원 칼만 필터 (값이 거의 일정하다고 가정하는 모델)"""
+
+    def __init__(self, process_noise: float = 0.05, measurement_noise: float = 4.0):
+        """
+        Args:
+            process_noise (float): 샘플 사이 실제 값 변화의 분산 (q)
+            measurement_noise (float): 측정 잡음 분산 (r)
+        """
+        self.q = process_noise
+        self.r = measurement_noise
+        self.value: Optional[float] = None
+        self.error = 1.0
+
+    def update(self, value: float) -> float:
+        if self.value is None:
+            self.value = value
+            self.error = self.r
+            return self.value
+
+        self.error += self.q
+        gain = self.error / (self.error + self.r)
+        self.value += gain * (value - self.value)
+        self.error *= 1 - gain
+        return self.value
+
+    def reset(self):
+        self.value = None
+        self.error = 1.0
+
+
+class StabilityDetector:
+    """슬라이딩 윈도우 분산 기반 안정 판정
+
+    numpy 링 버퍼와 누적 합/제곱합으로 샘플당 O(1)에 분산을 갱신합니다.
+    누적 오차는 주기적으로 윈도우 전체를 다시 합산해 제거합니다.
+    """
+
+    RESYNC_INTERVAL = 4096
+
+    def __init__(self, window: int = 20, threshold: float = 0.5):
+        """
+        Args:
+            window (int): 분산을 계산할 샘플 수
+            threshold (float): 안정으로 볼 최대 표준편차
+        """
+        self.window = window
+        self.threshold = threshold
+        self._values = np.zeros(window, dtype=np.float64)
+        self.reset()
+
+    def reset(self):
+        self._count = 0
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def update(self, value: float) -> bool:
+        if self._count == 0:
+            self._shift = value  # 기준값을 빼서 제곱합의 자릿수 손실 방지
+        x = value - self._shift
+        index = self._count % self.window
+        if self._count >= self.window:
+            old = self._values[index]
+            self._sum -= old
+            self._sum_sq -= old * old
+        self._values[index] = x
+        self._sum += x
+        self._sum_sq += x * x
+        self._count += 1
+
+        if self._count % self.RESYNC_INTERVAL == 0:
+            self._sum = float(self._values.sum())
+            self._sum_sq = float(np.dot(self._values, self._values))
+        return self.stable
+
+    @property
+    def variance(self) -> float:
+        n = min(self._count, self.window)
+        if n == 0:
+            return 0.0
+        mean = self._sum / n
+        return max(0.0, self._sum_sq / n - mean * mean)
+
+    @property
+    def mean(self) -> float:
+        n = min(self._count, self.window)
+        return self._shift + (self._sum / n if n else 0.0)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stable(self) -> bool:
+        return self._count >= self.window and self.std <= self.threshold
+
+
+@dataclass
+class FilterResult:
+    value: float
+    stable: bool
+    std: float
+
+
+class FilterPipeline:
+    """필터 단계를 순서대로 적용하고 안정 여부를 함께 반환
+
+    안정 판정은 스무딩(EMA/칼만) 전 값으로 하여 평활화로 분산이 작아 보이는 것을 피합니다.
+    무게가 새로 안정되면 스무딩 단계를 윈도우 평균에서 다시 시작해, 안정 판정 시점의
+    값이 스무딩 지연 없이 새 무게를 나타내도록 합니다.
+    """
+
+    def __init__(self, outlier_stage: Optional[MedianFilter] = None,
+                 smoothing_stages: Optional[List] = None,
+                 stability: Optional[StabilityDetector] = None):
+        self.outlier_stage = outlier_stage
+        self.smoothing_stages = smoothing_stages or []
+        self.stability = stability or StabilityDetector()
+        self._was_stable = False
+
+    def update(self, value: float) -> FilterResult:
+        if self.outlier_stage is not None:
+            value = self.outlier_stage.update(value)
+        stable = self.stability.update(value)
+        if stable and not self._was_stable:
+            settled = self.stability.mean
+            for stage in self.smoothing_stages:
+                stage.reset()
+                stage.update(settled)
+        self._was_stable = stable
+        for stage in self.smoothing_stages:
+            value = stage.update(value)
+        return FilterResult(value=value, stable=stable, std=self.stability.std)
+
+    def reset(self):
+        if self.outlier_stage is not None:
+            self.outlier_stage.reset()
+        for stage in self.smoothing_stages:
+            stage.reset()
+        self.stability.reset()
+        self._was_stable = False
+
+
+def build_filter_pipeline(config: Optional[Dict] = None) -> FilterPipeline:
+    """
+    설정으로 필터 파이프라인 생성
+    Args:
+        config (dict): median (int|None), ema_alpha (float|None),
+            kalman ({process_noise, measurement_noise}|None), stability ({window, threshold})
+            지정하지 않은 항목은 DEFAULT_FILTER_CONFIG 값 사용
+    """
+    config = {**DEFAULT_FILTER_CONFIG, **(config or {})}
+
+    smoothing = []
+    if config.get("ema_alpha"):
+        smoothing.append(EMAFilter(config["ema_alpha"]))
+    if config.get("kalman"):
+        smoothing.append(Kalman1D(**config["kalman"]))
+
+    return FilterPipeline(
+        outlier_stage=MedianFilter(config["median"]) if config.get("median") else None,
+        smoothing_stages=smoothing,
+        stability=StabilityDetector(**config["stability"]),
+    )
@@ -0,0 +1,349 @@
+# app/utils/timeseries.py
+
+import logging
+import math
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 원시 샘플 레코드 (16 bytes)
+RECORD_DTYPE = np.dtype([("timestamp", "<f8"), ("value", "<f4"), ("flags", "<u4")])
+# 집계 레코드 (24 bytes) - timestamp는 구간 시작 시각
+AGGREGATE_DTYPE = np.dtype([("timestamp", "<f8"), ("mean", "<f4"), ("min", "<f4"),
+                            ("max", "<f4"), ("count", "<u4")])
+
+# flags 비트
+FLAG_STABLE = 0x1
+FLAG_ERROR = 0x2
+
+MAGIC = b"MTS1"
+HEADER_SIZE = 64
+HEADER_DTYPE = np.dtype([("magic", "S4"), ("record_size", "<u4"), ("count", "<u8"), ("capacity", "<u8")])
+
+# 단계별 (구간 길이 초, 세그먼트 길이 초, 세그먼트 최대 레코드 수)
+LEVELS = {
+    "raw": (None, 3600, 65536),
+    "1s": (1, 86400, 86400),
+    "1m": (60, 7 * 86400, 7 * 1440),
+    "1h": (3600, 366 * 86400, 366 * 24),
+}
+
+# 기본 보관 기간 (초, None은 무제한)
+DEFAULT_RETENTION = {
+    "raw": 7 * 86400,
+    "1s": 30 * 86400,
+    "1m": 365 * 86400,
+    "1h": None,
+}
+
+_SERIES_NAME = re.compile(r"^[A-Za-z0-9_]+$")
+_SEGMENT_NAME = re.compile(r"^(\d+)\.(\d+)\.bin$")
+
+
+class _Segment:
+    """메모리 매핑된 고정 폭 레코드 세그먼트 파일 (64 byte 헤더 + 레코드 배열)"""
+
+    def __init__(self, path: Path, dtype: np.dtype, capacity: int, writable: bool, segment_start: int = 0):
+        self.path = path
+        self.segment_start = segment_start
+        if not path.exists():
+            with open(path, "wb") as f:
+                f.truncate(HEADER_SIZE + capacity * dtype.itemsize)
+            header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+            header[0] = (MAGIC, dtype.itemsize, 0, capacity)
+            header.flush()
+            del header
+
+        mode = "r+" if writable else "r"
+        self.header = np.memmap(path, dtype=HEADER_DTYPE, mode=mode, shape=(1,))
+        if self.header["magic"][0] != MAGIC or self.header["record_size"][0] != dtype.itemsize:
+            raise ValueError(f"잘못된 세그먼트 파일: {path}")
+        self.capacity = int(self.header["capacity"][0])
+        self.records = np.memmap(path, dtype=dtype, mode=mode, offset=HEADER_SIZE, shape=(self.capacity,))
+        # memmap 인덱싱 오버헤드를 피하기 위해 같은 메모리를 가리키는 ndarray view 사용
+        self._records = self.records.view(np.ndarray)
+        self._count_field = self.header.view(np.ndarray)["count"]
+        self._writable = writable
+
+    @property
+    def count(self) -> int:
+        return int(self._count_field[0])
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def append(self, record: Tuple):
+        index = int(self._count_field[0])
+        self._records[index] = record
+        # 레코드를 먼저 쓰고 개수를 갱신해, 중간에 꺼져도 읽을 때 빈 레코드가 보이지 않도록 함
+        self._count_field[0] = index + 1
+
+    def view(self, start: float, end: float) -> np.ndarray:
+        """start <= timestamp < end 레코드 (복사 없는 view)"""
+        records = self._records[:self.count]
+        timestamps = records["timestamp"]
+        low = np.searchsorted(timestamps, start, side="left")
+        high = np.searchsorted(timestamps, end, side="left")
+        return records[low:high]
+
+    def flush(self):
+        if self._writable:
+            self.records.flush()
+            self.header.flush()
+
+
+class _Rollup:
+    """집계 구간 누적기"""
+
+    __slots__ = ("bucket", "start", "total", "minimum", "maximum", "count")
+
+    def __init__(self, bucket: int):
+        self.bucket = bucket
+        self.start = None
+        self.count = 0
+
+    def add(self, timestamp: float, value: float) -> Optional[Tuple]:
+        """샘플 추가, 구간이 바뀌면 완료된 집계 레코드 반환"""
+        start = math.floor(timestamp / self.bucket) * self.bucket
+        finished = None
+        if self.start is not None and start != self.start:
+            finished = self.record()
+            self.count = 0
+        if self.count == 0:
+            self.start = start
+            self.total = 0.0
+            self.minimum = value
+            self.maximum = value
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.count += 1
+        return finished
+
+    def record(self) -> Tuple:
+        return (self.start, self.total / self.count, self.minimum, self.maximum, self.count)
+
+
+class TimeSeriesStore:
+    """센서 샘플용 시계열 저장소
+
+    시리즈별로 원시 샘플(timestamp, value, flags)을 고정 폭 레코드로 메모리 매핑 세그먼트
+    파일에 추가하고, 1초/1분/1시간 집계를 함께 기록합니다. 세그먼트는 시간 구간별
+    파일이라 보관 기간이 지난 데이터는 파일 단위로 삭제됩니다.
+
+        data/timeseries/<series>/<level>/<세그먼트 시작 epoch>.<part>.bin
+    """
+
+    def __init__(self,
+                 root: str = "data/timeseries",
+                 retention: Optional[Dict[str, Optional[float]]] = None,
+                 levels: Optional[Dict[str, Tuple]] = None,
+                 clock=time.time):
+        """
+        Args:
+            root (str): 저장 디렉토리
+            retention (Dict): 단계별 보관 기간 (초), 지정하지 않은 단계는 기본값
+            levels (Dict): 단계별 (집계 구간, 세그먼트 길이, 세그먼트 용량) - 테스트용
+            clock: 보관 기간 계산용 시계
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.levels = dict(levels or LEVELS)
+        self.retention = {**DEFAULT_RETENTION, **(retention or {})}
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._writers: Dict[Tuple[str, str], _Segment] = {}
+        self._rollups: Dict[str, Dict[str, _Rollup]] = {}
+        self._last_timestamp: Dict[str, float] = {}
+        self.dropped = 0
+
+    @staticmethod
+    def _dtype(level: str) -> np.dtype:
+        return RECORD_DTYPE if level == "raw" else AGGREGATE_DTYPE
+
+    def _level_dir(self, series: str, level: str) -> Path:
+        return self.root / series / level
+
+    def _segments(self, series: str, level: str) -> List[Tuple[int, int, Path]]:
+        directory = self._level_dir(series, level)
+        if not directory.exists():
+            return []
+        segments = []
+        for path in directory.iterdir():
+            match = _SEGMENT_NAME.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), int(match.group(2)), path))
+        return sorted(segments)
+
+    def _writer(self, series: str, level: str, timestamp: float) -> _Segment:
+        _, segment_seconds, capacity = self.levels[level]
+        segment_start = int(timestamp // segment_seconds) * segment_seconds
+        writer = self._writers.get((series, level))
+        if writer is not None and writer.segment_start == segment_start and not writer.full:
+            return writer
+
+        if writer is not None:
+            writer.flush()
+        directory = self._level_dir(series, level)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # 같은 구간의 마지막 파일이 가득 찼으면 다음 part로 이어서 기록
+        parts = [part for start, part, _ in self._segments(series, level) if start == segment_start]
+        part = max(parts) if parts else 0
+        writer = _Segment(directory / f"{segment_start}.{part}.bin", self._dtype(level), capacity, True, segment_start)
+        if writer.full:
+            writer = _Segment(directory / f"{segment_start}.{part + 1}.bin", self._dtype(level), capacity, True,
+                              segment_start)
+        self._writers[(series, level)] = writer
+
+        if level == "raw":
+            self._enforce_retention_locked()
+        return writer
+
+    def _stored_last_timestamp(self, series: str) -> float:
+        """재시작 시 디스크에 남아 있는 마지막 원시 샘플 시각"""
+        segments = self._segments(series, "raw")
+        if not segments:
+            return float("-inf")
+        capacity = self.levels["raw"][2]
+        segment = _Segment(segments[-1][2], RECORD_DTYPE, capacity, False)
+        if segment.count == 0:
+            return float("-inf")
+        return float(segment._records["timestamp"][segment.count - 1])
+
+    def append(self, series: str, timestamp: float, value: float, flags: int = 0):
+        """
+        샘플 1개 추가
+        Args:
+            series (str): 시리즈 이름 (예: weight, ultrasonic)
+            timestamp (float): epoch 초
+            value (float): 측정값
+            flags (int): FLAG_* 비트
+        """
+        if not _SERIES_NAME.match(series):
+            raise ValueError(f"잘못된 시리즈 이름: {series}")
+
+        with self._lock:
+            # 세그먼트 안에서는 시각 순서를 유지해야 이진 탐색이 가능 (보관 기간이 지난 샘플도 버림)
+            if series not in self._last_timestamp:
+                self._last_timestamp[series] = self._stored_last_timestamp(series)
+            keep = self.retention.get("raw")
+            if timestamp < self._last_timestamp[series] or (keep is not None and timestamp < self.clock() - keep):
+                self.dropped += 1
+                return
+            self._last_timestamp[series] = timestamp
+
+            self._writer(series, "raw", timestamp).append((timestamp, value, flags))
+
+            rollups = self._rollups.get(series)
+            if rollups is None:
+                rollups = self._rollups[series] = {
+                    level: _Rollup(bucket) for level, (bucket, _, _) in self.levels.items() if bucket
+                }
+            for level, rollup in rollups.items():
+                finished = rollup.add(timestamp, value)
+                if finished is not None:
+                    self._writer(series, level, finished[0]).append(finished)
+
+    def query_views(self, series: str, start: float, end: float, level: str = "raw") -> List[np.ndarray]:
+        """
+        start <= timestamp < end 범위의 레코드를 세그먼트별 view 목록으로 반환 (복사 없음)
+        Args:
+            level (str): raw / 1s / 1m / 1h
+        """
+        if level not in self.levels:
+            raise ValueError(f"알 수 없는 단계: {level}")
+        _, segment_seconds, capacity = self.levels[level]
+
+        with self._lock:
+            views = []
+            for segment_start, _, path in self._segments(series, level):
+                if segment_start >= end or segment_start + segment_seconds <= start:
+                    continue
+                writer = self._writers.get((series, level))
+                if writer is not None and writer.path == path:
+                    segment = writer
+                else:
+                    segment = _Segment(path, self._dtype(level), capacity, False)
+                view = segment.view(start, end)
+                if len(view):
+                    views.append(view)
+            return views
+
+    def query(self, series: str, start: float, end: float, level: str = "raw") -> np.ndarray:
+        """
+        start <= timestamp < end 범위의 레코드 배열
+        범위가 한 세그먼트 안이면 복사 없는 view, 여러 세그먼트에 걸치면 이어 붙인 배열
+        """
+        views = self.query_views(series, start, end, level)
+        if len(views) == 1:
+            return views[0]
+        if not views:
+            return np.empty(0, dtype=self._dtype(level))
+        return np.concatenate(views)
+
+    def latest(self, series: str) -> Optional[Tuple[float, float, int]]:
+        """시리즈의 마지막 원시 샘플 (timestamp, value, flags)"""
+        with self._lock:
+            writer = self._writers.get((series, "raw"))
+            if writer is None or writer.count == 0:
+                return None
+            record = writer._records[writer.count - 1]
+            return float(record["timestamp"]), float(record["value"]), int(record["flags"])
+
+    def _enforce_retention_locked(self, now: Optional[float] = None) -> int:
+        now = self.clock() if now is None else now
+        removed = 0
+        for series_dir in self.root.iterdir():
+            if not series_dir.is_dir():
+                continue
+            for level, keep in self.retention.items():
+                if keep is None or level not in self.levels:
+                    continue
+                segment_seconds = self.levels[level][1]
+                for segment_start, _, path in self._segments(series_dir.name, level):
+                    if segment_start + segment_seconds > now - keep:
+                        continue
+                    writer = self._writers.get((series_dir.name, level))
+                    if writer is not None and writer.path == path:
+                        del self._writers[(series_dir.name, level)]
+                    os.remove(path)
+                    removed += 1
+        if removed:
+            logger.info(f"보관 기간이 지난 시계열 세그먼트 {removed}개 삭제")
+        return removed
+
+    def enforce_retention(self, now: Optional[float] = None) -> int:
+        """보관 기간이 지난 세그먼트 파일 삭제 (원시 세그먼트가 바뀔 때마다 자동 실행)"""
+        with self._lock:
+            return self._enforce_retention_locked(now)
+
+    def flush(self):
+        with self._lock:
+            for writer in self._writers.values():
+                writer.flush()
+
+    def close(self):
+        """진행 중인 집계 구간까지 기록하고 세그먼트를 디스크에 반영한 뒤 닫음
+
+        중간에 끊긴 구간은 count가 작은 집계 레코드로 남고, 재시작 후 같은 구간에 들어온
+        샘플은 같은 시작 시각의 레코드를 하나 더 만듭니다 (count 가중 평균으로 합칠 수 있음).
+        """
+        with self._lock:
+            for series, rollups in self._rollups.items():
+                for level, rollup in rollups.items():
+                    if rollup.count:
+                        self._writer(series, level, rollup.start).append(rollup.record())
+            for writer in self._writers.values():
+                writer.flush()
+            self._writers.clear()
+            self._rollups.clear()
@@ -0,0 +1,130 @@
+# benchmarks/bench_eye_localizer.py
+"""눈 위치 검출기 벤치마크 (프레임당 지연시간 / 처리량)
+
+원격(Roboflow) 검출기는 로컬 스텁 서버로 대체해 네트워크 없이 HTTP 왕복 비용만 측정합니다.
+
+    python benchmarks/bench_eye_localizer.py --frames 20 --stub-latency-ms 80
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from models.eye_localizer import ROBOFLOW_MODEL_ID, OpenCVEyeLocalizer, RoboflowEyeLocalizer
+
+STUB_PREDICTIONS = {
+    "predictions": [
+        {"x": 1500, "y": 900, "width": 180, "height": 120, "confidence": 0.92, "class": "eye"},
+        {"x": 2300, "y": 910, "width": 176, "height": 118, "confidence": 0.90, "class": "eye"},
+    ]
+}
+
+
+class RoboflowStubHandler(BaseHTTPRequestHandler):
+    """Roboflow 추론 API를 흉내 내는 스텁 (요청 본문을 읽고 고정 결과 반환)"""
+
+    latency = 0.0
+
+    def _reply(self, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.latency)
+        self._reply(STUB_PREDICTIONS)
+
+    def do_GET(self):
+        # 모델 레지스트리 조회 (inference_sdk v1 클라이언트)
+        self._reply({"models": [{
+            "model_id": ROBOFLOW_MODEL_ID,
+            "task_type": "object-detection",
+            "input_height": 640,
+            "input_width": 640,
+        }]})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency_ms: float) -> ThreadingHTTPServer:
+    RoboflowStubHandler.latency = latency_ms / 1000.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RoboflowStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_frames(count: int, width: int, height: int):
+    """합성 4K 프레임 생성 (노이즈 배경 + 눈 모양 원 2개)"""
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        frame = rng.integers(60, 120, (height, width, 3), dtype=np.uint8)
+        for cx in (width * 2 // 5, width * 3 // 5):
+            cv2.circle(frame, (cx, height // 2), height // 30, (40, 160, 200), -1)
+            cv2.circle(frame, (cx, height // 2), height // 90, (10, 10, 10), -1)
+        frames.append(frame)
+    return frames
+
+
+def bench(name: str, localizer, frames) -> dict:
+    localizer.locate(frames[0])  # 워밍업
+    latencies = []
+    start = time.perf_counter()
+    for frame in frames:
+        t0 = time.perf_counter()
+        localizer.locate(frame)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    result = {
+        "backend": name,
+        "frames": len(frames),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[round((len(latencies) - 1) * 0.95)], 2),
+        "fps": round(len(frames) / elapsed, 2),
+    }
+    print(f"{name:>10}: p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  {result['fps']:6.2f} fps")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0,
+                        help="스텁 서버 응답 지연 (네트워크/서버 추론 시간 가정)")
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames, args.width, args.height)
+    results = [bench("opencv", OpenCVEyeLocalizer(), frames)]
+
+    server = start_stub_server(args.stub_latency_ms)
+    try:
+        api_url = f"http://127.0.0.1:{server.server_address[1]}"
+        results.append(bench("roboflow", RoboflowEyeLocalizer(api_url, "stub-key"), frames))
+    except ImportError:
+        print("inference_sdk가 없어 원격 검출기 측정을 건너뜁니다")
+    finally:
+        server.shutdown()
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_loop_latency.py
+"""센서 폴링 중 /health 응답 지연 벤치마크
+
+메인 루프가 블로킹 센서 작업(초음파 0.5초, 무게 0.3초)을 이벤트 루프에서 직접
+실행할 때와 AsyncTaskExecutor로 스레드 풀에 넘길 때의 API 지연을 비교합니다.
+
+    python benchmarks/bench_loop_latency.py --seconds 5 --clients 8
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.async_executor import AsyncTaskExecutor
+
+
+class SimulatedTasks:
+    """TaskExecutor의 블로킹 시간을 흉내 내는 작업 모음"""
+
+    def __init__(self):
+        self.delays = {"ultrasonic": 0.5, "weight": 0.3, "feeding": 0.0}
+
+    def execute_task(self, task_id):
+        time.sleep(self.delays[task_id])
+        return {"status": "success", "data": task_id}
+
+
+async def control_loop(mode: str, stop: asyncio.Event):
+    tasks = SimulatedTasks()
+    executor = AsyncTaskExecutor(tasks)
+    try:
+        while not stop.is_set():
+            for task_id in ("ultrasonic", "weight", "feeding"):
+                if mode == "blocking":
+                    tasks.execute_task(task_id)
+                else:
+                    await executor.execute_task(task_id)
+            await asyncio.sleep(0.1)
+    finally:
+        executor.shutdown()
+
+
+async def client(http: httpx.AsyncClient, stop: asyncio.Event, latencies: list, period: float = 0.02):
+    # 요청 예정 시각 기준으로 측정 (루프가 멈춘 동안 보내지 못한 지연까지 포함)
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        response = await http.get("/health")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+        scheduled = max(scheduled + period, time.perf_counter() - 1.0)
+
+
+async def run(mode: str, seconds: float, clients: int) -> dict:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    stop = asyncio.Event()
+    latencies: list = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        workers = [asyncio.create_task(client(http, stop, latencies)) for _ in range(clients)]
+        loop_task = asyncio.create_task(control_loop(mode, stop))
+        await asyncio.sleep(seconds)
+        stop.set()
+        await asyncio.gather(loop_task, *workers)
+
+    latencies.sort()
+    result = {
+        "mode": mode,
+        "requests": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[round((len(latencies) - 1) * 0.99)], 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+    print(f"{mode:>9}: {result['requests']:6d} req  p50 {result['p50_ms']:8.2f}ms  "
+          f"p99 {result['p99_ms']:8.2f}ms  max {result['max_ms']:8.2f}ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=8)
+    args = parser.parse_args()
+
+    return [asyncio.run(run(mode, args.seconds, args.clients)) for mode in ("blocking", "async")]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+# benchmarks/run_benchmarks.py
+"""센서/스케줄링/비전 경로 벤치마크 (시뮬레이션 백엔드, 기준값 비교)
+
+    python benchmarks/run_benchmarks.py                  # baseline.json과 비교, 느려지면 종료 코드 1
+    python benchmarks/run_benchmarks.py --update-baseline
+    python benchmarks/run_benchmarks.py --only weight_read,feeding_check
+
+측정 항목 (모든 값은 낮을수록 좋음):
+    weight_read       WeightSensor.read() 24비트 프레임 비트 뱅잉/디코딩 (MockHX711)
+    read_average      샘플링 중 read_average(3) 지연 (80SPS MockHX711)
+    feeding_check     급여 이력 크기별 TaskExecutor.get_current_feeding_amount()
+    eye_pipeline      EyeDetectionModel 단계별 (decode, localize, crop, classify)
+    main_loop_jitter  시뮬레이션 PetFeeder.main_loop의 스케줄러 작업 지연
+
+기준값은 측정한 장치에서 다시 만들어야 의미가 있습니다 (개발 PC와 라즈베리파이는 다름).
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("MOCK_GPIO", "true")
+os.environ.setdefault("GPIOZERO_PIN_FACTORY", "mock")
+os.environ.setdefault("TESTING", "true")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.join(os.path.dirname(BENCH_DIR), "app")
+sys.path.append(APP_DIR)
+
+from hardware.simulation import MockHX711, SimulatedHardware, write_replay_frames
+from hardware.weight_sensor import WeightSensor
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[round((len(values) - 1) * q)]
+
+
+def summarize(samples_ms):
+    return {
+        "p50_ms": round(statistics.median(samples_ms), 4),
+        "p95_ms": round(percentile(samples_ms, 0.95), 4),
+    }
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+@contextlib.contextmanager
+def working_directory():
+    """앱이 상대 경로(data/, schedule/)에 쓰는 파일을 임시 디렉토리로 격리"""
+    previous = os.getcwd()
+    path = tempfile.mkdtemp(prefix="bench-")
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def bench_weight_read(args) -> dict:
+    # 변환이 항상 끝나 있도록 샘플링 속도를 높여 순수 프레임 읽기 비용만 측정
+    chip = MockHX711(sample_rate=1e6)
+    sensor = WeightSensor(pd_sck=chip.pd_sck, dout=chip.dout, auto_start=False, calibration_path=None)
+    try:
+        samples = timed(sensor.read, args.repeat * 20)
+    finally:
+        sensor.cleanup()
+    result = {"read_us": round(statistics.median(samples) * 1000, 2)}
+    print(f"{'weight_read':>16}: {result['read_us']:8.2f}us / frame")
+    return result
+
+
+def bench_read_average(args) -> dict:
+    chip = MockHX711(sample_rate=80)
+    sensor = WeightSensor(pd_sck=chip.pd_sck, dout=chip.dout, calibration_path=None)
+    try:
+        sensor.read_average(3)  # 워밍업
+        result = summarize(timed(lambda: sensor.read_average(3), args.repeat))
+    finally:
+        sensor.cleanup()
+    print(f"{'read_average':>16}: p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms")
+    return result
+
+
+def bench_feeding_check(args) -> dict:
+    from core.task_executor import TaskExecutor
+    from core.task_scheduler import RTOSScheduler
+
+    result = {}
+    for size in args.history_sizes:
+        with working_directory():
+            # 지금이 급여 시각이고, 이력에는 지난 날짜 기록만 있어 매번 이력 확인까지 진행
+            now = datetime.now()
+            os.makedirs("schedule")
+            with open("schedule/feeding_schedule.json", "w") as f:
+                json.dump({"feedings": [{"time": now.strftime("%H:%M"), "amount": 50}]}, f)
+            start = now.date() - timedelta(days=size // 3 + 1)
+            history = [
+                {"date": (start + timedelta(days=i // 3)).isoformat(),
+                 "scheduled_time": ("08:00", "12:00", "18:00")[i % 3],
+                 "actual_time": "08:00:05", "amount": 50, "weight_after": 50.0}
+                for i in range(size)
+            ]
+            with open("schedule/feeding_history.json", "w") as f:
+                json.dump({"feedings": history}, f)
+
+            simulation = SimulatedHardware()
+            executor = TaskExecutor(RTOSScheduler(), weight_sensor=simulation.create_weight_sensor())
+            try:
+                assert len(executor.feeding_history) == size
+                assert executor.get_current_feeding_amount() is not None
+                samples = timed(executor.get_current_feeding_amount, args.repeat * 20)
+            finally:
+                executor.cleanup()
+        result[f"check_{size}_us"] = round(statistics.median(samples) * 1000, 2)
+    print(f"{'feeding_check':>16}: " + "  ".join(f"{k} {v:.2f}us" for k, v in result.items()))
+    return result
+
+
+def bench_eye_pipeline(args) -> dict:
+    from models.eye_detection import EyeDetectionModel
+    from models.frame import Frame
+
+    with working_directory():
+        paths = write_replay_frames("frames", count=2, resolution=(3840, 2160))
+        model = EyeDetectionModel(localizer_backend="opencv")
+        stages = {"decode": [], "localize": [], "crop": [], "classify": []}
+        try:
+            for i in range(args.repeat):
+                path = str(paths[i % len(paths)])
+                t0 = time.perf_counter()
+                frame = Frame.from_path(path)
+                # Frame은 처음 접근할 때 디코딩하므로 축소 프록시/원본 디코딩을 이 단계에서 강제
+                frame.proxy, frame.image
+                t1 = time.perf_counter()
+                eyes = model.detect_eyes_in_frame(frame)
+                t2 = time.perf_counter()
+                if not eyes:
+                    # 합성 프레임에서 눈을 못 찾으면 고정 위치로 이후 단계를 측정
+                    h, w = frame.image.shape[:2]
+                    eyes = [{"x": w * 2 // 5, "y": h // 2, "width": h // 10, "height": h // 15},
+                            {"x": w * 3 // 5, "y": h // 2, "width": h // 10, "height": h // 15}]
+                crops = [model.crop_eye(frame.image, eye) for eye in eyes]
+                t3 = time.perf_counter()
+                if getattr(model, "_is_initialized", False):
+                    model.analyze_eyes(crops)
+                t4 = time.perf_counter()
+                frame.release()
+                for name, elapsed in zip(stages, (t1 - t0, t2 - t1, t3 - t2, t4 - t3)):
+                    stages[name].append(elapsed * 1000)
+        finally:
+            model.cleanup()
+
+    result = {f"{name}_ms": round(statistics.median(samples), 3) for name, samples in stages.items()}
+    print(f"{'eye_pipeline':>16}: " + "  ".join(f"{k} {v:.2f}" for k, v in result.items()))
+    return result
+
+
+def bench_main_loop_jitter(args) -> dict:
+    from gpiozero import Device
+    from gpiozero.pins.mock import MockFactory
+
+    with working_directory() as path:
+        shutil.copytree(os.path.join(APP_DIR, "config"), os.path.join(path, "app", "config"))
+        settings_path = os.path.join(path, "app", "config", "settings.json")
+        with open(settings_path) as f:
+            settings = json.load(f)
+        settings["hardware"]["backend"] = "simulation"
+        settings["startup"]["warm_up_models"] = False
+        settings["storage"]["upload_backend"] = "local"
+        with open(settings_path, "w") as f:
+            json.dump(settings, f)
+
+        import main
+        Device.pin_factory = MockFactory()
+        feeder = main.PetFeeder()
+
+        async def run_for(seconds):
+            loop_task = asyncio.create_task(feeder.main_loop())
+            await asyncio.sleep(seconds)
+            feeder.running = False
+            await loop_task
+            await feeder.cleanup()
+
+        asyncio.run(run_for(args.loop_seconds))
+        stats = feeder.scheduler.get_stats()
+        Device.pin_factory.reset()
+
+    result = {}
+    for task_id in ("ultrasonic", "weight"):
+        result[f"{task_id}_jitter_avg_ms"] = round(stats[task_id]["jitter_avg_ms"], 3)
+        result[f"{task_id}_jitter_max_ms"] = round(stats[task_id]["jitter_max_ms"], 3)
+        result[f"{task_id}_missed"] = stats[task_id]["missed"]
+    print(f"{'main_loop_jitter':>16}: " + "  ".join(f"{k} {v}" for k, v in result.items()))
+    return result
+
+
+BENCHMARKS = {
+    "weight_read": bench_weight_read,
+    "read_average": bench_read_average,
+    "feeding_check": bench_feeding_check,
+    "eye_pipeline": bench_eye_pipeline,
+    "main_loop_jitter": bench_main_loop_jitter,
+}
+
+
+def compare(results: dict, baseline: dict, tolerance: float, slack_ms: float) -> list:
+    """기준값보다 (1 + tolerance)배 넘게 느려진 항목 목록"""
+    regressions = []
+    for bench, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get("results", {}).get(bench, {}).get(metric)
+            if reference is None:
+                continue
+            # 아주 작은 값의 측정 잡음은 절대 허용치로 흡수 (us 단위 항목은 환산)
+            slack = slack_ms * 1000 if metric.endswith("_us") else slack_ms
+            if metric.endswith("_missed"):
+                slack = 1
+            limit = reference * (1 + tolerance) + slack
+            if value > limit:
+                regressions.append(f"{bench}.{metric}: {value} > {limit:.3f} (기준 {reference})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--only", default="", help="실행할 항목 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--history-sizes", type=lambda s: [int(v) for v in s.split(",")],
+                        default=[1000, 10000, 100000])
+    parser.add_argument("--loop-seconds", type=float, default=3.0)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="허용 비율 (0.5 = 50%% 느려짐까지 허용)")
+    parser.add_argument("--slack-ms", type=float, default=0.05, help="허용 절대 오차 (ms)")
+    args = parser.parse_args()
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()] or list(BENCHMARKS)
+    results = {name: BENCHMARKS[name](args) for name in selected}
+
+    if args.update_baseline:
+        baseline = {"results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline["machine"] = f"{platform.system()} {platform.machine()} / Python {platform.python_version()}"
+        baseline["updated"] = datetime.now().isoformat(timespec="seconds")
+        baseline.setdefault("results", {}).update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준값 파일이 없습니다: {args.baseline} (--update-baseline으로 생성)")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance, args.slack_ms)
+    if regressions:
+        print("성능 저하:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("기준값 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
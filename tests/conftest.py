@@ -0,0 +1,46 @@
+# tests/conftest.py
+import asyncio
+import json
+import os
+import shutil
+import sys
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.append(APP_DIR)
+
+import pytest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+
+@pytest.fixture
+def pin_factory():
+    Device.pin_factory = MockFactory()
+    yield Device.pin_factory
+    Device.pin_factory.reset()
+
+
+@pytest.fixture
+def simulated_feeder(tmp_path, monkeypatch):
+    """시뮬레이션 장치로 PetFeeder 전체 생성 (작업 디렉토리는 임시 경로)"""
+    shutil.copytree(os.path.join(APP_DIR, "config"), tmp_path / "app" / "config")
+    settings_path = tmp_path / "app" / "config" / "settings.json"
+    settings = json.loads(settings_path.read_text())
+    settings["hardware"]["simulation"]["time_scale"] = 4.0
+    settings["startup"]["warm_up_models"] = False
+    settings["storage"]["upload_backend"] = "local"
+    settings["feeding"]["dispenser"]["state_path"] = str(tmp_path / "dispenser.json")
+    settings_path.write_text(json.dumps(settings))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HARDWARE_BACKEND", "simulation")
+
+    import main
+    Device.pin_factory = MockFactory()
+    feeder = main.PetFeeder()
+    yield feeder
+    asyncio.run(feeder.cleanup())
+    Device.pin_factory.reset()
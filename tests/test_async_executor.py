@@ -0,0 +1,100 @@
+# tests/test_async_executor.py
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.async_executor import AsyncTaskExecutor
+from services.dispensing_service import GravimetricDispenser
+
+
+class BlockingTasks:
+    """time.sleep으로 블로킹하는 가짜 TaskExecutor"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = {}
+        self.max_overlap = 0
+        self._lock = threading.Lock()
+
+    def execute_task(self, task_id):
+        with self._lock:
+            self.active[task_id] = True
+            if self.active.get("weight") and self.active.get("feeding"):
+                self.max_overlap = 2
+        time.sleep(self.delays[task_id])
+        with self._lock:
+            self.active[task_id] = False
+        return {"status": "success", "data": task_id}
+
+
+def test_event_loop_keeps_running_during_blocking_task():
+    executor = AsyncTaskExecutor(BlockingTasks({"weight": 0.3}))
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        result = await executor.execute_task("weight")
+        ticker_task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(scenario())
+    executor.shutdown(wait=True)
+    assert result == {"status": "success", "data": "weight"}
+    assert ticks >= 10
+
+
+def test_tasks_sharing_a_device_do_not_overlap():
+    tasks = BlockingTasks({"weight": 0.1, "feeding": 0.1})
+    executor = AsyncTaskExecutor(tasks)
+
+    async def scenario():
+        return await asyncio.gather(executor.execute_task("feeding"), executor.execute_task("weight"))
+
+    results = asyncio.run(scenario())
+    executor.shutdown(wait=True)
+    assert [r["status"] for r in results] == ["success", "success"]
+    assert tasks.max_overlap == 0
+
+
+def test_timeout_and_busy():
+    executor = AsyncTaskExecutor(BlockingTasks({"ultrasonic": 0.3}), task_timeouts={"ultrasonic": 0.05})
+
+    async def scenario():
+        first = await executor.execute_task("ultrasonic")
+        second = await executor.execute_task("ultrasonic")
+        await asyncio.sleep(0.4)
+        third = await executor.execute_task("ultrasonic", timeout=1.0)
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    executor.shutdown(wait=True)
+    assert first["status"] == "error" and "timed out" in first["message"]
+    assert second["status"] == "busy"
+    assert third["status"] == "success"
+
+
+def test_feeding_timeout_covers_dispenser_budget():
+    tasks = BlockingTasks({})
+    tasks.dispenser = GravimetricDispenser(None, lambda: 0.0, timeout=60.0, settle_time=1.0,
+                                           max_reversals=3, reverse_time=0.5)
+    executor = AsyncTaskExecutor(tasks)
+    # 실행기가 급여 컨트롤러보다 먼저 포기하면 모터가 돌고 있는 채로 오류가 반환됨
+    assert executor.task_timeouts["feeding"] > tasks.dispenser.max_duration > 60.0
+
+    # 명시한 값이 우선
+    executor = AsyncTaskExecutor(tasks, task_timeouts={"feeding": 90.0})
+    assert executor.task_timeouts["feeding"] == 90.0
+    assert executor.task_timeouts["weight"] == 2.0
+    executor.shutdown(wait=True)
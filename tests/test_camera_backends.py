@@ -0,0 +1,72 @@
+# tests/test_camera_backends.py
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+from hardware.camera import CameraIMX219
+from hardware.camera_backends import FileReplayBackend, MjpegSplitter
+
+
+def _jpeg(value):
+    ok, data = cv2.imencode(".jpg", np.full((48, 64, 3), value, dtype=np.uint8))
+    assert ok
+    return data.tobytes()
+
+
+@pytest.fixture
+def replay_dir(tmp_path):
+    source = tmp_path / "fixtures"
+    source.mkdir()
+    for i, value in enumerate((10, 120, 240)):
+        (source / f"frame_{i}.jpg").write_bytes(_jpeg(value))
+    return source
+
+
+def test_capture_with_replay_backend(tmp_path, replay_dir):
+    camera = CameraIMX219(save_dir=str(tmp_path / "images"), backend=FileReplayBackend(str(replay_dir)))
+    try:
+        result = camera.capture()
+        assert result['status'] == 'success'
+        assert result['latency_ms'] >= 0
+        with open(result['image_path'], "rb") as f:
+            assert f.read() == result['data'] == (replay_dir / "frame_0.jpg").read_bytes()
+    finally:
+        camera.cleanup()
+
+
+def test_burst_keeps_every_frame(tmp_path, replay_dir):
+    camera = CameraIMX219(save_dir=str(tmp_path / "images"), backend=FileReplayBackend(str(replay_dir)))
+    try:
+        results = camera.capture_burst(count=5)
+        assert [r['status'] for r in results] == ['success'] * 5
+        assert len({r['image_path'] for r in results}) == 5
+        assert camera.get_latency_stats()['count'] == 5
+    finally:
+        camera.cleanup()
+
+
+def test_replay_without_loop_runs_out(tmp_path, replay_dir):
+    backend = FileReplayBackend([str(replay_dir / "frame_0.jpg")], loop=False)
+    camera = CameraIMX219(save_dir=str(tmp_path / "images"), backend=backend)
+    assert camera.capture()['status'] == 'success'
+    assert camera.capture()['status'] == 'error'
+
+
+def test_mjpeg_splitter_handles_split_chunks():
+    frames = [_jpeg(30), _jpeg(200)]
+    stream = b"garbage" + frames[0] + frames[1]
+
+    splitter = MjpegSplitter()
+    received = []
+    for i in range(0, len(stream), 97):
+        received.extend(splitter.feed(stream[i:i + 97]))
+
+    assert received == frames
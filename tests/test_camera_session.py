@@ -0,0 +1,103 @@
+# tests/test_camera_session.py
+import asyncio
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.camera_session import CameraSession
+
+
+class FakeCamera:
+    def __init__(self, frames, save_dir=None):
+        self.frames = frames
+        self.save_dir = save_dir
+        self.captured = 0
+        self.closed = False
+
+    async def stream_capture_session(self, duration, interval):
+        try:
+            for i in range(self.frames):
+                self.captured += 1
+                image_path = f"capture_{i}.jpg"
+                if self.save_dir is not None:
+                    image_path = os.path.join(self.save_dir, image_path)
+                    with open(image_path, "wb") as f:
+                        f.write(b"jpeg")
+                yield {'status': 'success', 'image_path': image_path}
+                await asyncio.sleep(interval)
+        finally:
+            self.closed = True
+
+
+class FakeDetector:
+    """capture_<n>.jpg 의 n 번째 프레임에서 confidences[n] 신뢰도의 양쪽 눈을 돌려준다"""
+
+    def __init__(self, confidences):
+        self.confidences = confidences
+        self.processed = []
+
+    def process_frame(self, frame):
+        index = int(os.path.basename(frame.path).split("_")[1].split(".")[0])
+        self.processed.append(index)
+        confidence = self.confidences[index]
+        if confidence is None:
+            return None
+        eye = {'position': {'x': 0, 'confidence': confidence}, 'diseases': {'ulcer': 0.1}}
+        return {'timestamp': str(index), 'image_path': frame.path, 'eyes': [eye, dict(eye)]}
+
+    def is_confident_result(self, result, threshold):
+        return result['eyes'][0]['position']['confidence'] >= threshold
+
+    def get_best_eye_results(self, results):
+        return max(results, key=lambda r: r['eyes'][0]['position']['confidence'], default=None)
+
+    def to_detection_result(self, best):
+        return best and {'image_path': best['image_path']}
+
+
+def test_session_stops_early_on_confident_result():
+    camera = FakeCamera(frames=20)
+    detector = FakeDetector([None, 0.75, 0.95] + [0.99] * 17)
+    session = CameraSession(camera, detector, duration=180, interval=0.001, confidence_threshold=0.9)
+
+    result = asyncio.run(session.run())
+
+    assert result == {'image_path': "capture_2.jpg"}
+    assert session.stopped_early
+    assert detector.processed == [0, 1, 2]
+    assert camera.captured < 20
+    assert camera.closed
+
+
+def test_session_returns_best_result_when_never_confident():
+    camera = FakeCamera(frames=4)
+    detector = FakeDetector([0.72, None, 0.8, 0.74])
+    session = CameraSession(camera, detector, interval=0, queue_size=1, confidence_threshold=0.9)
+
+    result = asyncio.run(session.run())
+
+    assert result == {'image_path': "capture_2.jpg"}
+    assert not session.stopped_early
+    assert detector.processed == [0, 1, 2, 3]
+
+
+def test_session_without_eyes_deletes_all_captures(tmp_path):
+    camera = FakeCamera(frames=3, save_dir=str(tmp_path))
+    detector = FakeDetector([None, None, None])
+    session = CameraSession(camera, detector, interval=0, delete_unused=True)
+
+    assert asyncio.run(session.run()) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_session_keeps_only_the_best_capture(tmp_path):
+    camera = FakeCamera(frames=4, save_dir=str(tmp_path))
+    detector = FakeDetector([0.72, None, 0.8, 0.74])
+    session = CameraSession(camera, detector, interval=0, confidence_threshold=0.9, delete_unused=True)
+
+    result = asyncio.run(session.run())
+
+    assert result == {'image_path': str(tmp_path / "capture_2.jpg")}
+    assert os.listdir(tmp_path) == ["capture_2.jpg"]
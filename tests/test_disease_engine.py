@@ -0,0 +1,103 @@
+# tests/test_disease_engine.py
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from models.disease_engine import DISEASE_MODELS, MODEL_SUFFIX, DiseaseInferenceEngine
+
+
+class FakeInterpreter:
+    """입력 배치의 평균 픽셀값을 확률로 돌려주는 가짜 TFLite 인터프리터"""
+
+    def __init__(self, model_path):
+        self.model_path = model_path
+        self.shape = [1, 224, 224, 3]
+        self.allocations = 0
+        self.input = None
+
+    def allocate_tensors(self):
+        self.allocations += 1
+
+    def get_input_details(self):
+        return [{'index': 0, 'shape': np.array(self.shape), 'dtype': np.uint8,
+                 'quantization': (1 / 255, 0)}]
+
+    def get_output_details(self):
+        return [{'index': 1, 'shape': np.array([self.shape[0], 1]), 'dtype': np.uint8,
+                 'quantization': (1 / 256, 0)}]
+
+    def resize_tensor_input(self, index, shape):
+        self.shape = list(shape)
+
+    def set_tensor(self, index, value):
+        assert value.dtype == np.uint8
+        assert list(value.shape) == self.shape
+        self.input = value
+
+    def invoke(self):
+        pass
+
+    def get_tensor(self, index):
+        return self.input.reshape(self.input.shape[0], -1).mean(axis=1, keepdims=True).astype(np.uint8)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    for prefix in DISEASE_MODELS.values():
+        (tmp_path / f"{prefix}{MODEL_SUFFIX}").write_bytes(b"")
+    return tmp_path
+
+
+def test_predict_batches_all_models(model_dir):
+    created = []
+
+    def factory(path):
+        interpreter = FakeInterpreter(path)
+        created.append(interpreter)
+        return interpreter
+
+    engine = DiseaseInferenceEngine(str(model_dir), pool_size=2, interpreter_factory=factory)
+    try:
+        assert len(created) == 2 * len(DISEASE_MODELS)
+
+        dark = np.zeros((60, 80, 3), dtype=np.uint8)
+        bright = np.full((90, 70, 3), 128, dtype=np.uint8)
+        results = engine.predict([dark, bright])
+
+        assert len(results) == 2
+        assert set(results[0]) == set(DISEASE_MODELS)
+        assert all(prob == 0.0 for prob in results[0].values())
+        assert all(prob == pytest.approx(0.5) for prob in results[1].values())
+
+        # 같은 배치 크기로 다시 추론하면 텐서를 재할당하지 않는다
+        used = [i for i in created if i.shape[0] == 2]
+        allocations = [i.allocations for i in used]
+        engine.predict([dark, bright])
+        assert [i.allocations for i in used] == allocations
+    finally:
+        engine.close()
+
+
+def test_missing_model_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DiseaseInferenceEngine(str(tmp_path), interpreter_factory=FakeInterpreter)
+
+
+def test_shipped_models():
+    """저장소에 포함된 실제 int8 모델로 추론 (TFLite 런타임이 있을 때만)"""
+    try:
+        engine = DiseaseInferenceEngine(pool_size=1)
+    except ImportError:
+        pytest.skip("TFLite 런타임이 설치되어 있지 않습니다")
+    try:
+        eye = np.random.default_rng(0).integers(0, 255, (120, 160, 3), dtype=np.uint8)
+        results = engine.predict([eye, eye])
+        assert results[0] == results[1]
+        assert all(0.0 <= prob <= 1.0 for prob in results[0].values())
+    finally:
+        engine.close()
@@ -0,0 +1,162 @@
+# tests/test_dispensing_service.py
+import json
+import os
+import sys
+from collections import deque
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from services.dispensing_service import JAMMED, SENSOR_ERROR, SUCCESS, TIMEOUT, GravimetricDispenser
+
+
+class FeederPlant:
+    """가상 시계로 움직이는 모터(오거) + 저울 모델
+
+    듀티에 비례해 사료가 배출되고 fall_time 뒤에 저울에 도달합니다 (정지 후 낙하량).
+    jammed이면 역회전하기 전까지 배출되지 않습니다.
+    """
+
+    def __init__(self, max_flow=20.0, stall_duty=20.0, fall_time=0.3, jammed=False, jam_clears=True):
+        self.now = 0.0
+        self.max_flow = max_flow
+        self.stall_duty = stall_duty
+        self.fall_time = fall_time
+        self.jammed = jammed
+        self.jam_clears = jam_clears
+        self.direction = 0
+        self.duty = 0.0
+        self.weight = 0.0
+        self.in_flight = deque()
+        self.commands = []
+
+    # MotorController 인터페이스
+    def forward(self, speed=50):
+        self.direction, self.duty = 1, speed
+        self.commands.append(("forward", self.now))
+
+    def backward(self, speed=50):
+        self.direction, self.duty = -1, speed
+        self.commands.append(("backward", self.now))
+        if self.jam_clears:
+            self.jammed = False
+
+    def set_speed(self, speed):
+        self.duty = speed
+
+    def stop(self):
+        self.direction, self.duty = 0, 0.0
+        self.commands.append(("stop", self.now))
+
+    def flow(self):
+        if self.direction != 1 or self.jammed or self.duty <= self.stall_duty:
+            return 0.0
+        return self.max_flow * (self.duty - self.stall_duty) / (100 - self.stall_duty)
+
+    # 시계/저울
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds, step=0.005):
+        end = self.now + seconds
+        while self.now < end:
+            dt = min(step, end - self.now)
+            self.in_flight.append((self.now + self.fall_time, self.flow() * dt))
+            self.now += dt
+            while self.in_flight and self.in_flight[0][0] <= self.now:
+                self.weight += self.in_flight.popleft()[1]
+
+    def read_weight(self):
+        return self.weight
+
+
+def make_dispenser(plant, **kwargs):
+    return GravimetricDispenser(plant, plant.read_weight, clock=plant.clock, sleep=plant.sleep, **kwargs)
+
+
+def test_dispenses_close_to_target_in_seconds():
+    plant = FeederPlant()
+    dispenser = make_dispenser(plant, overshoot=3.0)
+
+    result = dispenser.dispense(50)
+
+    assert result.status == SUCCESS
+    assert abs(result.error) < 2.0
+    assert result.duration < 10.0   # 최대 유량 20g/s
+    assert plant.commands[0][0] == "forward" and plant.commands[-1][0] == "stop"
+    assert result.overshoot > 0
+
+
+def test_overshoot_is_learned_across_feedings(tmp_path):
+    state_path = tmp_path / "dispenser.json"
+    plant = FeederPlant(fall_time=0.6)
+    dispenser = make_dispenser(plant, overshoot=0.0, overshoot_alpha=0.5, state_path=str(state_path))
+
+    first = dispenser.dispense(30)
+    errors = [first.error]
+    for _ in range(5):
+        plant.weight = 0.0
+        errors.append(dispenser.dispense(30).error)
+
+    assert errors[0] > 1.0                    # 낙하량을 모르는 첫 급여는 초과
+    assert abs(errors[-1]) < abs(errors[0]) / 2
+    assert json.loads(state_path.read_text())["overshoot"] == dispenser.overshoot
+    assert make_dispenser(plant, state_path=str(state_path)).overshoot == dispenser.overshoot
+
+
+def test_duty_ramps_down_near_target():
+    dispenser = GravimetricDispenser(None, lambda: 0.0, max_duty=100, min_duty=40, slow_zone=10)
+    assert dispenser.duty_for(50) == 100
+    assert dispenser.duty_for(5) == 70
+    assert dispenser.duty_for(0) == 40
+
+
+def test_jam_is_cleared_by_reversing():
+    plant = FeederPlant(jammed=True)
+    dispenser = make_dispenser(plant, jam_timeout=1.0)
+
+    result = dispenser.dispense(20)
+
+    assert result.status == SUCCESS and result.reversals == 1
+    backward = [t for name, t in plant.commands if name == "backward"]
+    assert len(backward) == 1 and 1.0 <= round(backward[0], 2) <= 1.1
+    assert result.dispensed >= 20
+
+
+def test_persistent_jam_stops_motor():
+    plant = FeederPlant(jammed=True, jam_clears=False)
+    dispenser = make_dispenser(plant, jam_timeout=0.5, max_reversals=2)
+
+    result = dispenser.dispense(20)
+
+    assert result.status == JAMMED and result.reversals == 3
+    assert result.dispensed == 0.0
+    assert plant.direction == 0
+    assert [name for name, _ in plant.commands].count("backward") == 2
+
+
+def test_sensor_failure_stops_motor():
+    plant = FeederPlant()
+    readings = iter([0.0, 1.0, None])
+    dispenser = GravimetricDispenser(plant, lambda: next(readings, None), clock=plant.clock, sleep=plant.sleep)
+
+    result = dispenser.dispense(20)
+
+    assert result.status == SENSOR_ERROR
+    assert plant.direction == 0
+
+
+def test_duration_stays_within_max_duration():
+    # 배출이 느려 timeout까지 가는 경우와 역회전을 모두 쓰고 막힘으로 끝나는 경우
+    slow = FeederPlant(max_flow=1.0)
+    dispenser = make_dispenser(slow, timeout=5.0)
+    result = dispenser.dispense(100)
+    assert result.status == TIMEOUT
+    assert dispenser.timeout < result.duration <= dispenser.max_duration
+
+    jammed = FeederPlant(jammed=True, jam_clears=False)
+    dispenser = make_dispenser(jammed, jam_timeout=1.9, max_reversals=3, reverse_time=0.5, timeout=7.0)
+    result = dispenser.dispense(20)
+    # 마지막 역회전 대기가 timeout을 넘겨도 예산 안에서 끝남
+    assert result.reversals == 3
+    assert dispenser.timeout + dispenser.settle_time < result.duration <= dispenser.max_duration
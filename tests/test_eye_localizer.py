@@ -0,0 +1,81 @@
+# tests/test_eye_localizer.py
+import os
+import sys
+
+import numpy as np
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import models.eye_localizer as eye_localizer
+from hardware.simulation.camera import write_replay_frames
+from models.eye_localizer import (EyeLocalizer, FallbackEyeLocalizer, OpenCVEyeLocalizer,
+                                  create_eye_localizer)
+
+EYE = {'x': 10.0, 'y': 20.0, 'width': 8.0, 'height': 6.0, 'confidence': 0.9}
+
+
+class StaticLocalizer(EyeLocalizer):
+    def __init__(self, name, result=None, error=None):
+        self.name = name
+        self.result = result or []
+        self.error = error
+        self.calls = 0
+
+    def locate(self, image):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def test_fallback_uses_next_backend_on_error_or_empty():
+    failing = StaticLocalizer("local", error=RuntimeError("offline"))
+    empty = StaticLocalizer("empty")
+    remote = StaticLocalizer("remote", result=[EYE])
+
+    localizer = FallbackEyeLocalizer([failing, empty, remote])
+    assert localizer.locate(np.zeros((4, 4, 3), dtype=np.uint8)) == [EYE]
+    assert (failing.calls, empty.calls, remote.calls) == (1, 1, 1)
+
+
+def test_fallback_stops_at_first_result():
+    local = StaticLocalizer("local", result=[EYE])
+    remote = StaticLocalizer("remote", result=[EYE, EYE])
+
+    assert FallbackEyeLocalizer([local, remote]).locate(np.zeros((4, 4, 3), dtype=np.uint8)) == [EYE]
+    assert remote.calls == 0
+
+
+def test_opencv_localizer_finds_eyes_in_replay_frames(tmp_path):
+    localizer = OpenCVEyeLocalizer(max_side=640)
+    width, height = 640, 480
+    radius = min(width, height) // 4
+
+    for i, path in enumerate(write_replay_frames(str(tmp_path), count=3, resolution=(width, height))):
+        eyes = localizer.locate(str(path))
+        assert eyes, f"눈을 찾지 못함: {path.name}"
+        # 그려 넣은 두 눈 중 하나의 위치
+        cx, cy = width // 2 + (i - 1) * width // 20, height // 2
+        centers = [(cx + side * radius // 2, cy - radius // 5) for side in (-1, 1)]
+        for eye in eyes:
+            assert set(eye) == {'x', 'y', 'width', 'height', 'confidence'}
+            assert 0.0 <= eye['confidence'] <= 1.0
+            assert min(abs(eye['x'] - x) + abs(eye['y'] - y) for x, y in centers) < radius // 4
+
+
+def test_auto_backend_without_model_or_api_is_opencv_only():
+    assert create_eye_localizer("auto", api_url=None, api_key=None,
+                                model_path="/nonexistent.tflite").name == "opencv"
+
+
+def test_auto_backend_prefers_roboflow_over_opencv(monkeypatch):
+    monkeypatch.setattr(eye_localizer, "RoboflowEyeLocalizer",
+                        lambda api_url, api_key: StaticLocalizer("roboflow", result=[EYE]))
+
+    localizer = create_eye_localizer("auto", api_url="https://detect.roboflow.com", api_key="key",
+                                     model_path="/nonexistent.tflite")
+    assert [backend.name for backend in localizer.localizers] == ["roboflow", "opencv"]
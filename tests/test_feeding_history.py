@@ -0,0 +1,57 @@
+# tests/test_feeding_history.py
+import json
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.feeding_history import FeedingHistoryStore
+
+
+def write_legacy(path, feedings):
+    with open(path, "w") as f:
+        json.dump({"feedings": feedings}, f)
+
+
+def test_imports_legacy_json_once(tmp_path):
+    legacy = tmp_path / "feeding_history.json"
+    write_legacy(legacy, [
+        {"date": "2024-01-01", "scheduled_time": "08:00", "actual_time": "08:01:10", "amount": 50, "weight_after": 48.5},
+        {"date": "2024-01-01", "scheduled_time": "18:00", "actual_time": "18:00:30", "amount": 50, "weight_after": 49.0},
+    ])
+    db = tmp_path / "feeding_history.db"
+
+    store = FeedingHistoryStore(str(db), str(legacy))
+    assert len(store) == 2
+    assert store.is_fed("2024-01-01", "08:00")
+    assert not store.is_fed("2024-01-02", "08:00")
+    store.close()
+
+    # 다시 열어도 중복으로 가져오지 않음
+    store = FeedingHistoryStore(str(db), str(legacy))
+    assert len(store) == 2
+    assert store.import_json(str(legacy)) == 0
+    assert store.all()[0]["weight_after"] == 48.5
+    store.close()
+
+
+def test_append_and_range_query(tmp_path):
+    store = FeedingHistoryStore(str(tmp_path / "history.db"), None)
+    for day in range(1, 31):
+        for time_str in ("08:00", "18:00"):
+            store.append({
+                "date": f"2024-03-{day:02d}",
+                "scheduled_time": time_str,
+                "actual_time": f"{time_str}:05",
+                "amount": 40,
+                "weight_after": 39.5,
+                "note": "manual",
+            })
+
+    assert store.is_fed("2024-03-15", "18:00")
+    week = store.query_range("2024-03-10", "2024-03-16")
+    assert len(week) == 14
+    assert week[0]["date"] == "2024-03-10" and week[0]["scheduled_time"] == "08:00"
+    assert week[-1]["note"] == "manual"
+    store.close()
@@ -0,0 +1,109 @@
+# tests/test_feeding_schedule.py
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.feeding_schedule import FeedingScheduleCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def write_schedule(path, feedings, mtime_ns=None):
+    with open(path, "w") as f:
+        json.dump({"feedings": feedings}, f)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_due_feedings_and_next_trigger(tmp_path):
+    path = tmp_path / "feeding_schedule.json"
+    write_schedule(path, [
+        {"time": "18:00", "amount": 80},
+        {"time": "08:00", "amount": 100},
+        {"time": "12:58", "amount": 50},
+    ])
+    cache = FeedingScheduleCache(str(path))
+
+    assert cache.due_feedings(datetime(2024, 1, 1, 8, 5), 5)[0]["amount"] == 100
+    assert cache.due_feedings(datetime(2024, 1, 1, 8, 6), 5) == []
+    assert cache.due_feedings(datetime(2024, 1, 1, 7, 59), 5) == []
+    # 정시를 넘어가는 급여 시간대
+    assert cache.due_feedings(datetime(2024, 1, 1, 13, 2), 5)[0]["time"] == "12:58"
+    assert cache.next_trigger(datetime(2024, 1, 1, 9, 0))["time"] == "12:58"
+    assert cache.next_trigger(datetime(2024, 1, 1, 18, 1)) is None
+
+
+def test_due_feedings_across_midnight(tmp_path):
+    path = tmp_path / "feeding_schedule.json"
+    write_schedule(path, [
+        {"time": "00:00", "amount": 30},
+        {"time": "23:50", "amount": 60},
+        {"time": "23:58", "amount": 40},
+    ])
+    cache = FeedingScheduleCache(str(path))
+
+    # 23:58 일정의 급여 시간대(~00:03)는 자정을 넘어감
+    assert [f["time"] for f in cache.due_feedings(datetime(2024, 1, 2, 0, 1), 5)] == ["23:58", "00:00"]
+    assert [f["time"] for f in cache.due_feedings(datetime(2024, 1, 2, 0, 3), 5)] == ["23:58", "00:00"]
+    assert [f["time"] for f in cache.due_feedings(datetime(2024, 1, 2, 0, 4), 5)] == ["00:00"]
+    assert [f["time"] for f in cache.due_feedings(datetime(2024, 1, 1, 23, 59), 5)] == ["23:58"]
+
+
+def test_reload_only_on_change(tmp_path, monkeypatch):
+    path = tmp_path / "feeding_schedule.json"
+    write_schedule(path, [{"time": "08:00", "amount": 100}], mtime_ns=1_000_000_000)
+    clock = FakeClock()
+    cache = FeedingScheduleCache(str(path), check_interval=1.0, clock=clock)
+
+    loads = []
+    original = json.load
+    monkeypatch.setattr(json, "load", lambda f: loads.append(1) or original(f))
+
+    for _ in range(100):
+        cache.get()
+    assert len(loads) == 1
+
+    write_schedule(path, [{"time": "09:00", "amount": 70}], mtime_ns=2_000_000_000)
+    assert cache.get()["feedings"][0]["time"] == "08:00"  # 확인 간격 이내
+    clock.now = 1.5
+    assert cache.get()["feedings"][0]["time"] == "09:00"
+    assert len(loads) == 2
+
+
+def test_save_updates_cache_immediately(tmp_path):
+    path = tmp_path / "feeding_schedule.json"
+    cache = FeedingScheduleCache(str(path), clock=FakeClock())
+    assert cache.get() is None
+
+    cache.save({"feedings": [{"time": "07:30", "amount": 60}]})
+    assert cache.due_feedings(datetime(2024, 1, 1, 7, 30), 5)[0]["amount"] == 60
+    with open(path) as f:
+        assert json.load(f)["feedings"][0]["time"] == "07:30"
+
+
+@pytest.mark.parametrize("schedule", [
+    {"feedings": 5},
+    {"feedings": [1]},
+    {"feedings": [{"time": 800, "amount": 50}]},
+    {"feedings": [{"time": "8", "amount": 50}]},
+    {"feedings": [{"time": "08:00", "amount": "50"}]},
+    {"feedings": [{"time": "08:00"}]},
+])
+def test_save_rejects_malformed_schedule(tmp_path, schedule):
+    path = tmp_path / "feeding_schedule.json"
+    cache = FeedingScheduleCache(str(path), clock=FakeClock())
+    with pytest.raises(ValueError):
+        cache.save(schedule)
+    assert not path.exists()
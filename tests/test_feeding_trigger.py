@@ -0,0 +1,127 @@
+# tests/test_feeding_trigger.py
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from services.feeding_service import FeedingTrigger, SimulatedClock
+
+
+class StaticSchedule:
+    def __init__(self, times, amount=50):
+        self.feedings = [{"time": t, "amount": amount} for t in sorted(times)]
+
+    def sorted_feedings(self):
+        return self.feedings
+
+
+class History:
+    def __init__(self):
+        self.fed = {}
+
+    def is_fed(self, date, scheduled_time):
+        return (date, scheduled_time) in self.fed
+
+
+def simulate(trigger, clock, history, until):
+    async def feed(occurrence):
+        assert occurrence.key not in history.fed
+        history.fed[occurrence.key] = clock.now()
+
+    asyncio.run(trigger.run(feed, until=until))
+
+
+def test_month_of_schedules_runs_fast():
+    tz = ZoneInfo("Asia/Seoul")
+    start = datetime(2024, 1, 1, 3, 0, tzinfo=tz)
+    clock = SimulatedClock(start)
+    history = History()
+    trigger = FeedingTrigger(StaticSchedule(["08:00", "12:00", "18:58"]), history.is_fed,
+                             clock=clock, timezone=tz, max_sleep=86400)
+
+    began = time.perf_counter()
+    simulate(trigger, clock, history, start + timedelta(days=31))
+    assert time.perf_counter() - began < 1.0
+
+    assert len(history.fed) == 31 * 3
+    for (date, scheduled_time), fed_at in history.fed.items():
+        local = fed_at.astimezone(tz)
+        assert local.strftime("%Y-%m-%d %H:%M") == f"{date} {scheduled_time}"
+
+
+def test_dst_gap_and_overlap_feed_once():
+    tz = ZoneInfo("America/New_York")
+    history = History()
+    trigger = FeedingTrigger(StaticSchedule(["01:30", "02:30"]), history.is_fed,
+                             clock=None, timezone=tz, max_sleep=86400)
+
+    # 봄: 02:30이 없는 날은 03:30(EDT)에 급여
+    start = datetime(2024, 3, 9, 12, 0, tzinfo=tz)
+    clock = SimulatedClock(start)
+    trigger.clock = clock
+    simulate(trigger, clock, history, start + timedelta(days=2))
+    assert history.fed[("2024-03-10", "02:30")] == datetime(2024, 3, 10, 7, 30, tzinfo=timezone.utc)
+
+    # 가을: 01:30이 두 번 있는 날은 첫 번째(EDT)에 한 번만 급여
+    start = datetime(2024, 11, 2, 12, 0, tzinfo=tz)
+    clock = SimulatedClock(start)
+    trigger.clock = clock
+    simulate(trigger, clock, history, start + timedelta(days=2))
+    assert history.fed[("2024-11-03", "01:30")] == datetime(2024, 11, 3, 5, 30, tzinfo=timezone.utc)
+    assert sum(1 for date, _ in history.fed if date == "2024-11-03") == 2
+
+
+def test_catch_up_policies_after_downtime():
+    tz = ZoneInfo("Asia/Seoul")
+    now = datetime(2024, 1, 1, 19, 0, tzinfo=tz)
+    schedule = StaticSchedule(["08:00", "12:00", "18:00"])
+
+    def pending(policy):
+        trigger = FeedingTrigger(schedule, History().is_fed, timezone=tz, catch_up=policy,
+                                 catch_up_limit=timedelta(hours=12))
+        return [(o.scheduled_time, o.late) for o in trigger.pending(now)]
+
+    assert pending("skip") == []
+    assert pending("latest") == [("18:00", True)]
+    assert pending("all") == [("08:00", True), ("12:00", True), ("18:00", True)]
+
+
+def test_window_crossing_hour_boundary():
+    tz = ZoneInfo("Asia/Seoul")
+    trigger = FeedingTrigger(StaticSchedule(["18:58"]), History().is_fed, timezone=tz, catch_up="skip")
+    assert [o.scheduled_time for o in trigger.pending(datetime(2024, 1, 1, 19, 2, tzinfo=tz))] == ["18:58"]
+
+
+def test_failed_feeding_is_retried_with_backoff_within_window():
+    tz = ZoneInfo("Asia/Seoul")
+    start = datetime(2024, 1, 1, 7, 59, tzinfo=tz)
+    clock = SimulatedClock(start)
+    history = History()
+    trigger = FeedingTrigger(StaticSchedule(["08:00", "12:00"]), history.is_fed, clock=clock,
+                             timezone=tz, retry_delay=5, retry_max_delay=60)
+    attempts = []
+
+    async def feed(occurrence):
+        attempts.append((occurrence.scheduled_time, clock.now().astimezone(tz)))
+        if occurrence.scheduled_time == "08:00" and len(attempts) < 3:
+            return "error"      # 실행기 시간 초과, 센서 오류 등
+        if occurrence.scheduled_time == "12:00":
+            return "error"      # 계속 실패하면 급여 가능 시간이 끝날 때 포기
+        history.fed[occurrence.key] = clock.now()
+        return "success"
+
+    asyncio.run(trigger.run(feed, until=start + timedelta(hours=5)))
+
+    morning = [at for scheduled_time, at in attempts if scheduled_time == "08:00"]
+    assert [(at - morning[0]).total_seconds() for at in morning] == [0, 5, 15]
+    assert ("2024-01-01", "08:00") in history.fed
+
+    noon = [at for scheduled_time, at in attempts if scheduled_time == "12:00"]
+    assert len(noon) > 3
+    assert noon[-1] - noon[0] <= timedelta(minutes=5)
+    assert ("2024-01-01", "12:00") not in history.fed
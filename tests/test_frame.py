@@ -0,0 +1,55 @@
+# tests/test_frame.py
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from models.frame import Frame
+
+
+@pytest.fixture
+def jpeg_path(tmp_path):
+    image = np.zeros((240, 320, 3), dtype=np.uint8)
+    cv2.rectangle(image, (80, 60), (160, 120), (255, 255, 255), -1)
+    path = tmp_path / "capture.jpg"
+    cv2.imwrite(str(path), image)
+    return str(path)
+
+
+def test_proxy_does_not_decode_full_image(jpeg_path):
+    frame = Frame.from_path(jpeg_path, reduction=4)
+
+    assert frame.proxy.shape == (60, 80, 3)
+    assert not frame.is_decoded
+
+    assert frame.image.shape == (240, 320, 3)
+    assert frame.is_decoded
+    assert frame.image is frame.image  # 원본은 한 번만 디코딩
+
+
+def test_from_bytes_matches_from_path(jpeg_path):
+    with open(jpeg_path, "rb") as f:
+        frame = Frame.from_bytes(f.read(), path=jpeg_path)
+
+    assert np.array_equal(frame.image, Frame.from_path(jpeg_path).image)
+
+
+def test_proxy_from_array_and_coordinate_mapping():
+    frame = Frame.from_array(np.zeros((2160, 3840, 3), dtype=np.uint8), reduction=4)
+    assert frame.proxy.shape == (540, 960, 3)
+
+    box = frame.proxy_to_full({'x': 100, 'y': 50, 'width': 20, 'height': 10, 'confidence': 0.9})
+    assert box == {'x': 400.0, 'y': 200.0, 'width': 80.0, 'height': 40.0, 'confidence': 0.9}
+
+
+def test_release(jpeg_path):
+    frame = Frame.from_path(jpeg_path)
+    frame.image
+    frame.release()
+    assert not frame.is_decoded
+    assert frame.path == jpeg_path
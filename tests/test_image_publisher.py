@@ -0,0 +1,164 @@
+# tests/test_image_publisher.py
+import os
+import sys
+import threading
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import cv2
+import numpy as np
+import pytest
+
+from core.object_storage import LocalStorage
+from services.image_publisher import ImagePublisher
+
+
+def write_capture(path, seed=0):
+    """4K 캡처 흉내 (그라디언트 + 잡음)"""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 200, 3840, dtype=np.float32)
+    y = np.linspace(0, 200, 2160, dtype=np.float32)[:, None]
+    base = ((x + y) / 2).astype(np.uint8)
+    image = np.stack([base, 200 - base, np.full_like(base, 100)], axis=-1)
+    image += rng.integers(0, 40, image.shape, dtype=np.uint8)
+    cv2.imwrite(str(path), image, [cv2.IMWRITE_JPEG_QUALITY, 95])
+    return str(path)
+
+
+def detection_for(image_path):
+    return {
+        "timestamp": "20240101_080000",
+        "image_path": image_path,
+        "left_eye": {"position": {"x": 1500, "y": 900, "width": 200, "height": 120, "confidence": 0.9}},
+        "right_eye": {"position": {"x": 2300, "y": 900, "width": 200, "height": 120, "confidence": 0.9}},
+    }
+
+
+class FlakyStorage(LocalStorage):
+    """fail_after개 청크를 받은 뒤 연결이 끊기는 저장소"""
+
+    def __init__(self, root, fail_after):
+        super().__init__(root)
+        self.fail_after = fail_after
+        self.chunks = 0
+
+    def put_chunk(self, session, offset, data, total):
+        if self.fail_after is not None and self.chunks >= self.fail_after:
+            raise ConnectionError("연결 끊김")
+        self.chunks += 1
+        super().put_chunk(session, offset, data, total)
+
+
+def test_publish_uploads_small_renditions_and_removes_original(tmp_path):
+    image_path = write_capture(tmp_path / "capture.jpg")
+    original_size = os.path.getsize(image_path)
+    storage = LocalStorage(str(tmp_path / "bucket"))
+    publisher = ImagePublisher(storage, manifest_path=str(tmp_path / "manifest.json"))
+
+    published = publisher.submit(detection_for(image_path)).result(timeout=30)
+
+    assert set(published) == {"thumbnail", "left_eye", "right_eye"}
+    thumbnail = cv2.imread(published["thumbnail"])
+    assert thumbnail.shape[1] == 640 and thumbnail.shape[0] == 360
+    # 올린 데이터가 원본보다 한 자릿수 이상 작음
+    assert publisher.bytes_uploaded * 10 < original_size
+    assert not os.path.exists(image_path)
+    publisher.close()
+
+
+def test_same_content_is_not_uploaded_twice(tmp_path):
+    storage = LocalStorage(str(tmp_path / "bucket"))
+    manifest = str(tmp_path / "manifest.json")
+    publisher = ImagePublisher(storage, manifest_path=manifest)
+    first = publisher.publish(detection_for(write_capture(tmp_path / "a.jpg")))
+    uploaded = publisher.bytes_uploaded
+
+    # 재시작 후에도 manifest로 중복 업로드를 건너뜀
+    restarted = ImagePublisher(storage, manifest_path=manifest)
+    second = restarted.publish(detection_for(write_capture(tmp_path / "a.jpg")))
+    assert second == first
+    assert restarted.bytes_uploaded == 0 and restarted.uploads_skipped == 3
+    assert uploaded > 0
+    publisher.close()
+    restarted.close()
+
+
+def test_interrupted_upload_resumes_from_committed_offset(tmp_path):
+    storage = FlakyStorage(str(tmp_path / "bucket"), fail_after=2)
+    manifest = str(tmp_path / "manifest.json")
+    publisher = ImagePublisher(storage, manifest_path=manifest, chunk_size=1024)
+    data = bytes(range(256)) * 20  # 5120 bytes = 5 청크
+
+    with pytest.raises(ConnectionError):
+        publisher.upload(data)
+
+    storage.fail_after = None
+    resumed = ImagePublisher(storage, manifest_path=manifest, chunk_size=1024)
+    url = resumed.upload(data)
+
+    # 끊기기 전에 올린 2개 청크는 다시 보내지 않음
+    assert resumed.bytes_uploaded == len(data) - 2 * 1024
+    with open(url, "rb") as f:
+        assert f.read() == data
+    publisher.close()
+    resumed.close()
+
+
+def test_render_uses_reduced_decode(tmp_path, monkeypatch):
+    image_path = write_capture(tmp_path / "capture.jpg")
+    publisher = ImagePublisher(LocalStorage(str(tmp_path / "bucket")), manifest_path=str(tmp_path / "manifest.json"))
+    flags = []
+    imread = cv2.imread
+    monkeypatch.setattr(cv2, "imread", lambda path, flag=cv2.IMREAD_COLOR: flags.append(flag) or imread(path, flag))
+
+    renders = dict(publisher.render(detection_for(image_path)))
+
+    # 4K 전체 디코딩 대신 1/2 축소 디코딩 한 번
+    assert flags == [cv2.IMREAD_REDUCED_COLOR_2]
+    crop = cv2.imdecode(np.frombuffer(renders["left_eye"], np.uint8), cv2.IMREAD_COLOR)
+    # 원본 좌표의 200x120 눈 + 여유 20% -> 축소 이미지에서 140x84
+    assert crop.shape[:2] == (84, 140)
+    publisher.close()
+
+
+def test_failed_publish_is_kept_on_disk_and_retried(tmp_path):
+    image_path = write_capture(tmp_path / "capture.jpg")
+    storage = FlakyStorage(str(tmp_path / "bucket"), fail_after=1)
+    manifest = str(tmp_path / "manifest.json")
+    publisher = ImagePublisher(storage, manifest_path=manifest, chunk_size=1024)
+
+    # 업로드가 끊기면 렌더링 결과는 spool에 남고 원본은 삭제
+    assert publisher.publish(detection_for(image_path)) is None
+    assert publisher.pending_jobs == 1
+    assert not os.path.exists(image_path)
+    publisher.close()
+
+    # 재시작 후 재시도 워커가 끊긴 위치부터 이어 올리고 결과를 넘김
+    storage.fail_after = None
+    delivered = []
+    restarted = ImagePublisher(storage, manifest_path=manifest, chunk_size=1024,
+                               on_published=lambda detection, images: delivered.append((detection, images)))
+    assert restarted.retry_pending()
+    assert restarted.pending_jobs == 0
+    assert os.listdir(restarted.spool_dir) == []
+
+    detection, images = delivered[0]
+    assert set(images) == {"thumbnail", "left_eye", "right_eye"}
+    assert "image_path" not in detection and detection["left_eye"]["position"]["x"] == 1500
+    assert restarted.bytes_uploaded + 1024 == sum(os.path.getsize(url) for url in images.values())
+    restarted.close()
+
+
+def test_retry_worker_publishes_pending_jobs(tmp_path):
+    storage = FlakyStorage(str(tmp_path / "bucket"), fail_after=0)
+    delivered = threading.Event()
+    publisher = ImagePublisher(storage, manifest_path=str(tmp_path / "manifest.json"), retry_delay=0.05,
+                               on_published=lambda detection, images: delivered.set())
+    publisher.start()
+    assert publisher.publish(detection_for(write_capture(tmp_path / "capture.jpg"))) is None
+
+    storage.fail_after = None
+    assert delivered.wait(5.0)
+    assert publisher.pending_jobs == 0
+    publisher.close()
@@ -0,0 +1,98 @@
+# tests/test_intake_service.py
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import numpy as np
+
+from services.intake_service import IntakeDetector, process_trace
+
+RATE = 10  # Hz
+
+
+class TraceBuilder:
+    """(timestamp, weight) 무게 트레이스 생성"""
+
+    def __init__(self, weight, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.t = 0.0
+        self.weight = weight
+        self.samples = []
+
+    def _emit(self, values):
+        for value in values:
+            self.samples.append((self.t, float(value)))
+            self.t += 1.0 / RATE
+
+    def hold(self, seconds, noise=0.05):
+        n = int(seconds * RATE)
+        self._emit(self.weight + self.rng.normal(0.0, noise, n))
+
+    def ramp(self, seconds, target):
+        n = int(seconds * RATE)
+        self._emit(np.linspace(self.weight, target, n) + self.rng.normal(0.0, 0.3, n))
+        self.weight = target
+
+    def eat(self, seconds, amount):
+        # 고개를 박고 먹는 동안 ±15g 흔들림
+        n = int(seconds * RATE)
+        trend = np.linspace(self.weight, self.weight - amount, n)
+        self._emit(trend + 15.0 * np.sin(np.arange(n) * 1.7))
+        self.weight -= amount
+
+    def set(self, weight):
+        self.weight = weight
+
+
+def summarize(events):
+    return [(e.kind, round(e.change)) for e in events]
+
+
+def test_refill_meal_and_bowl_removal():
+    trace = TraceBuilder(0.8)
+    trace.hold(30)
+    trace.ramp(28, 101.4)            # 사료 배출
+    trace.hold(60)
+    for _ in range(3):               # 15초 간격으로 3번 나눠 먹음
+        trace.eat(10, 30.0)
+        trace.hold(15)
+    trace.hold(90)
+    trace.set(-150.0)                # 그릇 들어냄
+    trace.hold(20)
+    trace.set(61.4)                  # 사료를 채워서 돌려놓음
+    trace.hold(30)
+
+    events = process_trace(trace.samples)
+    assert summarize(events) == [
+        ("refill", 101),
+        ("intake", -90),
+        ("bowl_removed", -161),
+        ("bowl_returned", 50),
+        ("refill", 50),
+    ]
+
+    intake = events[1].to_intake_data()
+    assert abs(intake.amount - 90.0) < 1.0
+    assert 60.0 <= intake.duration <= 75.0
+    assert events[1].to_log_record()["total_change"] == abs(events[1].change)
+
+
+def test_small_drift_is_not_intake():
+    trace = TraceBuilder(50.0)
+    trace.hold(20)
+    trace.ramp(120, 49.6)
+    trace.hold(120)
+    assert process_trace(trace.samples) == []
+
+
+def test_session_closes_after_gap_with_bounded_state():
+    detector = IntakeDetector(session_gap=5.0)
+    assert detector.update(0.0, 100.0, True) == []
+    assert detector.update(1.0, 90.0, False) == []
+    assert detector.update(2.0, 95.0, True) == []
+    assert detector.update(5.9, 95.0, True) == []
+    events = detector.update(6.0, 95.0, True)
+    assert [(e.kind, e.start_time, e.end_time, e.change) for e in events] == [("intake", 1.0, 1.0, -5.0)]
+    assert detector.state == "idle" and detector.baseline == 95.0
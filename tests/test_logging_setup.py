@@ -0,0 +1,93 @@
+# tests/test_logging_setup.py
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+from utils.error_handler import ErrorHandler
+from utils.logging_setup import RateLimitFilter, setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    yield tmp_path
+    shutdown_logging()
+    for handler in saved_handlers:
+        root.addHandler(handler)
+    root.setLevel(saved_level)
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_json_lines_with_repeated_messages_rate_limited(log_dir):
+    setup_logging(log_dir=str(log_dir), console=False, rate_limit=60)
+    logger = logging.getLogger("hardware.weight_sensor")
+    for i in range(100):
+        logger.info(f"현재 무게: {i}g")
+    logger.warning("센서가 초기화되지 않았습니다")
+    logger.warning("센서가 초기화되지 않았습니다")
+    logger.info("측정 완료", extra={"weight": 12.5})
+    shutdown_logging()
+
+    lines = read_lines(log_dir / "pet_feeder.jsonl")
+    assert [line["message"] for line in lines] == [
+        "현재 무게: 0g",
+        "센서가 초기화되지 않았습니다",
+        "센서가 초기화되지 않았습니다",
+        "측정 완료",
+    ]
+    assert lines[0]["logger"] == "hardware.weight_sensor" and lines[0]["level"] == "INFO"
+    assert lines[-1]["weight"] == 12.5
+
+
+def test_rate_limit_reports_suppressed_count():
+    now = [0.0]
+    limiter = RateLimitFilter(interval=1.0, clock=lambda: now[0])
+    logger = logging.getLogger("test.rate")
+
+    def record():
+        return logger.makeRecord(logger.name, logging.INFO, "task.py", 10, "tick", None, None)
+
+    passed = []
+    for step in range(25):
+        now[0] = step * 0.1
+        rec = record()
+        if limiter.filter(rec):
+            passed.append((now[0], getattr(rec, "suppressed", 0)))
+
+    assert passed == [(0.0, 0), (1.0, 9), (2.0, 9)]
+
+
+def test_file_rotation(log_dir):
+    setup_logging(log_dir=str(log_dir), console=False, rate_limit=0, max_bytes=2000,
+                  backup_count=2, buffer_capacity=1)
+    logger = logging.getLogger("test.rotation")
+    for i in range(200):
+        logger.info(f"line {i}")
+    shutdown_logging()
+
+    files = sorted(os.listdir(log_dir))
+    assert files == ["pet_feeder.jsonl", "pet_feeder.jsonl.1", "pet_feeder.jsonl.2"]
+    assert all(os.path.getsize(log_dir / name) <= 2000 for name in files)
+    assert read_lines(log_dir / "pet_feeder.jsonl")[-1]["message"] == "line 199"
+
+
+def test_error_handler_appends_lines(tmp_path):
+    handler = ErrorHandler(str(tmp_path / "errors.jsonl"))
+    for i in range(3):
+        asyncio.run(handler.log_error("weight", f"측정 실패 {i}"))
+
+    errors = handler.read_errors()
+    assert [e["message"] for e in errors] == ["측정 실패 0", "측정 실패 1", "측정 실패 2"]
+    assert errors[0]["source"] == "weight"
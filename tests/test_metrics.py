@@ -0,0 +1,105 @@
+# tests/test_metrics.py
+import asyncio
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, CollectorRegistry, Histogram
+
+from core.task_executor import TaskExecutor
+from core.task_scheduler import RTOSScheduler
+from hardware import ultrasonic, weight_sensor
+from hardware.simulation import MockHX711, SimulatedHardware
+from hardware.weight_sensor import WeightSensor
+from utils import metrics
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_execute_task_duration_is_recorded_per_task(tmp_path, monkeypatch, pin_factory):
+    monkeypatch.chdir(tmp_path)
+    simulation = SimulatedHardware()
+    sensor = simulation.create_weight_sensor()
+    executor = TaskExecutor(RTOSScheduler(), weight_sensor=sensor)
+    try:
+        before = sample("petfeeder_task_duration_seconds_count", task="weight")
+        executor.execute_task("weight")
+        executor.execute_task("weight")
+        assert sample("petfeeder_task_duration_seconds_count", task="weight") == before + 2
+        # 없는 작업은 기록하지 않음
+        executor.execute_task("unknown")
+        assert sample("petfeeder_task_duration_seconds_count", task="unknown") == 0
+    finally:
+        executor.cleanup()
+        # 전달한 센서는 TaskExecutor가 정리하지 않음
+        sensor.cleanup()
+
+
+def test_sensor_reads_are_observed(pin_factory, monkeypatch):
+    chip = MockHX711(sample_rate=1e6)
+    sensor = WeightSensor(pd_sck=chip.pd_sck, dout=chip.dout, auto_start=False, calibration_path=None)
+    simulation = SimulatedHardware()
+    distance_sensor = simulation.create_ultrasonic()
+    simulation.visitor_distance = 20.0
+
+    # 초기화 중 읽기나 다른 테스트의 관측값과 섞이지 않도록 새 레지스트리의 히스토그램으로 교체
+    registry = CollectorRegistry()
+    monkeypatch.setattr(weight_sensor, "HX711_READ", Histogram(
+        "petfeeder_hx711_read_seconds", "", registry=registry))
+    monkeypatch.setattr(ultrasonic, "ULTRASONIC_PING", Histogram(
+        "petfeeder_ultrasonic_ping_seconds", "", registry=registry))
+
+    for _ in range(5):
+        sensor.read()
+    sensor.cleanup()
+    assert registry.get_sample_value("petfeeder_hx711_read_seconds_count") == 5
+
+    assert distance_sensor.get_distance() == 20.0
+    distance_sensor.cleanup()
+    assert registry.get_sample_value("petfeeder_ultrasonic_ping_seconds_count") == 1
+
+
+def test_event_loop_lag_records_blocking_calls():
+    async def scenario():
+        monitor = asyncio.create_task(metrics.monitor_event_loop(0.01))
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # 루프를 막는 블로킹 호출
+        await asyncio.sleep(0.03)
+        monitor.cancel()
+
+    before = sample("petfeeder_event_loop_lag_seconds_sum")
+    asyncio.run(scenario())
+    assert sample("petfeeder_event_loop_lag_seconds_sum") - before >= 0.05
+
+
+def test_upload_queue_depth_survives_closed_queue():
+    def closed():
+        raise RuntimeError("Cannot operate on a closed database.")
+
+    metrics.track_upload_queue(lambda: 3)
+    assert sample("petfeeder_upload_queue_depth") == 3
+    metrics.track_upload_queue(closed)
+    assert math.isnan(REGISTRY.get_sample_value("petfeeder_upload_queue_depth"))
+
+
+def test_metrics_endpoint_serves_prometheus_text(simulated_feeder):
+    feeder = simulated_feeder
+    feeder.firebase.save_feeding_result(30)
+    feeder.task_executor.execute_task("weight")
+
+    response = TestClient(feeder.app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'petfeeder_task_duration_seconds_count{task="weight"}' in response.text
+    assert "petfeeder_upload_queue_depth" in response.text
+    assert "petfeeder_event_loop_lag_seconds_bucket" in response.text
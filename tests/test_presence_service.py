@@ -0,0 +1,80 @@
+# tests/test_presence_service.py
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+from services.presence_service import (
+    ARRIVAL, DEPARTURE, PresenceDetector, build_presence_detector
+)
+
+
+def run(detector, segments, period=0.1, start=0.0):
+    """(지속 시간, 거리) 구간을 period 간격 샘플로 펼쳐 감지기에 넣고 이벤트 반환"""
+    events = []
+    t = start
+    for duration, distance in segments:
+        end = t + duration
+        while t < end - 1e-9:
+            events.extend(detector.update(t, distance))
+            t = round(t + period, 6)
+    return events
+
+
+def make_detector(**kwargs):
+    params = dict(enter_distance=15, exit_distance=25, min_dwell=1.0, exit_dwell=3.0, cooldown=30.0)
+    params.update(kwargs)
+    return PresenceDetector(**params)
+
+
+def test_visit_emits_arrival_then_departure():
+    detector = make_detector()
+    events = run(detector, [(5, None), (20, 8.0), (10, 60.0)])
+
+    assert [e.kind for e in events] == [ARRIVAL, DEPARTURE]
+    arrival, departure = events
+    assert arrival.timestamp == pytest.approx(5.0)
+    assert departure.timestamp == pytest.approx(25.0)
+    assert departure.duration == pytest.approx(20.0)
+    assert not detector.present
+
+
+def test_short_pass_below_dwell_is_ignored():
+    detector = make_detector()
+    assert run(detector, [(2, None), (0.5, 10.0), (5, None)]) == []
+
+
+def test_hysteresis_band_does_not_flap():
+    detector = make_detector()
+    # 진입 후 15~25cm 사이에서 흔들려도 떠난 것으로 보지 않음
+    segments = [(2, 10.0)] + [(0.3, 22.0), (0.3, 14.0)] * 20
+    events = run(detector, segments)
+    assert [e.kind for e in events] == [ARRIVAL]
+    assert detector.present
+
+
+def test_brief_dropouts_do_not_end_visit():
+    detector = make_detector()
+    events = run(detector, [(2, 10.0), (1, None), (2, 10.0), (1, None), (2, 10.0)])
+    assert [e.kind for e in events] == [ARRIVAL]
+
+
+def test_cooldown_suppresses_quick_return():
+    detector = make_detector(cooldown=30.0)
+    events = run(detector, [(3, 10.0), (5, None), (3, 10.0), (40, None), (3, 10.0)])
+    kinds = [e.kind for e in events]
+    assert kinds == [ARRIVAL, DEPARTURE, ARRIVAL]
+    # 두 번째 접근(8초)은 쿨다운 중이라 무시되고 세 번째 접근(51초)에서 도착
+    assert events[2].timestamp == pytest.approx(51.0)
+
+
+def test_build_from_settings():
+    detector = build_presence_detector({"threshold_distance": 0.15, "dwell_time": 2.0})
+    assert detector.enter_distance == pytest.approx(15.0)
+    assert detector.exit_distance == pytest.approx(22.5)
+    assert detector.min_dwell == 2.0
+    with pytest.raises(ValueError):
+        PresenceDetector(enter_distance=20, exit_distance=10)
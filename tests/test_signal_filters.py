@@ -0,0 +1,60 @@
+# tests/test_signal_filters.py
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import numpy as np
+
+from utils.signal_filters import (EMAFilter, Kalman1D, MedianFilter, StabilityDetector,
+                                  build_filter_pipeline)
+
+
+def test_median_rejects_spikes():
+    median = MedianFilter(5)
+    outputs = [median.update(v) for v in [10, 10, 500, 10, 10, -300, 10]]
+    assert outputs[2:] == [10, 10, 10, 10, 10]
+
+
+def test_ema_and_kalman_converge_and_reduce_noise():
+    rng = np.random.default_rng(0)
+    samples = 100.0 + rng.normal(0.0, 2.0, 2000)
+
+    ema = EMAFilter(0.1)
+    kalman = Kalman1D(process_noise=0.01, measurement_noise=4.0)
+    ema_out = np.array([ema.update(v) for v in samples])[200:]
+    kalman_out = np.array([kalman.update(v) for v in samples])[200:]
+
+    assert abs(ema_out.mean() - 100.0) < 0.5
+    assert abs(kalman_out.mean() - 100.0) < 0.5
+    assert ema_out.std() < samples.std() / 2
+    assert kalman_out.std() < samples.std() / 2
+
+
+def test_stability_matches_numpy_variance():
+    rng = np.random.default_rng(1)
+    detector = StabilityDetector(window=16, threshold=0.5)
+    values = 5000.0 + rng.normal(0.0, 1.0, 10000)
+    for i, value in enumerate(values):
+        detector.update(value)
+        if i >= 15 and i % 997 == 0:
+            assert abs(detector.variance - values[i - 15:i + 1].var()) < 1e-6
+
+
+def test_pipeline_flags_settled_readings():
+    pipeline = build_filter_pipeline({"stability": {"window": 10, "threshold": 0.5}})
+    rng = np.random.default_rng(2)
+
+    results = [pipeline.update(v) for v in 0.0 + rng.normal(0.0, 0.1, 30)]
+    assert results[-1].stable
+
+    # 사료가 떨어지는 동안은 불안정, 멈추면 다시 안정
+    results = [pipeline.update(v) for v in np.linspace(0.0, 50.0, 20)]
+    assert not results[-1].stable
+    results = [pipeline.update(v) for v in 50.0 + rng.normal(0.0, 0.1, 40)]
+    assert results[-1].stable
+    assert abs(results[-1].value - 50.0) < 1.0
+
+    pipeline.reset()
+    assert not pipeline.update(50.0).stable
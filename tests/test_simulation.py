@@ -0,0 +1,125 @@
+# tests/test_simulation.py
+import os
+import sys
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+from hardware.motor import MotorController
+from hardware.simulation import AugerPlant, SimulatedGPIO, SimulatedHCSR04, SimulatedHardware, SimulationClock
+from hardware.ultrasonic import UltrasonicSensor
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_gpio_reads_back_outputs_and_rejects_unconfigured_pins():
+    gpio = SimulatedGPIO()
+    gpio.setmode(gpio.BCM)
+    gpio.setup(5, gpio.OUT)
+    gpio.setup(6, gpio.IN)
+    gpio.output(5, gpio.HIGH)
+    gpio.set_input(6, 1)
+
+    assert [gpio.input(5) for _ in range(10)] == [1] * 10
+    assert gpio.input(6) == 1
+    with pytest.raises(RuntimeError):
+        gpio.output(6, 1)
+    with pytest.raises(RuntimeError):
+        gpio.input(7)
+
+
+def test_motor_drives_auger_plant_with_fall_delay():
+    clock = ManualClock()
+    gpio = SimulatedGPIO()
+    plant = AugerPlant(gpio, max_flow=20.0, stall_duty=20.0, fall_time=0.3, clock=clock)
+    motor = MotorController(plant.forward_pin, plant.backward_pin, plant.speed_pin, gpio=gpio)
+
+    motor.forward(100)
+    clock.now = 1.0
+    assert plant.weight_at() == pytest.approx(14.0)     # 0.3초 분량은 아직 낙하 중
+    motor.stop()
+    clock.now = 2.0
+    assert plant.weight_at() == pytest.approx(20.0)
+
+    motor.forward(60)                                   # (60-20)/80 * 20 = 10g/s
+    clock.now = 3.3
+    assert plant.weight_at() == pytest.approx(30.0)
+    motor.cleanup()
+
+
+def test_auger_jam_is_cleared_by_reversing():
+    clock = ManualClock()
+    gpio = SimulatedGPIO()
+    plant = AugerPlant(gpio, fall_time=0.0, clock=clock)
+    motor = MotorController(plant.forward_pin, plant.backward_pin, plant.speed_pin, gpio=gpio)
+
+    plant.jam()
+    motor.forward(100)
+    clock.now = 1.0
+    assert plant.weight_at() == 0.0
+    motor.backward(60)
+    motor.forward(100)
+    clock.now = 2.0
+    assert plant.weight_at() == pytest.approx(20.0)
+
+
+def test_hcsr04_model_gives_exact_distances(pin_factory):
+    model = SimulatedHCSR04(pin_factory, trigger_pin=23, echo_pin=24, distance=12.5)
+    sensor = UltrasonicSensor(echo_pin=24, trigger_pin=23, max_distance=1.0)
+    try:
+        assert [sensor.get_distance() for _ in range(5)] == [12.5] * 5
+        model.distance = None
+        assert sensor.get_distance() is None             # 38ms 펄스 = 최대 거리 초과
+        assert model.pings == 6
+    finally:
+        sensor.cleanup()
+
+
+def test_simulation_clock_runs_faster_than_real_time():
+    clock = SimulationClock(time_scale=50)
+    started = clock.monotonic()
+    clock.sleep(0.5)
+    assert clock.monotonic() - started >= 0.5
+    clock.advance(10)
+    assert clock.monotonic() - started >= 10.5
+
+
+def test_pet_feeder_runs_on_simulated_hardware(simulated_feeder):
+    feeder = simulated_feeder
+    simulation = feeder.simulation
+    assert simulation is not None and feeder.camera._is_initialized
+
+    # 방문: 초음파 앞에 10cm 거리 반사체
+    simulation.visitor_distance = 10.0
+    assert feeder.ultrasonic.get_distance() == 10.0
+
+    # 급여: 무게 피드백으로 목표량 배출
+    detector_updates = []
+    update = feeder.task_executor.intake_detector.update
+    feeder.task_executor.intake_detector.update = \
+        lambda *args: detector_updates.append(args) or update(*args)
+    result = feeder.task_executor.execute_task(
+        "feeding", {"amount": 30, "scheduled_time": "08:00", "date": "2026-01-01"})
+    # 급여 중 무게 확인은 섭취 감지기를 진행하지 않음 (사료 추가 이벤트는 무게 작업이 전달)
+    assert detector_updates == []
+    assert result["status"] in ("success", "partial_success")
+    assert result["data"]["dispense"]["status"] == "success"
+    # 첫 급여는 낙하량을 아직 학습하지 않아 목표보다 조금 많이 배출
+    assert 30 <= result["data"]["amount_fed"] < 40
+    assert result["data"]["weight_after"] == pytest.approx(simulation.plant.weight_at(), abs=0.5)
+    feeder.task_executor.execute_task("weight")
+    assert detector_updates[0][1] == pytest.approx(result["data"]["weight_after"], abs=1.0)
+
+    # 카메라: 합성 프레임 재생
+    assert feeder.camera.backend.grab().startswith(b"\xff\xd8")
@@ -0,0 +1,137 @@
+# tests/test_startup.py
+import json
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+from core.startup import LazyComponent, StartupOrchestrator
+from hardware.simulation import MockHX711
+from hardware.weight_sensor import WeightSensor
+
+
+def slow(value, delay=0.2):
+    def factory():
+        time.sleep(delay)
+        return value
+    return factory
+
+
+def test_independent_components_initialize_concurrently():
+    orchestrator = StartupOrchestrator(max_workers=4)
+    started = time.perf_counter()
+    components = orchestrator.initialize({name: slow(name) for name in ("motor", "camera", "ultrasonic", "weight")})
+    elapsed = time.perf_counter() - started
+
+    assert components == {name: name for name in ("motor", "camera", "ultrasonic", "weight")}
+    assert elapsed < 0.6  # 순차 실행이면 0.8초
+    report = orchestrator.report()
+    assert set(report["components"]) == set(components)
+    assert all(value >= 0.19 for value in report["components"].values())
+
+
+def test_failure_is_reported_after_other_components_finish():
+    finished = threading.Event()
+
+    def broken():
+        raise OSError("GPIO busy")
+
+    def other():
+        time.sleep(0.1)
+        finished.set()
+        return "ok"
+
+    orchestrator = StartupOrchestrator()
+    with pytest.raises(RuntimeError, match="camera"):
+        orchestrator.initialize({"camera": broken, "motor": other})
+    assert finished.is_set()
+    assert set(orchestrator.timings) == {"camera", "motor"}
+
+
+def test_lazy_component_is_built_on_first_use_only():
+    calls = []
+    orchestrator = StartupOrchestrator()
+    lazy = orchestrator.lazy("eye_detector", lambda: calls.append(1) or "model")
+
+    assert not lazy.ready and lazy.if_ready() is None and calls == []
+    assert lazy.get() == "model" and lazy.get() == "model"
+    assert calls == [1] and "eye_detector" in orchestrator.timings
+
+
+def test_background_warmup_is_awaited_by_get():
+    lazy = LazyComponent("model", slow("model", delay=0.1))
+    lazy.start_warmup()
+    assert not lazy.ready
+    with pytest.raises(TimeoutError):
+        lazy.get(timeout=0.01)
+    assert lazy.get(timeout=2) == "model" and lazy.ready
+
+
+def test_lazy_component_reraises_factory_error():
+    def broken():
+        raise ImportError("tflite_runtime")
+
+    lazy = LazyComponent("model", broken)
+    with pytest.raises(ImportError):
+        lazy.get()
+    assert not lazy.ready and lazy.if_ready() is None
+
+
+def test_failed_warmup_is_retried_by_next_get():
+    attempts = []
+    release = threading.Event()
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            release.wait(2)
+            raise FileNotFoundError("model still syncing")
+        return "model"
+
+    lazy = LazyComponent("model", flaky)
+    lazy.start_warmup()
+    threading.Timer(0.05, release.set).start()
+    # 예열을 기다리던 호출은 실패를 받고, 다음 호출은 다시 생성
+    with pytest.raises(FileNotFoundError):
+        lazy.get(timeout=2)
+    assert lazy.get() == "model" and lazy.ready
+    assert lazy.get() == "model" and len(attempts) == 2
+
+
+def test_failed_startup_cleans_up_created_devices():
+    class Device:
+        def __init__(self):
+            self.closed = False
+
+        def cleanup(self):
+            self.closed = True
+
+    def broken():
+        raise OSError("camera not detected")
+
+    motor, sensor = Device(), Device()
+    orchestrator = StartupOrchestrator()
+    with pytest.raises(RuntimeError, match="camera"):
+        orchestrator.initialize({"camera": broken, "motor": lambda: motor, "weight_sensor": lambda: sensor})
+    assert motor.closed and sensor.closed
+
+
+def test_weight_sensor_loads_saved_calibration_instead_of_taring(tmp_path):
+    chip = MockHX711(offset=5000, sample_rate=1000)
+    path = tmp_path / "weight_calibration.json"
+    path.write_text(json.dumps({"reference_unit": 42.0, "offset": 1234}))
+
+    sensor = WeightSensor(pd_sck=chip.pd_sck, dout=chip.dout, auto_start=False, calibration_path=str(path))
+    try:
+        assert sensor.REFERENCE_UNIT == 42.0
+        assert sensor.OFFSET == 1234  # 영점 조정을 했다면 약 5000
+    finally:
+        sensor.cleanup()
@@ -0,0 +1,93 @@
+# tests/test_task_scheduler.py
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from core.task_scheduler import RTOSScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def drain(scheduler, now):
+    """now 시점에 실행 가능한 작업을 모두 꺼내 즉시 완료 처리"""
+    ran = []
+    while True:
+        task_id = scheduler.get_next_task(now)
+        if task_id is None:
+            return ran
+        ran.append(task_id)
+        scheduler.complete_task(task_id, now)
+
+
+def test_priority_order_and_disabled_camera():
+    scheduler = RTOSScheduler(clock=FakeClock())
+    assert drain(scheduler, 0.0) == ['ultrasonic', 'weight', 'schedule', 'error']
+    assert drain(scheduler, 0.05) == []
+    assert scheduler.time_until_next(0.05) == 0.1 - 0.05
+
+
+def test_intervals_are_honored():
+    scheduler = RTOSScheduler(clock=FakeClock())
+    runs = {}
+    now = 0.0
+    while now < 10.0 - 1e-9:
+        for task_id in drain(scheduler, now):
+            runs[task_id] = runs.get(task_id, 0) + 1
+        now = round(now + 0.01, 2)
+
+    assert runs['ultrasonic'] == 100
+    assert runs['schedule'] == 10
+    assert runs['error'] == 2
+    assert 'camera' not in runs
+
+
+def test_camera_runs_only_while_enabled():
+    scheduler = RTOSScheduler(clock=FakeClock())
+    drain(scheduler, 0.0)
+
+    scheduler.enable_task('camera', 0.2)
+    assert 'camera' in drain(scheduler, 0.2)
+    assert 'camera' in drain(scheduler, 0.7)
+
+    scheduler.disable_task('camera')
+    assert 'camera' not in drain(scheduler, 1.2)
+
+
+def test_missed_deadlines_and_jitter():
+    scheduler = RTOSScheduler(clock=FakeClock())
+    assert scheduler.get_next_task(0.0) == 'ultrasonic'
+    # 0.35초 동안 실행 -> 0.1, 0.2 주기를 놓치고 0.3 주기로 바로 재실행
+    scheduler.complete_task('ultrasonic', 0.35)
+
+    assert drain(scheduler, 0.35).count('ultrasonic') == 1
+    stats = scheduler.get_stats()['ultrasonic']
+    assert stats['missed'] == 2
+    assert round(stats['jitter_max_ms']) == 50
+
+
+def test_late_dispatch_counts_missed_periods():
+    scheduler = RTOSScheduler(clock=FakeClock())
+    drain(scheduler, 0.0)
+    # 0.1 주기 작업을 0.35에 꺼냄 -> 0.1, 0.2 주기를 놓치고 0.3 주기로 실행
+    assert scheduler.get_next_task(0.35) == 'ultrasonic'
+    scheduler.complete_task('ultrasonic', 0.36)
+    stats = scheduler.get_stats()['ultrasonic']
+    assert stats['missed'] == 2
+    assert scheduler.get_next_task(0.36) != 'ultrasonic'
+    assert scheduler.get_next_task(0.4) in ('ultrasonic', 'weight')
+
+
+def test_restart_rebases_deadlines():
+    scheduler = RTOSScheduler(clock=FakeClock())
+    scheduler.restart(5.0)
+    assert drain(scheduler, 5.0) == ['ultrasonic', 'weight', 'schedule', 'error']
+    assert scheduler.get_stats()['ultrasonic']['missed'] == 0
+    assert scheduler.get_stats()['ultrasonic']['jitter_max_ms'] == 0
@@ -0,0 +1,170 @@
+# tests/test_telemetry.py
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import httpx
+import websockets
+from fastapi.testclient import TestClient
+
+from core.telemetry import Subscription, TelemetryHub, parse_subscription, parse_topics
+
+
+def drain(subscription):
+    messages = []
+    while len(subscription):
+        messages.append(json.loads(subscription.get_nowait()))
+    return messages
+
+
+def test_sensor_topics_keep_only_latest_value():
+    subscription = Subscription(maxsize=8)
+    for weight in range(100):
+        subscription.offer("weight", json.dumps({"data": weight}))
+    subscription.offer("feeding", json.dumps({"data": "done"}))
+    subscription.offer("weight", json.dumps({"data": 100}))
+
+    # 읽지 않은 무게는 자리를 유지한 채 최신 값으로 교체
+    assert [m["data"] for m in drain(subscription)] == [100, "done"]
+    assert subscription.coalesced == 100 and subscription.dropped == 0
+
+
+def test_event_topics_drop_oldest_when_full():
+    subscription = Subscription(maxsize=4)
+    for i in range(1000):
+        subscription.offer("presence", json.dumps({"data": i}))
+    assert len(subscription) == 4
+    assert subscription.dropped == 996
+    assert [m["data"] for m in drain(subscription)] == [996, 997, 998, 999]
+
+
+def test_hub_filters_topics_and_serializes_once():
+    async def scenario():
+        hub = TelemetryHub(queue_size=16)
+        weight_only = hub.subscribe(["weight"])
+        everything = hub.subscribe()
+        hub.publish("weight", {"weight": 12.5}, timestamp=1.0)
+        hub.publish("feeding", {"status": "success"}, timestamp=2.0)
+
+        assert [m["topic"] for m in drain(weight_only)] == ["weight"]
+        received = [await everything.get(), await everything.get()]
+        # 같은 메시지는 모든 구독자에게 같은 문자열로 전달
+        assert json.loads(received[0]) == {"topic": "weight", "time": 1.0, "data": {"weight": 12.5}}
+
+        weight_only.set_topics(["feeding"])
+        hub.publish("weight", {"weight": 13.0})
+        assert len(weight_only) == 0
+        hub.unsubscribe(everything)
+        assert hub.subscriber_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_set_topics_keeps_control_messages():
+    subscription = Subscription(["weight"])
+    subscription.offer("control", json.dumps({"data": {"error": "bad"}}))
+    subscription.offer("weight", json.dumps({"data": 1}))
+    subscription.set_topics(["feeding"])
+    assert [m["data"] for m in drain(subscription)] == [{"error": "bad"}]
+
+
+def test_publish_from_worker_thread_is_handed_to_loop():
+    async def scenario():
+        hub = TelemetryHub()
+        subscription = hub.subscribe()
+        worker = threading.Thread(target=hub.publish, args=("distance", {"distance": 10.0}))
+        worker.start()
+        worker.join()
+        message = await asyncio.wait_for(subscription.get(), 1.0)
+        assert json.loads(message)["data"] == {"distance": 10.0}
+
+    asyncio.run(scenario())
+
+
+def test_parse_subscription():
+    assert parse_subscription('{"subscribe": ["weight", "feeding"]}') == (None, ["weight", "feeding"])
+    assert parse_subscription('{"subscribe": "*"}') == (None, None)
+    assert parse_subscription('{"subscribe": ["battery"]}')[0] is not None
+    assert parse_subscription("hello")[0] is not None
+    # 알 수 없는 주제가 섞이면 오류와 함께 알 수 있는 주제만 남김 (None = 전체가 아님)
+    error, topics = parse_topics(["weight", "typo"])
+    assert "typo" in error and topics == ["weight"]
+    assert parse_topics(["typo"])[1] == []
+    assert parse_topics("weight")[1] == []
+
+
+def test_websocket_streams_subscribed_topics(simulated_feeder):
+    feeder = simulated_feeder
+    with TestClient(feeder.app) as client:
+        with client.websocket_connect("/ws?topics=weight") as websocket:
+            feeder.telemetry.publish("feeding", {"status": "success"})
+            feeder.telemetry.publish("weight", {"weight": 21.0})
+            message = websocket.receive_json()
+            assert message["topic"] == "weight" and message["data"] == {"weight": 21.0}
+
+            websocket.send_text(json.dumps({"subscribe": ["feeding"]}))
+            assert websocket.receive_json()["data"] == {"subscribed": ["feeding"]}
+            feeder.telemetry.publish("feeding", {"status": "success"})
+            assert websocket.receive_json()["data"] == {"status": "success"}
+
+            websocket.send_text("hello")
+            assert "error" in websocket.receive_json()["data"]
+
+        assert client.get("/health").json()["telemetry"]["subscribers"] == 0
+
+
+def test_websocket_with_unknown_topic_subscribes_to_valid_subset(simulated_feeder):
+    feeder = simulated_feeder
+    with TestClient(feeder.app) as client:
+        with client.websocket_connect("/ws?topics=weight,typo") as websocket:
+            assert "typo" in websocket.receive_json()["data"]["error"]
+            feeder.telemetry.publish("feeding", {"status": "success"})
+            feeder.telemetry.publish("weight", {"weight": 21.0})
+            assert websocket.receive_json()["topic"] == "weight"
+
+        with client.websocket_connect("/ws?topics=typo") as websocket:
+            assert "error" in websocket.receive_json()["data"]
+            published = feeder.telemetry.published
+            feeder.telemetry.publish("weight", {"weight": 22.0})
+            # 받을 구독자가 없으므로 직렬화/전달하지 않음
+            assert client.get("/health").json()["telemetry"]["published"] == published
+
+
+def test_run_serves_api_and_websocket(simulated_feeder):
+    feeder = simulated_feeder
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    feeder.config["api"].update(host="127.0.0.1", port=port)
+
+    async def scenario():
+        run = asyncio.create_task(feeder.run())
+        while feeder.api_server is None or not feeder.api_server.started:
+            await asyncio.sleep(0.01)
+
+        async with httpx.AsyncClient() as client:
+            health = await client.get(f"http://127.0.0.1:{port}/health")
+        assert health.status_code == 200
+
+        async with websockets.connect(f"ws://127.0.0.1:{port}/ws?topics=weight") as websocket:
+            while feeder.telemetry.subscriber_count == 0:
+                await asyncio.sleep(0.01)
+            feeder.telemetry.publish("weight", {"weight": 21.0})
+            message = json.loads(await asyncio.wait_for(websocket.recv(), 2.0))
+            assert message["topic"] == "weight"
+
+        # 종료하면 메인 루프와 함께 서버도 멈춤
+        feeder.running = False
+        await asyncio.wait_for(run, 10.0)
+        assert feeder.api_task.done()
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+# tests/test_timeseries.py
+import os
+import sys
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import numpy as np
+
+from utils.timeseries import FLAG_STABLE, TimeSeriesStore
+
+DAY = 86400.0
+START = 1_700_000_000.0  # 세그먼트 경계(3600의 배수)에서 시작하지 않도록 임의 시각 사용
+
+
+def fill(store, seconds, rate=10, series="weight"):
+    timestamps = START + np.arange(int(seconds * rate)) / rate
+    values = 100.0 + np.sin(timestamps / 60.0)
+    for timestamp, value in zip(timestamps, values):
+        store.append(series, float(timestamp), float(value), FLAG_STABLE)
+    return timestamps, values
+
+
+def test_range_query_within_segment_is_zero_copy(tmp_path):
+    store = TimeSeriesStore(str(tmp_path), clock=lambda: START)
+    timestamps, values = fill(store, 120)
+
+    records = store.query("weight", START + 10, START + 20)
+    assert len(records) == 100
+    assert not records.flags.owndata  # 세그먼트 파일 매핑을 그대로 가리킴
+    assert np.allclose(records["value"], values[100:200], atol=1e-4)
+    assert np.all(records["flags"] == FLAG_STABLE)
+    store.close()
+
+
+def test_rollups_and_reopen(tmp_path):
+    store = TimeSeriesStore(str(tmp_path), clock=lambda: START)
+    timestamps, values = fill(store, 3 * 3600 + 5)  # 원시 세그먼트 여러 개에 걸침
+
+    seconds = store.query("weight", START, START + 60, level="1s")
+    assert len(seconds) == 60
+    assert np.all(seconds["count"] == 10)
+    assert np.allclose(seconds["mean"], values[:600].reshape(60, 10).mean(axis=1), atol=1e-4)
+
+    # 첫 1분 구간은 START 이전에 시작하므로 범위를 넉넉히 잡음
+    minutes = store.query("weight", START - 60, START + 3 * 3600, level="1m")
+    assert len(minutes) == 180
+    assert minutes["count"].sum() == len(timestamps[timestamps < minutes["timestamp"][-1] + 60])
+    assert minutes["max"].max() <= values.max() + 1e-4
+
+    hours = store.query("weight", START, START + 4 * 3600, level="1h")
+    assert len(hours) >= 2
+
+    everything = store.query("weight", START, START + DAY)
+    assert len(everything) == len(timestamps)
+    store.close()
+
+    # 다시 열어도 이어서 기록하고, 이전보다 오래된 샘플은 버림
+    store = TimeSeriesStore(str(tmp_path), clock=lambda: START)
+    store.append("weight", float(timestamps[0]), 1.0)
+    assert store.dropped == 1
+    store.append("weight", float(timestamps[-1] + 1), 5.0)
+    assert store.latest("weight") == (float(timestamps[-1] + 1), 5.0, 0)
+    store.close()
+
+
+def test_retention_removes_old_segments(tmp_path):
+    now = [START]
+    store = TimeSeriesStore(str(tmp_path), retention={"raw": 2 * DAY}, clock=lambda: now[0])
+    fill(store, 60)
+    assert len(store.query("weight", START, START + 60)) == 600
+
+    now[0] = START + 10 * DAY
+    store.append("weight", now[0], 1.0)  # 새 원시 세그먼트가 열리면서 보관 기간 적용
+    assert len(store.query("weight", START, START + 60)) == 0
+    assert len(store.query("weight", START, START + 60, level="1s")) == 60
+    store.close()
+
+
+def test_close_writes_in_progress_rollups(tmp_path):
+    store = TimeSeriesStore(str(tmp_path), clock=lambda: START)
+    timestamps, values = fill(store, 30)  # 1분/1시간 구간은 아직 진행 중
+    store.close()
+
+    store = TimeSeriesStore(str(tmp_path), clock=lambda: START)
+    minutes = store.query("weight", START - 60, START + 60, level="1m")
+    hours = store.query("weight", START - 3600, START + 3600, level="1h")
+    assert minutes["count"].sum() == hours["count"].sum() == len(timestamps)
+    assert np.isclose(hours["mean"][-1], values.mean(), atol=1e-4)
+    store.close()
@@ -0,0 +1,84 @@
+# tests/test_ultrasonic.py
+import os
+import sys
+import time
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+from hardware.simulation import SimulatedHCSR04
+from hardware.ultrasonic import UltrasonicSensor
+
+
+@pytest.fixture
+def ranger():
+    """Trigger 펄스가 끝나면 거리에 맞는 Echo 에지 tick을 만드는 모의 HC-SR04 (40cm 앞 반사체)
+
+    gpiozero의 MockTriggerPin은 sleep으로 펄스 길이를 만들어 스레드 스케줄링 지연만큼
+    거리가 늘어나므로, 에지 시각을 직접 기록하는 SimulatedHCSR04를 사용합니다.
+    """
+    Device.pin_factory = MockFactory()
+    model = SimulatedHCSR04(Device.pin_factory, trigger_pin=23, echo_pin=24, distance=40)
+    sensor = UltrasonicSensor(echo_pin=24, trigger_pin=23, max_distance=1.0, threshold_distance=0.15)
+    yield sensor, model
+    sensor.cleanup()
+    Device.pin_factory.reset()
+
+
+def test_distance_from_edge_ticks(ranger):
+    sensor, model = ranger
+    assert sensor.get_distance() == pytest.approx(40)
+
+
+def test_multi_ping_median(ranger):
+    sensor, model = ranger
+    model.distance = 25
+    assert sensor.measure(pings=5, interval=0.005) == pytest.approx(25)
+
+
+def test_out_of_range_returns_none(ranger):
+    sensor, model = ranger
+    model.distance = 150
+    assert sensor.get_distance() is None
+
+
+def test_no_echo_times_out():
+    Device.pin_factory = MockFactory()
+    try:
+        sensor = UltrasonicSensor(echo_pin=24, trigger_pin=23, max_distance=1.0)
+        started = time.monotonic()
+        assert sensor.get_distance() is None
+        assert time.monotonic() - started < sensor.echo_timeout + 0.1
+        sensor.cleanup()
+    finally:
+        Device.pin_factory.reset()
+
+
+def test_continuous_mode_makes_check_obstacle_non_blocking(ranger):
+    sensor, model = ranger
+    sensor.start_continuous(rate=50)
+    deadline = time.monotonic() + 2
+    while sensor.readings.total < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sensor.latest_distance() > sensor.threshold_cm
+    assert not sensor.check_obstacle()
+
+    model.distance = 10
+    start_total = sensor.readings.total
+    while sensor.readings.total < start_total + 3 and time.monotonic() < deadline + 2:
+        time.sleep(0.01)
+
+    started = time.perf_counter()
+    assert sensor.check_obstacle()
+    # 연속 측정 중에는 핑을 보내지 않고 링 버퍼의 최신 값만 확인
+    assert time.perf_counter() - started < 0.005
+
+    sensor.stop_continuous()
+    assert not sensor.is_continuous
@@ -0,0 +1,259 @@
+# tests/test_upload_queue.py
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+from core.upload_queue import AuthenticationError, RestRTDBSink, UploadQueue
+
+
+class FakeRTDB:
+    """PATCH /.json 다중 경로 업데이트를 처리하는 로컬 Realtime Database 흉내"""
+
+    def __init__(self):
+        self.data = {}
+        self.requests = []
+        self.fail_with = None      # 설정하면 해당 HTTP 상태 코드로 응답
+        self.reject_paths = set()  # 이 경로가 포함된 요청은 400으로 거부
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_PATCH(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                fake.requests.append(body)
+                status = fake.fail_with
+                if status is None and fake.reject_paths & set(body):
+                    status = 400
+                if status is None:
+                    for path, value in body.items():
+                        fake.set(path, value)
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def set(self, path, value):
+        node = self.data
+        *parents, leaf = path.split("/")
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+
+    def get(self, path):
+        node = self.data
+        for key in path.split("/"):
+            node = node[key]
+        return node
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def rtdb():
+    fake = FakeRTDB()
+    yield fake
+    fake.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_batches_are_sent_as_one_multi_path_update(tmp_path, rtdb):
+    queue = UploadQueue(str(tmp_path / "queue.db"), sink=RestRTDBSink(rtdb.url), batch_size=10)
+    for i in range(25):
+        queue.enqueue(f"devices/SN1/health/feeding/{i:03d}", {"amount": i})
+
+    assert queue.flush(timeout=5)
+    assert [len(body) for body in rtdb.requests] == [10, 10, 5]
+    assert rtdb.get("devices/SN1/health/feeding/024") == {"amount": 24}
+    assert queue.pending() == 0
+    queue.close()
+
+
+def test_outbox_survives_restart_while_offline(tmp_path, rtdb):
+    path = str(tmp_path / "queue.db")
+    clock = FakeClock()
+    rtdb.fail_with = 503
+    queue = UploadQueue(path, sink=RestRTDBSink(rtdb.url), jitter=False, clock=clock)
+    queue.enqueue("a/1", {"v": 1})
+    queue.enqueue("a/2", {"v": 2})
+    assert queue.flush_once() == 0
+    queue.close()
+
+    rtdb.fail_with = None
+    restarted = UploadQueue(path, sink=RestRTDBSink(rtdb.url), clock=clock)
+    assert restarted.pending() == 2
+    assert restarted.flush_once() == 2
+    assert rtdb.data == {"a": {"1": {"v": 1}, "2": {"v": 2}}}
+    restarted.close()
+
+
+def test_exponential_backoff_between_failures(tmp_path, rtdb):
+    clock = FakeClock()
+    rtdb.fail_with = 500
+    queue = UploadQueue(str(tmp_path / "queue.db"), sink=RestRTDBSink(rtdb.url),
+                        base_delay=1.0, max_delay=8.0, jitter=False, clock=clock)
+    queue.enqueue("a/1", 1)
+
+    delays = []
+    for _ in range(5):
+        assert queue.flush_once() == 0
+        delays.append(queue.next_attempt - clock.now)
+        # 백오프 중에는 요청을 보내지 않음
+        requests_before = len(rtdb.requests)
+        assert queue.flush_once() == 0
+        assert len(rtdb.requests) == requests_before
+        clock.now = queue.next_attempt
+
+    assert delays == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+    rtdb.fail_with = None
+    assert queue.flush_once() == 1
+    assert queue.failures == 0
+    queue.close()
+
+
+def test_rejected_item_does_not_block_the_batch(tmp_path, rtdb):
+    rtdb.reject_paths = {"a/bad"}
+    queue = UploadQueue(str(tmp_path / "queue.db"), sink=RestRTDBSink(rtdb.url))
+    queue.enqueue("a/1", 1)
+    queue.enqueue("a/bad", 2)
+    queue.enqueue("a/3", 3)
+
+    assert queue.flush_once() == 2
+    assert rtdb.data == {"a": {"1": 1, "3": 3}}
+    assert queue.pending() == 0
+    assert [item["path"] for item in queue.dead_letters()] == ["a/bad"]
+    queue.close()
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_auth_failure_is_dead_lettered_not_retried(tmp_path, rtdb, status):
+    rtdb.fail_with = status
+    sink = RestRTDBSink(rtdb.url, auth_token="expired")
+    with pytest.raises(AuthenticationError):
+        sink.update({"a/0": 0})
+
+    queue = UploadQueue(str(tmp_path / "queue.db"), sink=sink)
+    for i in range(3):
+        queue.enqueue(f"a/{i}", i)
+    requests_before = len(rtdb.requests)
+
+    assert queue.flush_once() == 0
+    # 한 건씩 다시 보내거나 백오프로 재시도하지 않고 묶음 전체를 보관
+    assert len(rtdb.requests) == requests_before + 1
+    assert queue.failures == 0 and queue.pending() == 0
+    assert [item["error"].startswith(f"HTTP {status}") for item in queue.dead_letters()] == [True] * 3
+    queue.close()
+
+
+def test_worker_continues_after_fully_rejected_batch(tmp_path, rtdb):
+    rtdb.reject_paths = {"a/bad1", "a/bad2"}
+    queue = UploadQueue(str(tmp_path / "queue.db"), sink=RestRTDBSink(rtdb.url), batch_size=2)
+    queue.enqueue("a/bad1", 1)
+    queue.enqueue("a/bad2", 2)
+    queue.enqueue("a/3", 3)
+    started = time.monotonic()
+    queue.start()
+
+    # 첫 묶음이 모두 거부되어도 유휴 대기(5초) 없이 다음 묶음 전송
+    while queue.pending() and time.monotonic() - started < 5:
+        time.sleep(0.01)
+    assert rtdb.data == {"a": {"3": 3}}
+    assert time.monotonic() - started < 2
+    assert len(queue.dead_letters()) == 2
+    queue.close()
+
+
+def test_worker_uploads_in_background(tmp_path, rtdb):
+    queue = UploadQueue(str(tmp_path / "queue.db"), sink=RestRTDBSink(rtdb.url))
+    queue.start()
+    started = time.perf_counter()
+    queue.enqueue("a/1", {"v": 1})
+    # enqueue는 네트워크를 기다리지 않음
+    assert time.perf_counter() - started < 0.05
+
+    deadline = time.monotonic() + 5
+    while queue.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert rtdb.get("a/1") == {"v": 1}
+    queue.stop()
+    assert not queue.is_running
+    queue.close()
+
+
+def test_firebase_manager_payloads(tmp_path, monkeypatch, rtdb):
+    monkeypatch.chdir(tmp_path)
+    from core.firebase_manager import FirebaseManager
+    from core.schemas import IntakeData
+
+    manager = FirebaseManager(serial_number="SN9", queue_path="queue.db",
+                              sink=RestRTDBSink(rtdb.url), auto_start=False)
+    # 로그는 루트 로거의 큐 핸들러로만 기록 (별도 파일 핸들러 없음)
+    assert logging.getLogger("core.firebase_manager").handlers == []
+    assert not os.path.exists("logs")
+    detection = {
+        "timestamp": "20240101_080000",
+        "image_path": "data/images/a.jpg",
+        "left_eye": {"position": {"x": 10}, "diseases": {"blepharitis": 0.1, "ulcer": 0.7}},
+        "right_eye": {"position": {"x": 90}, "diseases": {"conjunctivitis": 0.2}},
+    }
+    assert manager.save_detection_result(detection)
+    assert manager.save_feeding_result(30.0)
+    assert manager.save_intake_result(IntakeData(duration=120.0, amount=12.5))
+    assert manager.pending_uploads() == 3
+    assert manager.queue.flush(timeout=5)
+
+    health = rtdb.get("devices/SN9/health")
+    eye = next(iter(health["eye"].values()))
+    assert eye["type"] == "eye" and eye["serial_number"] == "SN9"
+    assert eye["data"]["eyes"][0]["eye_side"] == "left"
+    assert eye["data"]["eyes"][0]["corneal_ulcer_prob"] == pytest.approx(0.7)
+    assert next(iter(health["feeding"].values()))["data"] == {"amount": 30.0}
+    assert next(iter(health["intake"].values()))["data"] == {"duration": 120.0, "amount": 12.5}
+    manager.close()
+
+
+def test_published_detection_omits_deleted_original(tmp_path, monkeypatch, rtdb):
+    monkeypatch.chdir(tmp_path)
+    from core.firebase_manager import FirebaseManager
+
+    manager = FirebaseManager(serial_number="SN9", queue_path="queue.db",
+                              sink=RestRTDBSink(rtdb.url), auto_start=False)
+    # ImagePublisher가 원본을 지운 뒤에는 image_path 없이 게시 위치만 전달
+    detection = {
+        "timestamp": "20240101_080000",
+        "left_eye": {"position": {"x": 10}, "diseases": {"ulcer": 0.7}},
+        "images": {"thumbnail": "local://images/ab/ab.jpg"},
+    }
+    assert manager.save_detection_result(detection)
+    assert manager.queue.flush(timeout=5)
+
+    eye = next(iter(rtdb.get("devices/SN9/health")["eye"].values()))
+    assert "image_path" not in eye["data"]
+    assert eye["data"]["images"] == {"thumbnail": "local://images/ab/ab.jpg"}
+    manager.close()
@@ -0,0 +1,100 @@
+# tests/test_weight_sampler.py
+import os
+import sys
+import time
+
+os.environ.setdefault('MOCK_GPIO', 'true')
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'mock')
+
+# app 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import numpy as np
+
+from hardware.weight_sensor import WeightSensor
+from hardware.simulation import MockHX711
+from utils.ring_buffer import RingBuffer
+
+
+def make_sensor(chip, **kwargs):
+    sensor = WeightSensor(pd_sck=chip.pd_sck, dout=chip.dout, **kwargs)
+    sensor.REFERENCE_UNIT = chip.reference_unit
+    return sensor
+
+
+def test_ring_buffer_wraps_in_order():
+    buffer = RingBuffer(4)
+    assert buffer.latest() is None
+    for i in range(6):
+        buffer.append(float(i), i * 10)
+
+    assert len(buffer) == 4 and buffer.total == 6
+    assert buffer.latest() == (5.0, 50.0)
+    timestamps, values = buffer.last(3)
+    assert timestamps.tolist() == [3.0, 4.0, 5.0]
+    assert values.tolist() == [30.0, 40.0, 50.0]
+    assert buffer.since(4)[1].tolist() == [40.0, 50.0]
+
+
+def test_bit_banged_read_decodes_negative_values():
+    chip = MockHX711(offset=-1234, sample_rate=1000)
+    sensor = make_sensor(chip, auto_start=False)
+    assert sensor.read() == -1234
+    sensor.cleanup()
+
+
+def test_background_sampling_serves_latest_weight():
+    chip = MockHX711(sample_rate=500, noise=2.0)
+    sensor = make_sensor(chip)
+    try:
+        assert sensor.is_sampling
+        assert abs(sensor.OFFSET - chip.offset) < 5
+
+        chip.set_weight(250.0)
+        sensor.read_average(5)  # 새 무게가 반영된 샘플까지 대기
+        assert sensor.wait_until_stable(timeout=2.0) is not None
+
+        began = time.perf_counter()
+        weight = sensor.get_weight()
+        assert time.perf_counter() - began < 0.005
+        assert abs(weight - 250.0) < 0.5
+
+        timestamps, values = sensor.samples.last(5)
+        assert len(values) == 5
+        assert np.all(np.diff(timestamps) > 0)
+    finally:
+        sensor.cleanup()
+    assert not sensor.is_sampling
+
+
+def test_get_weight_falls_back_when_not_sampling():
+    chip = MockHX711(sample_rate=1000)
+    sensor = make_sensor(chip, auto_start=False)
+    chip.set_weight(40.0)
+    assert abs(sensor.get_weight() - 40.0) < 0.1
+    sensor.cleanup()
+
+
+def test_sampler_survives_filter_errors_and_concurrent_tare():
+    chip = MockHX711(sample_rate=500, noise=2.0)
+    sensor = make_sensor(chip, calibration_path=None)
+    try:
+        original_update = sensor.filters.update
+        failures = []
+
+        def flaky_update(value):
+            if len(failures) < 3:
+                failures.append(value)
+                raise ValueError("filter error")
+            return original_update(value)
+
+        sensor.filters.update = flaky_update
+        for _ in range(20):
+            sensor._reset_filters()  # tare/calibrate가 다른 스레드에서 필터를 초기화
+        sensor.read_average(10)
+
+        assert len(failures) == 3
+        assert sensor.is_sampling
+        assert sensor.get_reading() is not None
+    finally:
+        sensor.cleanup()
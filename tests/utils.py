@@ -1,65 +1,17 @@
-import sys
+import importlib.util
 import os
-from unittest.mock import MagicMock
 
-# GPIO Mock 설정
-class GPIOMock:
-    BCM = "BCM"
-    OUT = "OUT"
-    IN = "IN"
-    HIGH = 1
-    LOW = 0
-    
-    def __init__(self):
-        self.mode = None
-        self.warnings = True
-        self.pins = {}
-    
-    def setmode(self, mode):
-        self.mode = mode
-    
-    def setwarnings(self, state):
-        self.warnings = state
-    
-    def setup(self, pin, mode):
-        self.pins[pin] = {"mode": mode, "value": 0}
-    
-    def output(self, pin, value):
-        if pin in self.pins:
-            self.pins[pin]["value"] = value
-    
-    def input(self, pin):
-        if pin in self.pins:
-            # 테스트를 위해 무작위 값 반환
-            import random
-            return random.randint(0, 1)
-        return 0
-    
-    def cleanup(self):
-        self.pins.clear()
-    
-    def PWM(self, pin, freq):
-        return PWMMock(pin, freq)
-
-class PWMMock:
-    def __init__(self, pin, freq):
-        self.pin = pin
-        self.freq = freq
-        self.duty_cycle = 0
-        self.running = False
-    
-    def start(self, dc):
-        self.duty_cycle = dc
-        self.running = True
-    
-    def ChangeDutyCycle(self, dc):
-        self.duty_cycle = dc
-    
-    def stop(self):
-        self.running = False
+# GPIO Mock 설정 (앱과 같은 결정적 시뮬레이션 GPIO 사용)
+# 이 모듈 이름(utils)이 app/utils 패키지와 겹치므로 hardware 패키지를 거치지 않고 파일에서 직접 로드
+_GPIO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "app", "hardware", "simulation", "gpio.py")
+_spec = importlib.util.spec_from_file_location("simulated_gpio", _GPIO_PATH)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+SimulatedGPIO = _module.SimulatedGPIO
 
 # GPIO Mock 객체 생성
-GPIO = GPIOMock()
+GPIO = SimulatedGPIO()
 
 def setup_gpio():
     """Mock GPIO 설정"""
@@ -72,4 +24,4 @@ def print_test_result(test_name, success, message=""):
     print(f"결과: {'성공' if success else '실패'}")
     if message:
         print(f"메시지: {message}")
-    print('='*50) 
\ No newline at end of file
+    print('='*50)